@@ -0,0 +1,84 @@
+"""Bounded concurrent fan-out of per-item Tracker calls for multi-ID tools."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class ItemError(BaseModel):
+    """Failure of a single item of a multi-ID tool call."""
+
+    error: str
+
+
+class BatchItemResult(BaseModel, Generic[V]):
+    """Outcome of a single item of a batch write tool call.
+
+    ``result`` is empty on failure and in dry-run mode, where ``success`` only
+    means that the item passed validation.
+    """
+
+    issue_id: str
+    success: bool
+    result: V | None = None
+    error: str | None = None
+
+    @classmethod
+    def from_outcome(
+        cls, issue_id: str, outcome: V | ItemError | None
+    ) -> "BatchItemResult[V]":
+        if isinstance(outcome, ItemError):
+            return cls(issue_id=issue_id, success=False, error=outcome.error)
+        return cls(issue_id=issue_id, success=True, result=outcome)
+
+
+async def fan_out(
+    keys: Iterable[K],
+    call: Callable[[K], Awaitable[V]],
+    *,
+    concurrency: int,
+    timeout: float | None = None,
+) -> dict[K, V | ItemError]:
+    """Run ``call`` for every key with at most ``concurrency`` calls in flight.
+
+    A failing call does not affect the others: its exception is reported as an
+    ``ItemError`` for that key. Calls still running ``timeout`` seconds after
+    the fan-out started are cancelled and reported as timed out. Results keep
+    the order of ``keys``; duplicate keys are only called once.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(key: K) -> V:
+        async with semaphore:
+            return await call(key)
+
+    tasks = {key: asyncio.create_task(run(key)) for key in dict.fromkeys(keys)}
+    if not tasks:
+        return {}
+
+    try:
+        await asyncio.wait(tasks.values(), timeout=timeout)
+    finally:
+        pending = [task for task in tasks.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    results: dict[K, V | ItemError] = {}
+    for key, task in tasks.items():
+        if task.cancelled():
+            message = "Cancelled"
+            if timeout is not None:
+                message = f"Timed out after {timeout:g} seconds"
+            results[key] = ItemError(error=message)
+        elif (exc := task.exception()) is not None:
+            results[key] = ItemError(error=str(exc) or type(exc).__name__)
+        else:
+            results[key] = task.result()
+    return results
@@ -114,4 +114,6 @@ Tasks may be called "Задачи", "Issues", "Таски", "ишью".
 When using tools that accept `page` and/or `per_page` parameters and when the task is to find something in the result set (or to receive all available data) - always call the tool as many times as needed increasing the `page` parameter until ther result set is exhausted. If you stumble with the context size limit — try to change the `per_page` parameter to a lower value and restart the search from the `page=1`.
 
 Some tools use cursor pagination instead of `page` (e.g. `issue_get_changelog`): they accept a `cursor` argument and return a `next_cursor` value. To get all data, keep calling the tool passing the previous `next_cursor` as `cursor` until `next_cursor` is null. Do not change `per_page` mid-pagination; if you must, restart with `cursor` empty.
+
+To retrieve a large number of issues (more than a few pages), prefer `issues_scroll` over `issues_find`: pass the returned `next_scroll_id` as `scroll_id` with the same query until `next_scroll_id` is null.
 """
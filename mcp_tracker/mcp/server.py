@@ -6,6 +6,7 @@ from typing import Any
 import yarl
 from mcp.server import FastMCP
 from mcp.server.auth.settings import AuthSettings, ClientRegistrationOptions
+from redis.asyncio import Redis
 from starlette.routing import Route
 
 from mcp_tracker.mcp.context import AppContext
@@ -18,7 +19,19 @@ from mcp_tracker.mcp.resources import register_resources
 from mcp_tracker.mcp.tools import register_all_tools
 from mcp_tracker.settings import Settings
 from mcp_tracker.tracker.caching.client import make_cached_protocols
+from mcp_tracker.tracker.caching.invalidation import cache_backend
+from mcp_tracker.tracker.caching.local import LocalCache, LocalCacheSync
 from mcp_tracker.tracker.custom.client import ServiceAccountSettings, TrackerClient
+from mcp_tracker.tracker.custom.conditional import ConditionalCache
+from mcp_tracker.tracker.custom.pool import ConnectionPoolSettings
+from mcp_tracker.tracker.custom.ratelimit import (
+    AdaptiveRateLimiter,
+    RateLimitSettings,
+    RedisRateLimiter,
+)
+from mcp_tracker.tracker.custom.retry import RetryPolicy
+from mcp_tracker.tracker.custom.workflow import WorkflowCache
+from mcp_tracker.tracker.directory import UserDirectory
 from mcp_tracker.tracker.proto.fields import GlobalDataProtocol
 from mcp_tracker.tracker.proto.issues import IssueProtocol
 from mcp_tracker.tracker.proto.queues import QueuesProtocol
@@ -50,6 +63,30 @@ def _parse_encryption_keys(keys_str: str | None) -> list[bytes] | None:
     return keys if keys else None
 
 
+def _make_rate_limiter(settings: Settings) -> AdaptiveRateLimiter | None:
+    if not settings.tracker_rate_limit_enabled:
+        return None
+
+    rate_limit_settings = RateLimitSettings(
+        initial_rate=settings.tracker_rate_limit_initial_rps,
+        min_rate=settings.tracker_rate_limit_min_rps,
+        max_rate=settings.tracker_rate_limit_max_rps,
+        burst=settings.tracker_rate_limit_burst,
+    )
+    if settings.tracker_rate_limit_store == "redis":
+        return RedisRateLimiter(
+            Redis(
+                host=settings.redis_endpoint,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                password=settings.redis_password,
+                max_connections=settings.redis_pool_max_size,
+            ),
+            rate_limit_settings,
+        )
+    return AdaptiveRateLimiter(rate_limit_settings)
+
+
 def make_tracker_lifespan(settings: Settings) -> Lifespan:
     """Factory function to create tracker lifespan with given settings."""
 
@@ -75,20 +112,71 @@ def make_tracker_lifespan(settings: Settings) -> Lifespan:
             service_account=service_account_settings,
             cloud_org_id=settings.tracker_cloud_org_id,
             org_id=settings.tracker_org_id,
+            pool=ConnectionPoolSettings(
+                limit=settings.tracker_http_pool_limit,
+                limit_per_host=settings.tracker_http_pool_limit_per_host,
+                keepalive_timeout=settings.tracker_http_keepalive_timeout,
+                dns_cache_ttl=settings.tracker_http_dns_cache_ttl,
+                warmup_connections=settings.tracker_http_warmup_connections,
+            ),
+            retry=RetryPolicy(
+                max_attempts=settings.tracker_retry_max_attempts,
+                backoff_base=settings.tracker_retry_backoff_base,
+                backoff_max=settings.tracker_retry_backoff_max,
+                budget=settings.tracker_retry_budget,
+            ),
+            rate_limiter=_make_rate_limiter(settings),
+            coalesce_reads=settings.tracker_coalesce_reads,
+            conditional_cache=(
+                ConditionalCache(settings.tracker_conditional_cache_size)
+                if settings.tracker_conditional_cache_size > 0
+                else None
+            ),
+            workflow_cache=(
+                WorkflowCache(ttl=settings.tracker_workflow_cache_ttl)
+                if settings.tracker_workflow_cache_ttl > 0
+                else None
+            ),
         )
 
         queues: QueuesProtocol = tracker
         issues: IssueProtocol = tracker
         global_data: GlobalDataProtocol = tracker
         users: UsersProtocol = tracker
+        local_cache_sync: LocalCacheSync | None = None
         if settings.tools_cache_enabled:
-            cache_collection = make_cached_protocols(settings.cache_kwargs())
+            local_cache: LocalCache | None = None
+            if (
+                settings.tools_cache_local_ttl > 0
+                and settings.tools_cache_local_max_bytes > 0
+            ):
+                local_cache = LocalCache(
+                    max_bytes=settings.tools_cache_local_max_bytes,
+                    ttl=settings.tools_cache_local_ttl,
+                )
+                local_cache_sync = LocalCacheSync(
+                    cache_backend(settings.cache_kwargs()).client, local_cache
+                )
+            cache_collection = make_cached_protocols(
+                settings.cache_kwargs(),
+                settings.cache_policy(),
+                local=local_cache,
+                local_sync=local_cache_sync,
+            )
             queues = cache_collection.queues(queues)
             issues = cache_collection.issues(issues)
             global_data = cache_collection.global_data(global_data)
             users = cache_collection.users(users)
 
+        user_directory = UserDirectory(
+            users,
+            ttl=settings.tracker_user_directory_ttl,
+            max_orgs=settings.tracker_user_directory_max_orgs,
+        )
+
         try:
+            if local_cache_sync is not None:
+                local_cache_sync.start()
             await tracker.prepare()
 
             yield AppContext(
@@ -96,8 +184,12 @@ def make_tracker_lifespan(settings: Settings) -> Lifespan:
                 issues=issues,
                 fields=global_data,
                 users=users,
+                user_directory=user_directory,
             )
         finally:
+            await user_directory.close()
+            if local_cache_sync is not None:
+                await local_cache_sync.close()
             await tracker.close()
 
     return tracker_lifespan
@@ -8,6 +8,7 @@ from mcp.types import ToolAnnotations
 from pydantic import Field
 
 from mcp_tracker.mcp.context import AppContext
+from mcp_tracker.mcp.fanout import ItemError, fan_out
 from mcp_tracker.mcp.params import (
     CursorPerPageParam,
     IssueID,
@@ -24,14 +25,21 @@ from mcp_tracker.tracker.proto.types.issues import (
     ChecklistItem,
     Issue,
     IssueAttachment,
+    IssueBatch,
     IssueComment,
     IssueFieldsEnum,
     IssueLink,
+    IssueScrollPage,
     IssueTransition,
     Worklog,
 )
 
 
+def _projection(fields: list[IssueFieldsEnum], include_description: bool) -> list[str]:
+    """Names of the fields to request from Tracker for the selected ``fields``."""
+    return [f.name for f in fields if include_description or f.name != "description"]
+
+
 def register_issue_read_tools(settings: Settings, mcp: FastMCP[Any]) -> None:
     """Register issue read-only tools."""
 
@@ -50,19 +58,74 @@ def register_issue_read_tools(settings: Settings, mcp: FastMCP[Any]) -> None:
                 "It can be large, so use only when needed.",
             ),
         ] = True,
+        fields: Annotated[
+            list[IssueFieldsEnum] | None,
+            Field(
+                description="Fields to include in the response. In order to not pollute context window - select "
+                "appropriate fields beforehand. Not specifying fields will return all available."
+            ),
+        ] = None,
     ) -> Issue:
         check_issue_access(settings, issue_id)
 
-        issue = await ctx.request_context.lifespan_context.issues.issue_get(
-            issue_id,
-            auth=get_yandex_auth(ctx),
-        )
+        issues = ctx.request_context.lifespan_context.issues
+        if fields is None:
+            issue = await issues.issue_get(issue_id, auth=get_yandex_auth(ctx))
+        else:
+            issue = await issues.issue_get(
+                issue_id,
+                fields=_projection(fields, include_description),
+                auth=get_yandex_auth(ctx),
+            )
+            set_non_needed_fields_null([issue], {f.name for f in fields})
 
         if not include_description:
             issue.description = None
 
         return issue
 
+    @mcp.tool(
+        title="Get Multiple Issues",
+        description="Get several Yandex Tracker issues by their ids in one request. "
+        "Prefer it over repeated 'issue_get' calls. Keys that do not exist are "
+        "returned in 'missing'.",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    async def issues_get_many(
+        ctx: Context[Any, AppContext],
+        issue_ids: IssueIDs,
+        include_description: Annotated[
+            bool,
+            Field(
+                description="Whether to include issue description in the issues result. "
+                "It can be large, so use only when needed.",
+            ),
+        ] = False,
+        fields: Annotated[
+            list[IssueFieldsEnum] | None,
+            Field(
+                description="Fields to include in the response. In order to not pollute context window - select "
+                "appropriate fields beforehand. Not specifying fields will return all available."
+            ),
+        ] = None,
+    ) -> IssueBatch:
+        for issue_id in issue_ids:
+            check_issue_access(settings, issue_id)
+
+        batch = await ctx.request_context.lifespan_context.issues.issues_get_many(
+            issue_ids,
+            auth=get_yandex_auth(ctx),
+        )
+
+        if not include_description:
+            for issue in batch.issues:
+                issue.description = None  # Clear description to save context
+
+        if fields is not None:
+            set_non_needed_fields_null(batch.issues, {f.name for f in fields})
+
+        return batch
+
     @mcp.tool(
         title="Get Issue Comments",
         description="Get comments of a Yandex Tracker issue by its id",
@@ -123,6 +186,9 @@ def register_issue_read_tools(settings: Settings, mcp: FastMCP[Any]) -> None:
             query=query,
             per_page=per_page,
             page=page,
+            fields=_projection(fields, include_description)
+            if fields is not None
+            else None,
             auth=get_yandex_auth(ctx),
         )
 
@@ -135,6 +201,57 @@ def register_issue_read_tools(settings: Settings, mcp: FastMCP[Any]) -> None:
 
         return issues
 
+    @mcp.tool(
+        title="Scroll Issues",
+        description="Iterate over all Yandex Tracker issues matching a query, for large result "
+        "sets (exports, analytics) where page numbers get slow. "
+        "Returns a page of issues plus 'next_scroll_id'. To fetch the next page, pass "
+        "'next_scroll_id' from the previous result as the 'scroll_id' argument together "
+        "with the same query; when 'next_scroll_id' is null all issues have been returned.",
+        annotations=ToolAnnotations(readOnlyHint=True),
+    )
+    async def issues_scroll(
+        ctx: Context[Any, AppContext],
+        query: YTQuery,
+        scroll_id: Annotated[
+            str | None,
+            Field(
+                description="Scroll id for the next page: the 'next_scroll_id' value returned "
+                "by the previous call. Leave empty for the first page.",
+            ),
+        ] = None,
+        include_description: Annotated[
+            bool,
+            Field(
+                description="Whether to include issue description in the issues result. It can be large, so use only when needed.",
+            ),
+        ] = False,
+        fields: Annotated[
+            list[IssueFieldsEnum] | None,
+            Field(
+                description="Fields to include in the response. In order to not pollute context window - select "
+                "appropriate fields beforehand. Not specifying fields will return all available."
+            ),
+        ] = None,
+        per_page: CursorPerPageParam = 100,
+    ) -> IssueScrollPage:
+        page = await ctx.request_context.lifespan_context.issues.issues_scroll_page(
+            query,
+            per_scroll=per_page,
+            scroll_id=scroll_id,
+            scroll_ttl_millis=int(settings.tracker_scroll_ttl * 1000),
+            auth=get_yandex_auth(ctx),
+        )
+
+        if not include_description:
+            for issue in page.issues:
+                issue.description = None  # Clear description to save context
+
+        if fields is not None:
+            set_non_needed_fields_null(page.issues, {f.name for f in fields})
+
+        return page
+
     @mcp.tool(
         title="Count Issues",
         description="Get the count of Yandex Tracker issues matching a query",
@@ -151,27 +268,30 @@ def register_issue_read_tools(settings: Settings, mcp: FastMCP[Any]) -> None:
 
     @mcp.tool(
         title="Get Issue Worklogs",
-        description="Get worklogs of a Yandex Tracker issue by its id",
+        description="Get worklogs of Yandex Tracker issues by their ids. Issues are fetched "
+        "concurrently; an issue that cannot be fetched gets an `error` entry instead of "
+        "its worklogs.",
         annotations=ToolAnnotations(readOnlyHint=True),
     )
     async def issue_get_worklogs(
         ctx: Context[Any, AppContext],
         issue_ids: IssueIDs,
-    ) -> dict[str, list[Worklog]]:
+    ) -> dict[str, list[Worklog] | ItemError]:
         for issue_id in issue_ids:
             check_issue_access(settings, issue_id)
 
-        result: dict[str, list[Worklog]] = {}
-        for issue_id in issue_ids:
-            worklogs = (
-                await ctx.request_context.lifespan_context.issues.issue_get_worklogs(
-                    issue_id,
-                    auth=get_yandex_auth(ctx),
-                )
-            )
-            result[issue_id] = worklogs or []
+        issues = ctx.request_context.lifespan_context.issues
+        auth = get_yandex_auth(ctx)
 
-        return result
+        async def get_worklogs(issue_id: str) -> list[Worklog]:
+            return await issues.issue_get_worklogs(issue_id, auth=auth) or []
+
+        return await fan_out(
+            issue_ids,
+            get_worklogs,
+            concurrency=settings.tracker_fanout_concurrency,
+            timeout=settings.tracker_fanout_timeout or None,
+        )
 
     @mcp.tool(
         title="Get Issue Attachments",
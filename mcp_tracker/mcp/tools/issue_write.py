@@ -1,7 +1,8 @@
 """Issue write MCP tools (conditionally registered based on read-only mode)."""
 
 import datetime
-from typing import Annotated, Any
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Annotated, Any, TypeVar
 
 from mcp.server import FastMCP
 from mcp.server.fastmcp import Context
@@ -10,10 +11,12 @@ from pydantic import BaseModel, Field, create_model
 
 from mcp_tracker.mcp.context import AppContext
 from mcp_tracker.mcp.errors import TrackerError
-from mcp_tracker.mcp.params import IssueID
+from mcp_tracker.mcp.fanout import BatchItemResult, fan_out
+from mcp_tracker.mcp.params import IssueID, IssueIDs
 from mcp_tracker.mcp.tools._access import check_issue_access, check_queue_access
 from mcp_tracker.mcp.utils import get_yandex_auth
 from mcp_tracker.settings import Settings
+from mcp_tracker.tracker.proto.types.bulkchange import BulkChange, BulkChangeResult
 from mcp_tracker.tracker.proto.types.inputs import (
     IssueUpdateFollower,
     IssueUpdateParent,
@@ -31,6 +34,41 @@ from mcp_tracker.tracker.proto.types.issues import (
     Worklog,
 )
 
+T = TypeVar("T")
+
+
+class CommentItem(BaseModel):
+    """A comment to add to one issue of a batch."""
+
+    issue_id: IssueID
+    text: str = Field(description="Comment text (markdown supported by Tracker).")
+    summonees: list[str] | None = Field(
+        None,
+        description="Optional list of summoned users (logins or IDs) who will be "
+        "notified about the comment.",
+    )
+    markup_type: str | None = Field(
+        None,
+        description="Optional markup type for comment text. Use 'md' for YFM (markdown).",
+    )
+
+
+class WorklogItem(BaseModel):
+    """A worklog entry to add to one issue of a batch."""
+
+    issue_id: IssueID
+    duration: str = Field(
+        description="Time spent in ISO-8601 duration format (e.g., 'PT1H30M')."
+    )
+    comment: str | None = Field(
+        None, description="Optional comment to add to the worklog entry."
+    )
+    start: datetime.datetime | None = Field(
+        None,
+        description="Optional start datetime for the worklog. "
+        "If timezone is not provided, UTC is assumed.",
+    )
+
 
 def _build_move_options_schema(
     *,
@@ -685,3 +723,224 @@ def register_issue_write_tools(settings: Settings, mcp: FastMCP[Any]) -> None:
             link_id,
             auth=get_yandex_auth(ctx),
         )
+
+    async def submit_batch(
+        items: Sequence[CommentItem | WorklogItem],
+        submit: Callable[[Any], Awaitable[T]],
+        dry_run: bool,
+    ) -> list[BatchItemResult[T]]:
+        async def call(index: int) -> T | None:
+            item = items[index]
+            check_issue_access(settings, item.issue_id, write=True)
+            if dry_run:
+                return None
+            return await submit(item)
+
+        # No deadline: cancelling a write in flight would leave its outcome unknown.
+        outcomes = await fan_out(
+            range(len(items)),
+            call,
+            concurrency=settings.tracker_fanout_concurrency,
+        )
+        return [
+            BatchItemResult[T].from_outcome(item.issue_id, outcomes[index])
+            for index, item in enumerate(items)
+        ]
+
+    @mcp.tool(
+        title="Add Comments to Many Issues",
+        description="Add comments to many Yandex Tracker issues in one call, e.g. the same "
+        "or a templated status update. Comments are submitted concurrently; the result has "
+        "one entry per item, in order, with either the created comment or an error. "
+        "Use dry_run to only check that every issue may be written to.",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    async def issues_add_comments(
+        ctx: Context[Any, AppContext],
+        items: Annotated[
+            list[CommentItem],
+            Field(description="Comments to add, one per item.", min_length=1),
+        ],
+        dry_run: Annotated[
+            bool,
+            Field(description="Only validate access to the issues, add nothing."),
+        ] = False,
+    ) -> list[BatchItemResult[IssueComment]]:
+        issues = ctx.request_context.lifespan_context.issues
+        auth = get_yandex_auth(ctx)
+
+        async def add_comment(item: CommentItem) -> IssueComment:
+            return await issues.issue_add_comment(
+                item.issue_id,
+                text=item.text,
+                summonees=item.summonees,
+                markup_type=item.markup_type,
+                auth=auth,
+            )
+
+        return await submit_batch(items, add_comment, dry_run)
+
+    @mcp.tool(
+        title="Add Worklogs to Many Issues",
+        description="Add worklog entries (log spent time) to many Yandex Tracker issues in "
+        "one call. Worklogs are submitted concurrently; the result has one entry per item, "
+        "in order, with either the created worklog or an error. Use dry_run to only check "
+        "that every issue may be written to.",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    async def issues_add_worklogs(
+        ctx: Context[Any, AppContext],
+        items: Annotated[
+            list[WorklogItem],
+            Field(description="Worklog entries to add, one per item.", min_length=1),
+        ],
+        dry_run: Annotated[
+            bool,
+            Field(description="Only validate access to the issues, add nothing."),
+        ] = False,
+    ) -> list[BatchItemResult[Worklog]]:
+        issues = ctx.request_context.lifespan_context.issues
+        auth = get_yandex_auth(ctx)
+
+        async def add_worklog(item: WorklogItem) -> Worklog:
+            return await issues.issue_add_worklog(
+                item.issue_id,
+                duration=item.duration,
+                comment=item.comment,
+                start=item.start,
+                auth=auth,
+            )
+
+        return await submit_batch(items, add_worklog, dry_run)
+
+    async def wait_bulk_change(
+        ctx: Context[Any, AppContext], bulk_change: BulkChange, issue_ids: list[str]
+    ) -> BulkChangeResult:
+        if not bulk_change.finished:
+            bulk_change = (
+                await ctx.request_context.lifespan_context.issues.bulkchange_wait(
+                    bulk_change.id,
+                    timeout=settings.tracker_bulkchange_timeout,
+                    auth=get_yandex_auth(ctx),
+                )
+            )
+        return BulkChangeResult.from_bulk_change(bulk_change, issue_ids)
+
+    @mcp.tool(
+        title="Bulk Update Issues",
+        description="Set the same field values on many Yandex Tracker issues with a single "
+        "bulk change job. Prefer this over repeated issue_update calls when changing more "
+        "than a few issues. Waits for the job and returns its status and overall outcome; "
+        "Tracker does not report which issues a partially completed job failed on.",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    async def issues_bulk_update(
+        ctx: Context[Any, AppContext],
+        issue_ids: IssueIDs,
+        values: Annotated[
+            dict[str, Any],
+            Field(
+                description="Field values to set on every issue, keyed by field id "
+                "(e.g., {'priority': 'critical', 'tags': {'add': ['backend']}}). "
+                "Use queue_get_fields to discover available fields."
+            ),
+        ],
+    ) -> BulkChangeResult:
+        for issue_id in issue_ids:
+            check_issue_access(settings, issue_id, write=True)
+
+        bulk_change = (
+            await ctx.request_context.lifespan_context.issues.issues_bulk_update(
+                issue_ids,
+                values,
+                auth=get_yandex_auth(ctx),
+            )
+        )
+        return await wait_bulk_change(ctx, bulk_change, issue_ids)
+
+    @mcp.tool(
+        title="Bulk Execute Issue Transition",
+        description="Execute the same status transition on many Yandex Tracker issues with a "
+        "single bulk change job. The issues must share a workflow: call issue_get_transitions "
+        "on one of them to pick the transition_id. Waits for the job and returns its status "
+        "and overall outcome.",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    async def issues_bulk_transition(
+        ctx: Context[Any, AppContext],
+        issue_ids: IssueIDs,
+        transition_id: Annotated[
+            str,
+            Field(
+                description="The transition ID to execute, as returned by issue_get_transitions."
+            ),
+        ],
+        comment: Annotated[
+            str | None,
+            Field(description="Optional comment to add to every issue."),
+        ] = None,
+        fields: Annotated[
+            dict[str, str | int | list[str]] | None,
+            Field(
+                description="Optional dictionary of additional fields to set during the transition, "
+                "e.g. 'resolution' (such as 'fixed') when closing issues."
+            ),
+        ] = None,
+    ) -> BulkChangeResult:
+        for issue_id in issue_ids:
+            check_issue_access(settings, issue_id, write=True)
+
+        bulk_change = (
+            await ctx.request_context.lifespan_context.issues.issues_bulk_transition(
+                issue_ids,
+                transition_id,
+                comment=comment,
+                fields=fields,
+                auth=get_yandex_auth(ctx),
+            )
+        )
+        return await wait_bulk_change(ctx, bulk_change, issue_ids)
+
+    @mcp.tool(
+        title="Bulk Move Issues to Another Queue",
+        description="Move many Yandex Tracker issues to a different queue with a single bulk "
+        "change job. The issues receive new keys in the target queue. Waits for the job and "
+        "returns its status and overall outcome.",
+        annotations=ToolAnnotations(readOnlyHint=False),
+    )
+    async def issues_bulk_move(
+        ctx: Context[Any, AppContext],
+        issue_ids: IssueIDs,
+        queue: Annotated[
+            str,
+            Field(description="Target queue key (e.g., 'MYQUEUE')"),
+        ],
+        move_all_fields: Annotated[
+            bool,
+            Field(
+                description="Whether to carry over versions, components and projects when "
+                "matching ones exist in the target queue. When false, those fields are cleared."
+            ),
+        ] = False,
+        initial_status: Annotated[
+            bool,
+            Field(
+                description="Whether to reset the status of the issues to the initial value. "
+                "Set this to true when moving to a queue with a different workflow."
+            ),
+        ] = False,
+    ) -> BulkChangeResult:
+        for issue_id in issue_ids:
+            check_issue_access(settings, issue_id, write=True)
+        check_queue_access(settings, queue, write=True)
+
+        bulk_change = (
+            await ctx.request_context.lifespan_context.issues.issues_bulk_move(
+                issue_ids,
+                queue,
+                move_all_fields=move_all_fields,
+                initial_status=initial_status,
+                auth=get_yandex_auth(ctx),
+            )
+        )
+        return await wait_bulk_change(ctx, bulk_change, issue_ids)
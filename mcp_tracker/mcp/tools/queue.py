@@ -50,36 +50,32 @@ def register_queue_tools(settings: Settings, mcp: FastMCP[Any]) -> None:
         ] = None,
         per_page: PerPageParam = 100,
     ) -> list[Queue]:
-        result: list[Queue] = []
-
-        fetch_all_pages = page is None
-        if fetch_all_pages:
-            page = 1
-
-        # At this point page is always an int
-        assert page is not None
+        # Ask Tracker only for the selected fields; the queue key is still
+        # needed to apply the queue limits below.
+        projection: list[str] | None = None
+        if fields is not None:
+            projection = [f.name for f in fields]
+            if settings.tracker_limit_queues and "key" not in projection:
+                projection.append("key")
 
-        while True:
-            queues = await ctx.request_context.lifespan_context.queues.queues_list(
+        queues_protocol = ctx.request_context.lifespan_context.queues
+        if page is None:
+            result = await queues_protocol.queues_list_all(
+                per_page=per_page,
+                fields=projection,
+                auth=get_yandex_auth(ctx),
+            )
+        else:
+            result = await queues_protocol.queues_list(
                 per_page=per_page,
                 page=page,
+                fields=projection,
                 auth=get_yandex_auth(ctx),
             )
-            if len(queues) == 0:
-                break
-
-            if settings.tracker_limit_queues:
-                queues = [
-                    queue
-                    for queue in queues
-                    if queue.key in set(settings.tracker_limit_queues)
-                ]
-
-            result.extend(queues)
 
-            if not fetch_all_pages:
-                break  # Only fetch the requested page
-            page += 1
+        if settings.tracker_limit_queues:
+            allowed = set(settings.tracker_limit_queues)
+            result = [queue for queue in result if queue.key in allowed]
 
         if fields is not None:
             set_non_needed_fields_null(result, {f.name for f in fields})
@@ -6,7 +6,6 @@ from mcp.server import FastMCP
 from mcp.server.fastmcp import Context
 from mcp.types import ToolAnnotations
 from pydantic import Field
-from thefuzz import process
 
 from mcp_tracker.mcp.context import AppContext
 from mcp_tracker.mcp.errors import TrackerError
@@ -48,41 +47,10 @@ def register_user_tools(_settings: Settings, mcp: FastMCP[Any]) -> None:
             str, Field(description="User login, email or real name to search for")
         ],
     ) -> list[User]:
-        per_page = 100
-        page = 1
-
-        login_or_email_or_name = login_or_email_or_name.strip().lower()
-
-        all_users: list[User] = []
-
-        while True:
-            batch = await ctx.request_context.lifespan_context.users.users_list(
-                per_page=per_page,
-                page=page,
-                auth=get_yandex_auth(ctx),
-            )
-
-            if not batch:
-                break
-
-            for user in batch:
-                if user.login and login_or_email_or_name == user.login.strip().lower():
-                    return [user]
-
-                if user.email and login_or_email_or_name == user.email.strip().lower():
-                    return [user]
-
-            all_users.extend(batch)
-            page += 1
-
-        names = {
-            idx: f"{u.first_name} {u.last_name}" for idx, u in enumerate(all_users)
-        }
-        results = process.extractBests(
-            login_or_email_or_name, names, score_cutoff=80, limit=3
+        return await ctx.request_context.lifespan_context.user_directory.search(
+            login_or_email_or_name,
+            auth=get_yandex_auth(ctx),
         )
-        matched_users = [all_users[idx] for name, score, idx in results]
-        return matched_users
 
     @mcp.tool(
         title="Get User",
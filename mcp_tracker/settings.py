@@ -5,6 +5,13 @@ from aiocache.serializers import PickleSerializer
 from pydantic import AnyHttpUrl, field_validator, model_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
+from mcp_tracker.tracker.caching.policy import (
+    DEFAULT_STALE_METHODS,
+    DEFAULT_TTLS,
+    CachePolicy,
+)
+from mcp_tracker.tracker.caching.serializers import ModelSerializer
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
@@ -26,6 +33,51 @@ class Settings(BaseSettings):
     tracker_read_only: bool = False
     tracker_read_only_queues: Annotated[list[str] | None, NoDecode] = None
 
+    # aiohttp connection pool towards the Tracker API (0 means unlimited)
+    tracker_http_pool_limit: int = 100
+    tracker_http_pool_limit_per_host: int = 0
+    tracker_http_keepalive_timeout: float = 15.0
+    tracker_http_dns_cache_ttl: int | None = 10
+    tracker_http_warmup_connections: int = 0
+
+    # Retries of idempotent Tracker API calls (1 disables retries)
+    tracker_retry_max_attempts: int = 3
+    tracker_retry_backoff_base: float = 0.5
+    tracker_retry_backoff_max: float = 10.0
+    tracker_retry_budget: float = 30.0
+
+    # Adaptive client-side rate limiting per Tracker identity (requests per second)
+    tracker_rate_limit_enabled: bool = False
+    tracker_rate_limit_store: Literal["memory", "redis"] = "memory"
+    tracker_rate_limit_initial_rps: float = 10.0
+    tracker_rate_limit_min_rps: float = 0.5
+    tracker_rate_limit_max_rps: float = 50.0
+    tracker_rate_limit_burst: float = 10.0
+
+    # Share one upstream request between concurrent identical read calls
+    tracker_coalesce_reads: bool = True
+
+    # Revalidate stored Tracker responses with ETag / Last-Modified, 0 disables
+    tracker_conditional_cache_size: int = 1000
+
+    # Close issues with a remembered transition and cached status types, 0 disables
+    tracker_workflow_cache_ttl: float = 3600.0
+
+    # Multi-ID tools: concurrent per-issue calls and their overall deadline, 0 disables it
+    tracker_fanout_concurrency: int = 8
+    tracker_fanout_timeout: float = 30.0
+
+    # Local index of organization users answering users_search
+    tracker_user_directory_ttl: float = 600.0
+    tracker_user_directory_max_orgs: int = 16
+
+    # Seconds bulk change tools wait for the job before returning its progress
+    tracker_bulkchange_timeout: float = 60.0
+
+    # Seconds a scroll of the issues_scroll tool stays open between two pages; agents
+    # may think for minutes before asking for the next one
+    tracker_scroll_ttl: float = 600.0
+
     tracker_sa_key_id: str | None = None
     tracker_sa_service_account_id: str | None = None
     tracker_sa_private_key: str | None = None
@@ -38,6 +90,20 @@ class Settings(BaseSettings):
 
     tools_cache_enabled: bool = False
     tools_cache_redis_ttl: int | None = 3600
+    # Comma-separated `name=seconds` TTLs of cached methods or whole protocols
+    # (queues, issues, global_data, users), 0 disables caching
+    tools_cache_ttls: Annotated[dict[str, int], NoDecode] = {}
+    # In-process cache in front of Redis, kept in sync over pub/sub; 0 disables
+    tools_cache_local_ttl: float = 10.0
+    tools_cache_local_max_bytes: int = 32 * 1024 * 1024
+    # How cached results are stored in Redis: type-tagged JSON of the models, or pickle
+    tools_cache_serializer: Literal["json", "pickle"] = "json"
+    # JSON entries of at least this many bytes are zlib-compressed, 0 disables
+    tools_cache_compress_min_bytes: int = 1024
+    # Seconds expired entries of the stale methods are served while they are
+    # refreshed in the background, 0 disables
+    tools_cache_stale_ttl: int = 0
+    tools_cache_stale_methods: Annotated[list[str] | None, NoDecode] = None
 
     oauth_enabled: bool = False
     oauth_store: Literal["redis", "memory"] = "memory"
@@ -82,7 +148,12 @@ class Settings(BaseSettings):
 
         return self
 
-    @field_validator("tracker_limit_queues", "tracker_read_only_queues", mode="before")
+    @field_validator(
+        "tracker_limit_queues",
+        "tracker_read_only_queues",
+        "tools_cache_stale_methods",
+        mode="before",
+    )
     @classmethod
     def decode_numbers(cls, v: str | None) -> list[str] | None:
         if v is None:
@@ -95,6 +166,41 @@ class Settings(BaseSettings):
 
         return [x.strip() for x in v.split(",") if x.strip()]
 
+    @field_validator("tools_cache_ttls", mode="before")
+    @classmethod
+    def decode_ttls(cls, v: str | dict[str, int]) -> dict[str, int]:
+        if isinstance(v, dict):
+            return v
+
+        if not isinstance(v, str):
+            raise TypeError(f"Expected str or dict, got {type(v)}")
+
+        ttls: dict[str, int] = {}
+        for item in v.split(","):
+            if not item.strip():
+                continue
+            name, sep, ttl = item.partition("=")
+            if not sep:
+                raise ValueError(f"Expected name=seconds, got {item.strip()!r}")
+            ttls[name.strip()] = int(ttl)
+        return ttls
+
+    def cache_policy(self) -> CachePolicy:
+        # The built-in TTLs only apply while TOOLS_CACHE_REDIS_TTL is left unset,
+        # an explicit one is the TTL of everything not in TOOLS_CACHE_TTLS.
+        redis_ttl_set = "tools_cache_redis_ttl" in self.model_fields_set
+        return CachePolicy(
+            default_ttl=self.tools_cache_redis_ttl,
+            ttls=self.tools_cache_ttls,
+            defaults={} if redis_ttl_set else dict(DEFAULT_TTLS),
+            stale_ttl=self.tools_cache_stale_ttl,
+            stale_methods=(
+                frozenset(self.tools_cache_stale_methods)
+                if self.tools_cache_stale_methods is not None
+                else DEFAULT_STALE_METHODS
+            ),
+        )
+
     def cache_kwargs(self) -> dict[str, Any]:
         return {
             "cache": Cache.REDIS,
@@ -103,7 +209,11 @@ class Settings(BaseSettings):
             "db": self.redis_db,
             "password": self.redis_password,
             "pool_max_size": self.redis_pool_max_size,
-            "serializer": PickleSerializer(),
+            "serializer": (
+                ModelSerializer(compress_min_bytes=self.tools_cache_compress_min_bytes)
+                if self.tools_cache_serializer == "json"
+                else PickleSerializer()
+            ),
             "noself": True,
             "ttl": self.tools_cache_redis_ttl,
         }
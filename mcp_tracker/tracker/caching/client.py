@@ -1,13 +1,31 @@
 import datetime
-from dataclasses import dataclass
-from typing import Any
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
 from aiocache import cached
 
+from mcp_tracker.tracker.caching.decorators import cached_method
+from mcp_tracker.tracker.caching.invalidation import (
+    ISSUE_WRITE_INVALIDATES,
+    QUEUE_WRITE_INVALIDATES,
+    Generations,
+    PendingBulkChanges,
+    cache_backend,
+    issue_read_tag,
+    issue_write_tags,
+    query_tags,
+    queue_read_tag,
+)
+from mcp_tracker.tracker.caching.keys import key_builder
+from mcp_tracker.tracker.caching.local import LocalCache, LocalCacheSync
+from mcp_tracker.tracker.caching.policy import LOCAL_OBJECT_METHODS, CachePolicy
 from mcp_tracker.tracker.proto.common import YandexAuth
 from mcp_tracker.tracker.proto.fields import GlobalDataProtocolWrap
 from mcp_tracker.tracker.proto.issues import IssueProtocolWrap
 from mcp_tracker.tracker.proto.queues import QueuesProtocolWrap
+from mcp_tracker.tracker.proto.types.bulkchange import BulkChange
 from mcp_tracker.tracker.proto.types.fields import GlobalField, LocalField
 from mcp_tracker.tracker.proto.types.inputs import (
     IssueUpdateFollower,
@@ -23,9 +41,11 @@ from mcp_tracker.tracker.proto.types.issues import (
     ChecklistItem,
     Issue,
     IssueAttachment,
+    IssueBatch,
     IssueComment,
     IssueLink,
     IssueLinkRelationship,
+    IssueScrollPage,
     IssueTransition,
     Worklog,
 )
@@ -40,6 +60,8 @@ from mcp_tracker.tracker.proto.types.statuses import Status
 from mcp_tracker.tracker.proto.types.users import User
 from mcp_tracker.tracker.proto.users import UsersProtocolWrap
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CacheCollection:
@@ -49,33 +71,161 @@ class CacheCollection:
     users: type[UsersProtocolWrap]
 
 
+@dataclass(frozen=True)
+class WorkflowState:
+    """Queue, issue type and status: everything the transitions of an issue depend on.
+
+    ``issue_id`` names one issue in this state to fetch the transitions of. It is
+    not part of the identity, so it does not end up in cache keys.
+    """
+
+    queue: str
+    type: str
+    status: str
+    issue_id: str = field(compare=False, repr=False)
+
+    @classmethod
+    def of(cls, issue: Issue) -> "WorkflowState | None":
+        if not (issue.key and issue.type and issue.type.key and issue.status):
+            return None
+        if not issue.status.key:
+            return None
+        return cls(
+            queue=issue.key.split("-")[0],
+            type=issue.type.key,
+            status=issue.status.key,
+            issue_id=issue.key,
+        )
+
+
 def make_cached_protocols(
     cache_config: dict[str, Any],
+    policy: CachePolicy | None = None,
+    *,
+    local: LocalCache | None = None,
+    local_sync: LocalCacheSync | None = None,
 ) -> CacheCollection:
+    ttls = policy or CachePolicy(default_ttl=cache_config.get("ttl"), defaults={})
+    cache_config = {
+        **cache_config,
+        "key_builder": key_builder(noself=cache_config.get("noself", False)),
+    }
+
+    # Builds keys exactly like each of the `@cached_as(...)` below.
+    keys = cached(**cache_config)
+    backend = cache_backend(cache_config)
+    generations = Generations(backend, ttl=ttls.max_ttl)
+    bulk_changes = PendingBulkChanges(backend)
+
+    def caches(protocol: str, method: str) -> bool:
+        return ttls.ttl(protocol, method) != 0
+
+    def method_cache(protocol: str, method: str) -> cached_method:
+        """`@cached` with the TTL and stale TTL of ``method``.
+
+        Methods the policy does not cache are left undecorated.
+        """
+        return cached_method(
+            **{**cache_config, "ttl": ttls.ttl(protocol, method)},
+            stale_ttl=ttls.stale(protocol, method),
+            local=local,
+            local_sync=local_sync,
+            local_objects=method in LOCAL_OBJECT_METHODS,
+        )
+
+    def cached_as(
+        protocol: str, method: str | None = None
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """`method_cache` of ``method``, by default the decorated one."""
+
+        def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+            return method_cache(protocol, method or fn.__name__)(fn)
+
+        return decorate
+
+    def call_key(
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        auth: YandexAuth | None,
+        **kwargs: Any,
+    ) -> str:
+        """Key a cached `method(*args, **kwargs, auth=auth)` call is stored under."""
+        fn = method.__wrapped__  # type: ignore[attr-defined]
+        return keys.get_cache_key(fn, args, {**kwargs, "auth": auth})
+
+    async def cached_call(
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        auth: YandexAuth | None,
+        **kwargs: Any,
+    ) -> Any:
+        """The cached result of `method(*args, **kwargs, auth=auth)`, or None."""
+        cache = getattr(method, "cache", None)
+        if cache is None:
+            return None
+        try:
+            return await cache.get(call_key(method, args, auth, **kwargs))
+        except Exception:
+            logger.exception("Failed to read cached %s", method.__name__)
+        return None
+
     class CachingQueuesProtocol(QueuesProtocolWrap):
-        @cached(**cache_config)
+        @cached_as("queues")
         async def queues_list(
-            self, per_page: int = 100, page: int = 1, *, auth: YandexAuth | None = None
+            self,
+            per_page: int = 100,
+            page: int = 1,
+            *,
+            fields: list[str] | None = None,
+            auth: YandexAuth | None = None,
         ) -> list[Queue]:
             return await self._original.queues_list(
-                per_page=per_page, page=page, auth=auth
+                per_page=per_page, page=page, fields=fields, auth=auth
+            )
+
+        @cached_as("queues")
+        async def queues_list_all(
+            self,
+            per_page: int = 100,
+            *,
+            fields: list[str] | None = None,
+            auth: YandexAuth | None = None,
+        ) -> list[Queue]:
+            return await self._original.queues_list_all(
+                per_page=per_page, fields=fields, auth=auth
             )
 
-        @cached(**cache_config)
+        @cached_as("queues")
         async def queues_get_local_fields(
             self, queue_id: str, *, auth: YandexAuth | None = None
         ) -> list[LocalField]:
             return await self._original.queues_get_local_fields(queue_id, auth=auth)
 
-        @cached(**cache_config)
+        @cached_as("queues")
         async def queues_get_tags(
             self, queue_id: str, *, auth: YandexAuth | None = None
         ) -> list[str]:
             return await self._original.queues_get_tags(queue_id, auth=auth)
 
-        @cached(**cache_config)
         async def queues_get_versions(
             self, queue_id: str, *, auth: YandexAuth | None = None
+        ) -> list[QueueVersion]:
+            if not caches("queues", "queues_get_versions"):
+                return await self._original.queues_get_versions(queue_id, auth=auth)
+            generation = await generations.tokens(
+                [queue_read_tag(queue_id, "queues_get_versions")]
+            )
+            return await self._queues_get_versions(
+                queue_id, generation=generation, auth=auth
+            )
+
+        @cached_as("queues", "queues_get_versions")
+        async def _queues_get_versions(
+            self,
+            queue_id: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> list[QueueVersion]:
             return await self._original.queues_get_versions(queue_id, auth=auth)
 
@@ -89,7 +239,7 @@ def make_cached_protocols(
             due_date: datetime.date | None = None,
             auth: YandexAuth | None = None,
         ) -> QueueVersion:
-            return await self._original.queue_create_version(
+            version = await self._original.queue_create_version(
                 queue_id,
                 name=name,
                 description=description,
@@ -97,14 +247,22 @@ def make_cached_protocols(
                 due_date=due_date,
                 auth=auth,
             )
+            try:
+                await generations.bump(
+                    queue_read_tag(queue_id, read)
+                    for read in QUEUE_WRITE_INVALIDATES["queue_create_version"]
+                )
+            except Exception:
+                logger.exception("Failed to invalidate cached queue %s", queue_id)
+            return version
 
-        @cached(**cache_config)
+        @cached_as("queues")
         async def queues_get_fields(
             self, queue_id: str, *, auth: YandexAuth | None = None
         ) -> list[GlobalField]:
             return await self._original.queues_get_fields(queue_id, auth=auth)
 
-        @cached(**cache_config)
+        @cached_as("queues")
         async def queue_get(
             self,
             queue_id: str,
@@ -114,16 +272,114 @@ def make_cached_protocols(
         ) -> Queue:
             return await self._original.queue_get(queue_id, expand=expand, auth=auth)
 
+    issue_get_cache = method_cache("issues", "issue_get")
+
+    def issue_get_key(
+        self: Any,
+        issue_id: str,
+        generation: tuple[str | None, ...],
+        auth: YandexAuth | None,
+    ) -> str:
+        """Key a plain `issue_get(issue_id, auth=auth)` call is cached under."""
+        return call_key(
+            CachingIssuesProtocol._issue_get,
+            (self, issue_id),
+            auth,
+            generation=generation,
+        )
+
+    async def issue_generation(issue_id: str, read: str) -> tuple[str | None, ...]:
+        return await generations.tokens([issue_read_tag(issue_id, read)])
+
     class CachingIssuesProtocol(IssueProtocolWrap):
-        @cached(**cache_config)
+        async def _issue_read(
+            self, read: str, issue_id: str, auth: YandexAuth | None
+        ) -> Any:
+            """Cached ``read`` of an issue.
+
+            Per-issue reads are keyed by the generation of the issue rather than
+            deleted on writes: keys are scoped by user, so deleting the writer's
+            entries would leave everybody else's stale.
+            """
+            if not caches("issues", read):
+                return await getattr(self._original, read)(issue_id, auth=auth)
+            generation = await issue_generation(issue_id, read)
+            return await getattr(self, f"_{read}")(
+                issue_id, generation=generation, auth=auth
+            )
+
         async def issue_get(
-            self, issue_id: str, *, auth: YandexAuth | None = None
+            self,
+            issue_id: str,
+            *,
+            fields: list[str] | None = None,
+            auth: YandexAuth | None = None,
+        ) -> Issue:
+            if fields is None:
+                return await self._issue_read("issue_get", issue_id, auth)
+            if not caches("issues", "issue_get"):
+                return await self._original.issue_get(
+                    issue_id, fields=fields, auth=auth
+                )
+            generation = await issue_generation(issue_id, "issue_get")
+            return await self._issue_get_projection(
+                issue_id, fields=fields, generation=generation, auth=auth
+            )
+
+        @issue_get_cache
+        async def _issue_get(
+            self,
+            issue_id: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> Issue:
-            return await self._original.issue_get(issue_id, auth=auth)
+            return await self._original.issue_get(issue_id, fields=None, auth=auth)
+
+        @cached_as("issues", "issue_get")
+        async def _issue_get_projection(
+            self,
+            issue_id: str,
+            *,
+            fields: list[str],
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
+        ) -> Issue:
+            return await self._original.issue_get(issue_id, fields=fields, auth=auth)
+
+        async def _invalidate(
+            self,
+            write: str,
+            issue_ids: Iterable[str],
+            auth: YandexAuth | None,
+            *,
+            queues: Iterable[str] = (),
+        ) -> None:
+            """Drop what ``write`` made stale for ``issue_ids``.
+
+            Per-issue reads, query results and projections are invalidated by
+            bumping the generations they depend on. The write itself has
+            succeeded, so cache errors are only logged.
+            """
+            try:
+                await generations.bump(
+                    issue_write_tags(issue_ids, queues, ISSUE_WRITE_INVALIDATES[write])
+                )
+            except Exception:
+                logger.exception("Failed to invalidate cache after %s", write)
 
-        @cached(**cache_config)
         async def issues_get_links(
             self, issue_id: str, *, auth: YandexAuth | None = None
+        ) -> list[IssueLink]:
+            return await self._issue_read("issues_get_links", issue_id, auth)
+
+        @cached_as("issues", "issues_get_links")
+        async def _issues_get_links(
+            self,
+            issue_id: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> list[IssueLink]:
             return await self._original.issues_get_links(issue_id, auth=auth)
 
@@ -135,12 +391,14 @@ def make_cached_protocols(
             issue: str,
             auth: YandexAuth | None = None,
         ) -> IssueLink:
-            return await self._original.issue_add_link(
+            link = await self._original.issue_add_link(
                 issue_id,
                 relationship=relationship,
                 issue=issue,
                 auth=auth,
             )
+            await self._invalidate("issue_add_link", [issue_id, issue], auth)
+            return link
 
         async def issue_delete_link(
             self,
@@ -149,11 +407,33 @@ def make_cached_protocols(
             *,
             auth: YandexAuth | None = None,
         ) -> None:
-            return await self._original.issue_delete_link(issue_id, link_id, auth=auth)
+            # The other end of the link is known only from its cached links.
+            issue_ids = [issue_id]
+            links = await cached_call(
+                CachingIssuesProtocol._issues_get_links,
+                (self, issue_id),
+                auth,
+                generation=await issue_generation(issue_id, "issues_get_links"),
+            )
+            for link in links or []:
+                if link.id == link_id and link.object and link.object.key:
+                    issue_ids.append(link.object.key)
+
+            await self._original.issue_delete_link(issue_id, link_id, auth=auth)
+            await self._invalidate("issue_delete_link", issue_ids, auth)
 
-        @cached(**cache_config)
         async def issue_get_comments(
             self, issue_id: str, *, auth: YandexAuth | None = None
+        ) -> list[IssueComment]:
+            return await self._issue_read("issue_get_comments", issue_id, auth)
+
+        @cached_as("issues", "issue_get_comments")
+        async def _issue_get_comments(
+            self,
+            issue_id: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> list[IssueComment]:
             return await self._original.issue_get_comments(issue_id, auth=auth)
 
@@ -168,7 +448,7 @@ def make_cached_protocols(
             is_add_to_followers: bool = True,
             auth: YandexAuth | None = None,
         ) -> IssueComment:
-            return await self._original.issue_add_comment(
+            result = await self._original.issue_add_comment(
                 issue_id,
                 text=text,
                 summonees=summonees,
@@ -177,6 +457,8 @@ def make_cached_protocols(
                 is_add_to_followers=is_add_to_followers,
                 auth=auth,
             )
+            await self._invalidate("issue_add_comment", [issue_id], auth)
+            return result
 
         async def issue_update_comment(
             self,
@@ -189,7 +471,7 @@ def make_cached_protocols(
             markup_type: str | None = None,
             auth: YandexAuth | None = None,
         ) -> IssueComment:
-            return await self._original.issue_update_comment(
+            result = await self._original.issue_update_comment(
                 issue_id,
                 comment_id,
                 text=text,
@@ -198,6 +480,8 @@ def make_cached_protocols(
                 markup_type=markup_type,
                 auth=auth,
             )
+            await self._invalidate("issue_update_comment", [issue_id], auth)
+            return result
 
         async def issue_delete_comment(
             self,
@@ -206,29 +490,137 @@ def make_cached_protocols(
             *,
             auth: YandexAuth | None = None,
         ) -> None:
-            return await self._original.issue_delete_comment(
-                issue_id, comment_id, auth=auth
-            )
+            await self._original.issue_delete_comment(issue_id, comment_id, auth=auth)
+            await self._invalidate("issue_delete_comment", [issue_id], auth)
 
-        @cached(**cache_config)
         async def issues_find(
             self,
             query: str,
             *,
             per_page: int = 15,
             page: int = 1,
+            fields: list[str] | None = None,
+            auth: YandexAuth | None = None,
+        ) -> list[Issue]:
+            if not caches("issues", "issues_find"):
+                return await self._original.issues_find(
+                    query=query, per_page=per_page, page=page, fields=fields, auth=auth
+                )
+            generation = await generations.tokens(query_tags(query))
+            return await self._issues_find(
+                query,
+                per_page=per_page,
+                page=page,
+                fields=fields,
+                generation=generation,
+                auth=auth,
+            )
+
+        @cached_as("issues", "issues_find")
+        async def _issues_find(
+            self,
+            query: str,
+            *,
+            per_page: int,
+            page: int,
+            fields: list[str] | None,
+            generation: tuple[str | None, ...],
             auth: YandexAuth | None = None,
         ) -> list[Issue]:
             return await self._original.issues_find(
                 query=query,
                 per_page=per_page,
                 page=page,
+                fields=fields,
+                auth=auth,
+            )
+
+        async def issues_get_many(
+            self, keys: list[str], *, auth: YandexAuth | None = None
+        ) -> IssueBatch:
+            batch = await self._original.issues_get_many(keys, auth=auth)
+            if not caches("issues", "issue_get"):
+                return batch
+            # Prime issue_get with the fetched issues, under the same key a
+            # subsequent `issue_get(key, auth=auth)` call would look up.
+            issues = [issue for issue in batch.issues if issue.key]
+            try:
+                tokens = await generations.tokens(
+                    [issue_read_tag(issue.key or "") for issue in issues]
+                )
+            except Exception:
+                logger.exception("Failed to prime cached issue_get")
+                return batch
+            for issue, token in zip(issues, tokens, strict=True):
+                await issue_get_cache.set_in_cache(
+                    issue_get_key(self, issue.key or "", (token,), auth),
+                    issue.model_copy(deep=True),
+                )
+            return batch
+
+        def issues_find_stream(
+            self,
+            query: str,
+            *,
+            per_page: int = 15,
+            page: int = 1,
+            fields: list[str] | None = None,
+            auth: YandexAuth | None = None,
+        ) -> AsyncIterator[Issue]:
+            # Streaming is meant to bound memory, so it is never cached.
+            return self._original.issues_find_stream(
+                query, per_page=per_page, page=page, fields=fields, auth=auth
+            )
+
+        # Scroll ids are server-side cursors, so scroll pages are never cached.
+        async def issues_scroll_page(
+            self,
+            query: str,
+            *,
+            per_scroll: int = 100,
+            scroll_id: str | None = None,
+            scroll_type: Literal["sorted", "unsorted"] = "sorted",
+            scroll_ttl_millis: int = 60000,
+            auth: YandexAuth | None = None,
+        ) -> IssueScrollPage:
+            return await self._original.issues_scroll_page(
+                query,
+                per_scroll=per_scroll,
+                scroll_id=scroll_id,
+                scroll_type=scroll_type,
+                scroll_ttl_millis=scroll_ttl_millis,
+                auth=auth,
+            )
+
+        def issues_scroll(
+            self,
+            query: str,
+            *,
+            per_scroll: int = 100,
+            scroll_type: Literal["sorted", "unsorted"] = "sorted",
+            scroll_ttl_millis: int = 60000,
+            auth: YandexAuth | None = None,
+        ) -> AsyncIterator[Issue]:
+            return self._original.issues_scroll(
+                query,
+                per_scroll=per_scroll,
+                scroll_type=scroll_type,
+                scroll_ttl_millis=scroll_ttl_millis,
                 auth=auth,
             )
 
-        @cached(**cache_config)
         async def issue_get_worklogs(
             self, issue_id: str, *, auth: YandexAuth | None = None
+        ) -> list[Worklog]:
+            return await self._issue_read("issue_get_worklogs", issue_id, auth)
+
+        @cached_as("issues", "issue_get_worklogs")
+        async def _issue_get_worklogs(
+            self,
+            issue_id: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> list[Worklog]:
             return await self._original.issue_get_worklogs(issue_id, auth=auth)
 
@@ -241,13 +633,15 @@ def make_cached_protocols(
             start: datetime.datetime | None = None,
             auth: YandexAuth | None = None,
         ) -> Worklog:
-            return await self._original.issue_add_worklog(
+            result = await self._original.issue_add_worklog(
                 issue_id,
                 duration=duration,
                 comment=comment,
                 start=start,
                 auth=auth,
             )
+            await self._invalidate("issue_add_worklog", [issue_id], auth)
+            return result
 
         async def issue_update_worklog(
             self,
@@ -259,7 +653,7 @@ def make_cached_protocols(
             start: datetime.datetime | None = None,
             auth: YandexAuth | None = None,
         ) -> Worklog:
-            return await self._original.issue_update_worklog(
+            result = await self._original.issue_update_worklog(
                 issue_id,
                 worklog_id,
                 duration=duration,
@@ -267,6 +661,8 @@ def make_cached_protocols(
                 start=start,
                 auth=auth,
             )
+            await self._invalidate("issue_update_worklog", [issue_id], auth)
+            return result
 
         async def issue_delete_worklog(
             self,
@@ -275,27 +671,58 @@ def make_cached_protocols(
             *,
             auth: YandexAuth | None = None,
         ) -> None:
-            return await self._original.issue_delete_worklog(
+            await self._original.issue_delete_worklog(
                 issue_id,
                 worklog_id,
                 auth=auth,
             )
+            await self._invalidate("issue_delete_worklog", [issue_id], auth)
 
-        @cached(**cache_config)
         async def issue_get_attachments(
             self, issue_id: str, *, auth: YandexAuth | None = None
+        ) -> list[IssueAttachment]:
+            return await self._issue_read("issue_get_attachments", issue_id, auth)
+
+        @cached_as("issues", "issue_get_attachments")
+        async def _issue_get_attachments(
+            self,
+            issue_id: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> list[IssueAttachment]:
             return await self._original.issue_get_attachments(issue_id, auth=auth)
 
-        @cached(**cache_config)
         async def issues_count(
             self, query: str, *, auth: YandexAuth | None = None
+        ) -> int:
+            if not caches("issues", "issues_count"):
+                return await self._original.issues_count(query, auth=auth)
+            generation = await generations.tokens(query_tags(query))
+            return await self._issues_count(query, generation=generation, auth=auth)
+
+        @cached_as("issues", "issues_count")
+        async def _issues_count(
+            self,
+            query: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> int:
             return await self._original.issues_count(query, auth=auth)
 
-        @cached(**cache_config)
         async def issue_get_checklist(
             self, issue_id: str, *, auth: YandexAuth | None = None
+        ) -> list[ChecklistItem]:
+            return await self._issue_read("issue_get_checklist", issue_id, auth)
+
+        @cached_as("issues", "issue_get_checklist")
+        async def _issue_get_checklist(
+            self,
+            issue_id: str,
+            *,
+            generation: tuple[str | None, ...],
+            auth: YandexAuth | None = None,
         ) -> list[ChecklistItem]:
             return await self._original.issue_get_checklist(issue_id, auth=auth)
 
@@ -313,7 +740,7 @@ def make_cached_protocols(
             auth: YandexAuth | None = None,
             **kwargs: dict[str, Any],
         ) -> Issue:
-            return await self._original.issue_create(
+            issue = await self._original.issue_create(
                 queue,
                 summary,
                 type=type,
@@ -325,12 +752,34 @@ def make_cached_protocols(
                 auth=auth,
                 **kwargs,
             )
+            try:
+                await generations.bump(issue_write_tags([], [queue]))
+            except Exception:
+                logger.exception("Failed to invalidate cache after issue_create")
+            return issue
 
-        @cached(**cache_config)
         async def issue_get_transitions(
             self, issue_id: str, *, auth: YandexAuth | None = None
         ) -> list[IssueTransition]:
-            return await self._original.issue_get_transitions(issue_id, auth=auth)
+            # Transitions depend on the workflow state only, so they are shared
+            # by all issues in it. The state is known once the issue itself is
+            # cached by issue_get or issues_get_many.
+            issue = await cached_call(
+                CachingIssuesProtocol._issue_get,
+                (self, issue_id),
+                auth,
+                generation=await issue_generation(issue_id, "issue_get"),
+            )
+            state = WorkflowState.of(issue) if issue is not None else None
+            if state is None:
+                return await self._original.issue_get_transitions(issue_id, auth=auth)
+            return await self._transitions_in_state(state, auth=auth)
+
+        @cached_as("issues", "issue_get_transitions")
+        async def _transitions_in_state(
+            self, state: WorkflowState, *, auth: YandexAuth | None = None
+        ) -> list[IssueTransition]:
+            return await self._original.issue_get_transitions(state.issue_id, auth=auth)
 
         # Not cached: the changelog is an append-only, growing history. Caching the
         # first page (cursor=None) would keep serving a stale page that misses the
@@ -363,13 +812,15 @@ def make_cached_protocols(
             fields: dict[str, str | int | list[str]] | None = None,
             auth: YandexAuth | None = None,
         ) -> list[IssueTransition]:
-            return await self._original.issue_execute_transition(
+            result = await self._original.issue_execute_transition(
                 issue_id,
                 transition_id,
                 comment=comment,
                 fields=fields,
                 auth=auth,
             )
+            await self._invalidate("issue_execute_transition", [issue_id], auth)
+            return result
 
         async def issue_close(
             self,
@@ -380,13 +831,15 @@ def make_cached_protocols(
             fields: dict[str, str | int | list[str]] | None = None,
             auth: YandexAuth | None = None,
         ) -> list[IssueTransition]:
-            return await self._original.issue_close(
+            result = await self._original.issue_close(
                 issue_id,
                 resolution_id,
                 comment=comment,
                 fields=fields,
                 auth=auth,
             )
+            await self._invalidate("issue_close", [issue_id], auth)
+            return result
 
         async def issue_update(
             self,
@@ -408,7 +861,7 @@ def make_cached_protocols(
             auth: YandexAuth | None = None,
             **kwargs: Any,
         ) -> Issue:
-            return await self._original.issue_update(
+            result = await self._original.issue_update(
                 issue_id,
                 summary=summary,
                 description=description,
@@ -426,6 +879,8 @@ def make_cached_protocols(
                 auth=auth,
                 **kwargs,
             )
+            await self._invalidate("issue_update", [issue_id], auth)
+            return result
 
         async def issue_move(
             self,
@@ -438,7 +893,7 @@ def make_cached_protocols(
             initial_status: bool = False,
             auth: YandexAuth | None = None,
         ) -> Issue:
-            return await self._original.issue_move(
+            issue = await self._original.issue_move(
                 issue_id,
                 queue,
                 notify=notify,
@@ -447,38 +902,147 @@ def make_cached_protocols(
                 initial_status=initial_status,
                 auth=auth,
             )
+            # Entries of the old key go with the old queue's query results.
+            await self._invalidate("issue_move", [issue_id], auth, queues=[queue])
+            return issue
+
+        async def issues_bulk_update(
+            self,
+            issue_ids: list[str],
+            values: dict[str, Any],
+            *,
+            auth: YandexAuth | None = None,
+        ) -> BulkChange:
+            bulk_change = await self._original.issues_bulk_update(
+                issue_ids, values, auth=auth
+            )
+            await self._bulk_change_started(
+                bulk_change, "issues_bulk_update", issue_ids, auth, queues=[]
+            )
+            return bulk_change
+
+        async def issues_bulk_transition(
+            self,
+            issue_ids: list[str],
+            transition_id: str,
+            *,
+            comment: str | None = None,
+            fields: dict[str, str | int | list[str]] | None = None,
+            auth: YandexAuth | None = None,
+        ) -> BulkChange:
+            bulk_change = await self._original.issues_bulk_transition(
+                issue_ids, transition_id, comment=comment, fields=fields, auth=auth
+            )
+            await self._bulk_change_started(
+                bulk_change, "issues_bulk_transition", issue_ids, auth, queues=[]
+            )
+            return bulk_change
+
+        async def issues_bulk_move(
+            self,
+            issue_ids: list[str],
+            queue: str,
+            *,
+            move_all_fields: bool = False,
+            initial_status: bool = False,
+            auth: YandexAuth | None = None,
+        ) -> BulkChange:
+            bulk_change = await self._original.issues_bulk_move(
+                issue_ids,
+                queue,
+                move_all_fields=move_all_fields,
+                initial_status=initial_status,
+                auth=auth,
+            )
+            await self._bulk_change_started(
+                bulk_change, "issues_bulk_move", issue_ids, auth, queues=[queue]
+            )
+            return bulk_change
+
+        async def _bulk_change_started(
+            self,
+            bulk_change: BulkChange,
+            write: str,
+            issue_ids: list[str],
+            auth: YandexAuth | None,
+            *,
+            queues: list[str],
+        ) -> None:
+            await self._invalidate(write, issue_ids, auth, queues=queues)
+            if bulk_change.finished:
+                return
+            try:
+                await bulk_changes.add(bulk_change.id, write, issue_ids, queues)
+            except Exception:
+                logger.exception("Failed to track bulk change %s", bulk_change.id)
+
+        async def _bulk_change_seen(
+            self, bulk_change: BulkChange, auth: YandexAuth | None
+        ) -> None:
+            """Invalidate the issues of a finished job once more."""
+            if not bulk_change.finished:
+                return
+            try:
+                pending = await bulk_changes.pop(bulk_change.id)
+            except Exception:
+                logger.exception("Failed to look up bulk change %s", bulk_change.id)
+                return
+            if pending is not None:
+                write, issue_ids, queues = pending
+                await self._invalidate(write, issue_ids, auth, queues=queues)
+
+        # Job status changes while it runs, so it is never cached.
+        async def bulkchange_get(
+            self, bulk_change_id: str, *, auth: YandexAuth | None = None
+        ) -> BulkChange:
+            bulk_change = await self._original.bulkchange_get(bulk_change_id, auth=auth)
+            await self._bulk_change_seen(bulk_change, auth)
+            return bulk_change
+
+        async def bulkchange_wait(
+            self,
+            bulk_change_id: str,
+            *,
+            timeout: float = 60.0,
+            auth: YandexAuth | None = None,
+        ) -> BulkChange:
+            bulk_change = await self._original.bulkchange_wait(
+                bulk_change_id, timeout=timeout, auth=auth
+            )
+            await self._bulk_change_seen(bulk_change, auth)
+            return bulk_change
 
     class CachingGlobalDataProtocol(GlobalDataProtocolWrap):
-        @cached(**cache_config)
+        @cached_as("global_data")
         async def get_global_fields(
             self, *, auth: YandexAuth | None = None
         ) -> list[GlobalField]:
             return await self._original.get_global_fields(auth=auth)
 
-        @cached(**cache_config)
+        @cached_as("global_data")
         async def get_statuses(self, *, auth: YandexAuth | None = None) -> list[Status]:
             return await self._original.get_statuses(auth=auth)
 
-        @cached(**cache_config)
+        @cached_as("global_data")
         async def get_issue_types(
             self, *, auth: YandexAuth | None = None
         ) -> list[IssueType]:
             return await self._original.get_issue_types(auth=auth)
 
-        @cached(**cache_config)
+        @cached_as("global_data")
         async def get_priorities(
             self, *, auth: YandexAuth | None = None
         ) -> list[Priority]:
             return await self._original.get_priorities(auth=auth)
 
-        @cached(**cache_config)
+        @cached_as("global_data")
         async def get_resolutions(
             self, *, auth: YandexAuth | None = None
         ) -> list[Resolution]:
             return await self._original.get_resolutions(auth=auth)
 
     class CachingUsersProtocol(UsersProtocolWrap):
-        @cached(**cache_config)
+        @cached_as("users")
         async def users_list(
             self, per_page: int = 50, page: int = 1, *, auth: YandexAuth | None = None
         ) -> list[User]:
@@ -486,13 +1050,13 @@ def make_cached_protocols(
                 per_page=per_page, page=page, auth=auth
             )
 
-        @cached(**cache_config)
+        @cached_as("users")
         async def user_get(
             self, user_id: str, *, auth: YandexAuth | None = None
         ) -> User | None:
             return await self._original.user_get(user_id, auth=auth)
 
-        @cached(**cache_config)
+        @cached_as("users")
         async def user_get_current(self, *, auth: YandexAuth | None = None) -> User:
             return await self._original.user_get_current(auth=auth)
 
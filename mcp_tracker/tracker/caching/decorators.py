@@ -0,0 +1,166 @@
+"""The `@cached` decorator of the caching protocols."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from aiocache import cached
+
+from mcp_tracker.tracker.caching.local import LocalCache, LocalCacheSync, TieredCache
+
+logger = logging.getLogger(__name__)
+
+FRESH_SUFFIX = ":fresh"
+REFRESH_LOCK_SUFFIX = ":refresh"
+
+
+class cached_method(cached):
+    """`@cached` with the local cache and stale-while-revalidate mode.
+
+    A ``ttl`` of 0 leaves the method uncached. With a ``local`` cache, the
+    backend is put behind it, keeping entries loaded with ``local_objects``.
+
+    With ``stale_ttl``, entries are fresh for ``ttl`` seconds and are served
+    stale for ``stale_ttl`` more while one background refresh brings them up
+    to date: one per process, and one across replicas thanks to a lock in the
+    backend. A failed refresh keeps serving the stale entry, so a Tracker blip
+    degrades to slightly old results instead of failed calls, and is retried
+    after ``retry_delay`` seconds.
+    """
+
+    cache: Any
+
+    def __init__(
+        self,
+        *,
+        local: LocalCache | None = None,
+        local_sync: LocalCacheSync | None = None,
+        local_objects: bool = False,
+        stale_ttl: int = 0,
+        retry_delay: int = 30,
+        lock_ttl: int = 30,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self._local = local
+        self._local_sync = local_sync
+        self._local_objects = local_objects
+        # Entries that never expire never go stale either.
+        self.stale_ttl = stale_ttl if self.ttl else 0
+        self.retry_delay = retry_delay
+        self.lock_ttl = lock_ttl
+        self._refreshes: dict[str, asyncio.Task[None]] = {}
+
+    def __call__(self, f: Callable[..., Any]) -> Callable[..., Any]:
+        if self.ttl == 0:
+            return f
+        wrapper = super().__call__(f)
+        if self._local is not None:
+            self.cache = TieredCache(
+                self.cache,
+                self._local,
+                self._local_sync,
+                objects=self._local_objects,
+            )
+            wrapper.cache = self.cache  # type: ignore[attr-defined]
+        return wrapper
+
+    async def decorator(
+        self,
+        f: Callable[..., Any],
+        *args: Any,
+        cache_read: bool = True,
+        cache_write: bool = True,
+        aiocache_wait_for_write: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        if not self.stale_ttl:
+            return await super().decorator(
+                f,
+                *args,
+                cache_read=cache_read,
+                cache_write=cache_write,
+                aiocache_wait_for_write=aiocache_wait_for_write,
+                **kwargs,
+            )
+
+        key = self.get_cache_key(f, args, kwargs)
+        if cache_read:
+            value, fresh = await self._get_entry(key)
+            if value is not None:
+                if not fresh:
+                    self._schedule_refresh(key, f, args, kwargs)
+                return value
+
+        result = await f(*args, **kwargs)
+        if cache_write and not self.skip_cache_func(result):
+            await self.set_in_cache(key, result)
+        return result
+
+    async def set_in_cache(self, key: str, value: Any) -> None:
+        if not self.stale_ttl:
+            await super().set_in_cache(key, value)
+            return
+        try:
+            await self.cache.set(key, value, ttl=self.ttl + self.stale_ttl)
+            await self.cache.set(key + FRESH_SUFFIX, True, ttl=self.ttl)
+        except Exception:
+            logger.exception("Couldn't set %s, unexpected error", key)
+
+    async def _get_entry(self, key: str) -> tuple[Any, bool]:
+        try:
+            value, fresh = await asyncio.gather(
+                self.cache.get(key), self.cache.get(key + FRESH_SUFFIX)
+            )
+        except Exception:
+            logger.exception("Couldn't retrieve %s, unexpected error", key)
+            return None, False
+        return value, fresh is not None
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        f: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        if key in self._refreshes:
+            return
+        task = asyncio.create_task(self._refresh(key, f, args, kwargs))
+        self._refreshes[key] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(key, None))
+
+    async def _refresh(
+        self,
+        key: str,
+        f: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        backend = getattr(self.cache, "backend", self.cache)
+        lock = key + REFRESH_LOCK_SUFFIX
+        try:
+            await backend.add(lock, True, ttl=self.lock_ttl)
+        except ValueError:
+            return  # Another replica is refreshing it
+        except Exception:
+            logger.exception("Couldn't lock %s for refresh", key)
+            return
+
+        try:
+            result = await f(*args, **kwargs)
+        except Exception as e:
+            logger.warning("Serving stale %s, refresh failed: %s", f.__name__, e)
+            try:
+                await self.cache.set(key + FRESH_SUFFIX, True, ttl=self.retry_delay)
+            except Exception:
+                logger.exception("Couldn't postpone refresh of %s", key)
+        else:
+            if not self.skip_cache_func(result):
+                await self.set_in_cache(key, result)
+        finally:
+            try:
+                await backend.delete(lock)
+            except Exception:
+                logger.exception("Couldn't unlock %s", key)
@@ -0,0 +1,186 @@
+"""Which cached reads each write of the caching protocols makes stale."""
+
+import re
+import uuid
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from aiocache import cached
+from aiocache.base import BaseCache
+
+# Cached reads keyed by a single issue id.
+ISSUE_READS = (
+    "issue_get",
+    "issues_get_links",
+    "issue_get_comments",
+    "issue_get_worklogs",
+    "issue_get_attachments",
+    "issue_get_checklist",
+)
+
+# Per-issue reads dropped by each issue write, for the issues it changes. Every
+# write also changes the issue itself (at least its `updatedAt`), so issue_get is
+# always included, and it bumps the generation of the issue's queue.
+ISSUE_WRITE_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "issue_update": ("issue_get",),
+    "issue_add_comment": ("issue_get", "issue_get_comments"),
+    "issue_update_comment": ("issue_get", "issue_get_comments"),
+    "issue_delete_comment": ("issue_get", "issue_get_comments"),
+    "issue_add_link": ("issue_get", "issues_get_links"),
+    "issue_delete_link": ("issue_get", "issues_get_links"),
+    "issue_add_worklog": ("issue_get", "issue_get_worklogs"),
+    "issue_update_worklog": ("issue_get", "issue_get_worklogs"),
+    "issue_delete_worklog": ("issue_get", "issue_get_worklogs"),
+    "issue_execute_transition": ("issue_get",),
+    "issue_close": ("issue_get",),
+    "issue_move": ISSUE_READS,
+    "issues_bulk_update": ("issue_get",),
+    "issues_bulk_transition": ("issue_get",),
+    "issues_bulk_move": ISSUE_READS,
+}
+
+# Per-queue reads dropped by each queue write, keyed by generation like per-issue
+# reads so that the copies of every user are dropped.
+QUEUE_WRITE_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "queue_create_version": ("queues_get_versions",),
+}
+
+# Generation tags. Query results depend on the queues a query names, or on every
+# issue when it names none; per-issue reads depend on their issue. Keying those
+# by generation rather than deleting them drops the copies of every user at once.
+ALL_ISSUES_TAG = "issues"
+
+_QUEUE_FILTER = re.compile(
+    r"\bqueue\s*:\s*((?:\"[^\"]*\"|[^\s,\"]+)(?:\s*,\s*(?:\"[^\"]*\"|[^\s,\"]+))*)",
+    re.IGNORECASE,
+)
+_OR = re.compile(r"\bor\b", re.IGNORECASE)
+
+
+# Tracker matches queue keys and issue keys case-insensitively, so tags use
+# their upper case: `test-1` and `TEST-1` are the same issue of queue `TEST`.
+def queue_tag(queue: str) -> str:
+    return f"queue:{queue.upper()}"
+
+
+def issue_tag(issue_id: str) -> str:
+    return f"issue:{issue_id.upper()}"
+
+
+def issue_queue(issue_id: str) -> str:
+    return issue_id.split("-")[0].upper()
+
+
+def queue_read_tag(queue: str, read: str) -> str:
+    """Tag of the cached ``read`` of a queue."""
+    return f"{queue_tag(queue)}/{read}"
+
+
+def issue_read_tag(issue_id: str, read: str = "issue_get") -> str:
+    """Tag of the cached ``read`` of an issue, the issue tag for issue_get."""
+    tag = issue_tag(issue_id)
+    return tag if read == "issue_get" else f"{tag}/{read}"
+
+
+def query_tags(query: str) -> tuple[str, ...]:
+    """Tags of the issues a query can match.
+
+    A query limited to some queues (`Queue: A, "B"`) depends on those queues
+    only. Anything less certain - no queue filter, negated queues or an `OR`
+    that may widen the filter - depends on all issues.
+    """
+    queues: list[str] = []
+    for match in _QUEUE_FILTER.finditer(query):
+        for value in match.group(1).split(","):
+            queue = value.strip().strip('"')
+            if not queue or queue.startswith("!"):
+                return (ALL_ISSUES_TAG,)
+            queues.append(queue)
+    if not queues or _OR.search(query):
+        return (ALL_ISSUES_TAG,)
+    return tuple(sorted({queue_tag(queue) for queue in queues}))
+
+
+def issue_write_tags(
+    issue_ids: Iterable[str],
+    queues: Iterable[str] = (),
+    reads: Iterable[str] = ("issue_get",),
+) -> set[str]:
+    """Tags bumped by a write changing ``reads`` of ``issue_ids``.
+
+    The write possibly moves the issues into ``queues``.
+    """
+    reads = tuple(reads)
+    tags = {ALL_ISSUES_TAG, *(queue_tag(queue) for queue in queues)}
+    for issue_id in issue_ids:
+        tags.update(issue_read_tag(issue_id, read) for read in reads)
+        tags.add(queue_tag(issue_queue(issue_id)))
+    return tags
+
+
+def cache_backend(cache_config: dict[str, Any]) -> BaseCache:
+    """The cache backend `@cached(**cache_config)` decorates functions with."""
+
+    async def noop() -> None: ...
+
+    return cached(**cache_config)(noop).cache
+
+
+class Generations:
+    """Opaque generation tokens of tags, kept in the cache backend.
+
+    A cached result depending on a tag has the current token of the tag in its
+    key. Bumping the tag replaces the token, so that result is never looked up
+    again and expires with its TTL. Tokens live at least as long as the entries
+    keyed by them: an expired token must not resurrect entries of an older one.
+    """
+
+    PREFIX = "mcp_tracker:generation:"
+
+    def __init__(self, cache: BaseCache, *, ttl: int | None = None):
+        self._cache = cache
+        self._ttl = ttl
+
+    async def tokens(self, tags: Sequence[str]) -> tuple[str | None, ...]:
+        values = await self._cache.multi_get([self.PREFIX + tag for tag in tags])
+        return tuple(values)
+
+    async def bump(self, tags: Iterable[str]) -> None:
+        pairs = [(self.PREFIX + tag, uuid.uuid4().hex) for tag in sorted(set(tags))]
+        if pairs:
+            await self._cache.multi_set(pairs, ttl=self._ttl)
+
+
+class PendingBulkChanges:
+    """Bulk change jobs that may still be changing their issues.
+
+    Tracker applies bulk changes asynchronously: reads made while a job runs
+    cache the old values again, so the issues of a job are invalidated once
+    more when it is seen finished. Jobs are kept in the cache backend, so the
+    replica that sees a job finish need not be the one that started it.
+    """
+
+    PREFIX = "mcp_tracker:bulkchange:"
+    # Jobs nobody waits for are forgotten after a day.
+    TTL = 24 * 3600
+
+    def __init__(self, cache: BaseCache):
+        self._cache = cache
+
+    async def add(
+        self,
+        bulk_change_id: str,
+        write: str,
+        issue_ids: Sequence[str],
+        queues: Sequence[str] = (),
+    ) -> None:
+        value = {"write": write, "issue_ids": list(issue_ids), "queues": list(queues)}
+        await self._cache.set(self.PREFIX + bulk_change_id, value, ttl=self.TTL)
+
+    async def pop(self, bulk_change_id: str) -> tuple[str, list[str], list[str]] | None:
+        key = self.PREFIX + bulk_change_id
+        value = await self._cache.get(key)
+        if value is None:
+            return None
+        await self._cache.delete(key)
+        return value["write"], value["issue_ids"], value["queues"]
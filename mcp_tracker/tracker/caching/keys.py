@@ -0,0 +1,122 @@
+"""Cache keys of the caching protocols."""
+
+import dataclasses
+import datetime
+import functools
+import hashlib
+import inspect
+import json
+from collections.abc import Callable, Mapping
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+from mcp_tracker.tracker.caching.serializers import proto_models
+from mcp_tracker.tracker.proto.common import YandexAuth
+
+KEY_PREFIX = "mcp_tracker"
+# Bump when keys or cached values change in a way the schema hash does not see.
+KEY_VERSION = 1
+
+# Organization-wide dictionaries: the same for everybody in an organization, so
+# their results are shared by all users of it.
+ORG_SCOPED_METHODS = frozenset(
+    {
+        "get_global_fields",
+        "get_statuses",
+        "get_issue_types",
+        "get_priorities",
+        "get_resolutions",
+    }
+)
+
+# Calls without auth use the credentials the server is configured with.
+DEFAULT_SCOPE = "default"
+
+
+def auth_scope(auth: YandexAuth | None, *, org_wide: bool = False) -> str:
+    """The part of a cache key telling whose results it holds.
+
+    Org-wide results are scoped by the organization ids only. Anything else
+    depends on what the user may see, so it is scoped by a hash of the token
+    and the organization: raw tokens never end up in key names.
+    """
+    if auth is None:
+        return DEFAULT_SCOPE
+    org = f"{auth.org_id or ''}/{auth.cloud_org_id or ''}"
+    if org_wide:
+        return f"org:{org}"
+    identity = f"{auth.token or ''}\0{org}".encode()
+    return f"user:{hashlib.sha256(identity).hexdigest()[:32]}"
+
+
+@functools.cache
+def schema_hash() -> str:
+    """Short hash of the fields of every model in `proto.types`.
+
+    It is a part of every key, so entries cached by a build with other models
+    are never read back: a changed model simply misses the cache.
+    """
+    parts: list[str] = []
+    for name, model in proto_models().items():
+        fields = [
+            (field_name, repr(field.annotation), field.alias)
+            for field_name, field in model.model_fields.items()
+        ]
+        parts.append(f"{model.__module__}.{name}{fields}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:8]
+
+
+def normalize(value: Any) -> Any:
+    """A JSON-serializable form of an argument that is equal for equal values."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, Enum):
+        return normalize(value.value)
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return normalize(value.model_dump(mode="json"))
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: normalize(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+            if field.compare
+        }
+    if isinstance(value, Mapping):
+        return {str(key): normalize(item) for key, item in sorted(value.items())}
+    if isinstance(value, list | tuple | set | frozenset):
+        items = [normalize(item) for item in value]
+        return sorted(items, key=repr) if isinstance(value, set | frozenset) else items
+    return repr(value)
+
+
+@functools.cache
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def key_builder(*, noself: bool = False) -> Callable[..., str]:
+    """An aiocache `key_builder` of compact, fixed-length keys.
+
+    Keys look like ``mcp_tracker:v1:<schema>:issue_get:<digest>``. The digest
+    hashes the normalized arguments, with defaults applied so that equivalent
+    calls share a key, and the `auth_scope` of the call in place of its auth.
+    ``self`` is left out when ``noself``.
+    """
+
+    def build(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+        bound = _signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        auth = arguments.pop("auth", None)
+        if noself:
+            arguments.pop("self", None)
+        scope = auth_scope(auth, org_wide=func.__name__ in ORG_SCOPED_METHODS)
+        payload = json.dumps([normalize(arguments), scope], sort_keys=True)
+        digest = hashlib.sha256(payload.encode()).hexdigest()[:32]
+        method = func.__name__.lstrip("_")
+        return f"{KEY_PREFIX}:v{KEY_VERSION}:{schema_hash()}:{method}:{digest}"
+
+    return build
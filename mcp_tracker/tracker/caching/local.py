@@ -0,0 +1,300 @@
+"""In-process cache in front of the Redis cache of the caching protocols."""
+
+import asyncio
+import copy
+import dataclasses
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from aiocache.base import BaseCache
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "mcp_tracker:cache:invalidate"
+RECONNECT_DELAY = 1.0
+
+
+@dataclass
+class LocalCacheStats:
+    """Counters of the local cache.
+
+    ``evictions`` are entries dropped to stay within the size bound and
+    ``invalidations`` are entries dropped because they were written or deleted,
+    here or by another replica.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    def snapshot(self) -> "LocalCacheStats":
+        return dataclasses.replace(self)
+
+
+def shallow_copy(value: Any) -> Any:
+    """Copy of a cached object its caller may modify without touching the cache.
+
+    Lists are copied. Frozen models cannot be modified and are shared, other
+    models are copied field by field with their nested values shared.
+    """
+    if isinstance(value, BaseModel):
+        return value if value.model_config.get("frozen") else value.model_copy()
+    if isinstance(value, list):
+        return [shallow_copy(item) for item in value]
+    return copy.copy(value)
+
+
+class LocalCache:
+    """Bounded in-memory copy of recently read cache entries.
+
+    Entries are kept as `TieredCache` stores them, serialized or as objects, and
+    are accounted at their serialized ``size``. At most ``max_bytes`` of them
+    are kept, least recently used first out, each for at most ``ttl`` seconds.
+
+    ``epoch`` changes on every invalidation, so a read that started before one
+    can tell that its result must not be stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Any, int]] = OrderedDict()
+        self._size = 0
+        self._epoch = 0
+        self._stats = LocalCacheStats()
+
+    @property
+    def stats(self) -> LocalCacheStats:
+        return self._stats.snapshot()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() >= entry[0]:
+            self._pop(key)
+            entry = None
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        *,
+        size: int | None = None,
+        ttl: float | None = None,
+        epoch: int | None = None,
+    ) -> None:
+        """Store the value of ``key`` for ``ttl`` seconds at most.
+
+        ``size`` defaults to the length of the serialized ``value``. Nothing is
+        stored when the cache was invalidated since ``epoch``.
+        """
+        if epoch is not None and epoch != self._epoch:
+            return
+        self._pop(key)
+        if size is None:
+            size = len(value)
+        if size > self._max_bytes:
+            return
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        self._entries[key] = (self._clock() + ttl, value, size)
+        self._size += size
+        while self._size > self._max_bytes:
+            _, (_, _, evicted) = self._entries.popitem(last=False)
+            self._size -= evicted
+            self._stats.evictions += 1
+
+    def invalidate(self, keys: Sequence[str]) -> None:
+        self._epoch += 1
+        for key in keys:
+            if self._pop(key):
+                self._stats.invalidations += 1
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._entries.clear()
+        self._size = 0
+
+    def _pop(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._size -= entry[2]
+        return True
+
+
+class LocalCacheSync:
+    """Keeps the local caches of all replicas consistent over Redis pub/sub.
+
+    Keys written or deleted by one replica are published on ``channel``, and
+    every other replica drops them from its local cache. Messages published
+    while the subscription is down are lost, so the local cache is cleared
+    whenever it is (re)established.
+    """
+
+    def __init__(self, client: Any, local: LocalCache, *, channel: str = CHANNEL):
+        self._client = client
+        self._local = local
+        self._channel = channel
+        self._origin = uuid.uuid4().hex
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def local(self) -> LocalCache:
+        return self._local
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        logger.info("Tools local cache stats: %s", self._local.stats)
+
+    async def publish(self, keys: Sequence[str]) -> None:
+        message = json.dumps({"origin": self._origin, "keys": list(keys)})
+        await self._client.publish(self._channel, message)
+
+    def handle(self, message: dict[str, Any]) -> None:
+        if message.get("type") != "message":
+            return
+        payload = json.loads(message["data"])
+        if payload["origin"] != self._origin:
+            self._local.invalidate(payload["keys"])
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    self._local.clear()
+                    async for message in pubsub.listen():
+                        self.handle(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning(
+                    "Local cache invalidation channel failed, resubscribing",
+                    exc_info=True,
+                )
+            self._local.clear()
+            await asyncio.sleep(RECONNECT_DELAY)
+
+
+class TieredCache:
+    """The cache backend of a cached method with a `LocalCache` in front of it.
+
+    Exposes the part of the aiocache interface `@cached` and the invalidation of
+    the caching protocols use. Reads are served locally when possible; writes
+    and deletes go to the backend and are published to the other replicas.
+
+    Local entries are kept serialized and loaded on every hit, so callers get a
+    fresh object they may modify. With ``objects`` they are kept loaded and
+    every hit gets a `shallow_copy` instead, which skips deserialization; it
+    only pays off for frozen models, copying others costs about as much.
+    """
+
+    def __init__(
+        self,
+        backend: BaseCache,
+        local: LocalCache,
+        sync: LocalCacheSync | None = None,
+        *,
+        objects: bool = False,
+    ):
+        self._backend = backend
+        self._local = local
+        self._sync = sync
+        self._objects = objects
+
+    @property
+    def backend(self) -> BaseCache:
+        return self._backend
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        loads = self._backend.serializer.loads
+        entry = self._local.get(key)
+        if entry is not None:
+            return shallow_copy(entry) if self._objects else loads(entry)
+
+        epoch = self._local.epoch
+        read: list[Any] = []
+
+        def keep_raw(value: Any) -> Any:
+            read.append(value)
+            return loads(value)
+
+        value = await self._backend.get(key, loads_fn=keep_raw)
+        if value is None:
+            return default
+        self._store(key, value, read[0], epoch=epoch)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        written: list[Any] = []
+
+        def keep_raw(value: Any) -> Any:
+            written.append(self._backend.serializer.dumps(value))
+            return written[0]
+
+        result = await self._backend.set(key, value, ttl=ttl, dumps_fn=keep_raw)
+        await self._publish([key])
+        self._store(key, value, written[0], ttl=ttl or None)
+        return result
+
+    async def delete(self, key: str) -> int:
+        result = await self._backend.delete(key)
+        await self._publish([key])
+        return result
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        raw: Any,
+        *,
+        ttl: float | None = None,
+        epoch: int | None = None,
+    ) -> None:
+        self._local.set(
+            key,
+            shallow_copy(value) if self._objects else raw,
+            size=len(raw),
+            ttl=ttl,
+            epoch=epoch,
+        )
+
+    async def _publish(self, keys: Sequence[str]) -> None:
+        self._local.invalidate(keys)
+        if self._sync is not None:
+            await self._sync.publish(keys)
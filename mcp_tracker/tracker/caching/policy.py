@@ -0,0 +1,66 @@
+"""How long each cached protocol method keeps its results."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+# Default TTLs in seconds by protocol and by method, picked by how often the data
+# changes. Organization-wide dictionaries are edited by admins only, issues change
+# all the time and query results go stale with any change of any matching issue.
+DEFAULT_TTLS: dict[str, int] = {
+    "global_data": 24 * 3600,
+    "queues": 3600,
+    "users": 3600,
+    "issues": 300,
+    "issues_find": 60,
+    "issues_count": 60,
+}
+
+# Methods served stale while they are refreshed, when a stale TTL is set: reads
+# an agent repeats often and that rarely change in a way that matters at once.
+DEFAULT_STALE_METHODS = frozenset({"queue_get", "queues_get_fields", "issue_get"})
+
+# Methods whose local cache entries are kept as objects rather than serialized:
+# frozen models read on nearly every tool call, shared by all hits.
+LOCAL_OBJECT_METHODS = frozenset({"get_statuses", "user_get_current"})
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """TTLs of cached protocol methods.
+
+    ``ttls`` and then ``defaults`` are looked up by method name first and by
+    protocol name (``queues``, ``issues``, ``global_data``, ``users``) second;
+    anything not found there lives for ``default_ttl`` (None never expires).
+    A TTL of 0 disables caching of the method, so ``{"issues_find": 0}`` always
+    runs queries against Tracker.
+
+    Entries of ``stale_methods`` (method or protocol names) outlive their TTL by
+    ``stale_ttl`` seconds, during which they are served stale while refreshed.
+    """
+
+    default_ttl: int | None = None
+    ttls: Mapping[str, int] = field(default_factory=dict)
+    defaults: Mapping[str, int] = field(default_factory=lambda: dict(DEFAULT_TTLS))
+    stale_ttl: int = 0
+    stale_methods: frozenset[str] = DEFAULT_STALE_METHODS
+
+    def ttl(self, protocol: str, method: str) -> int | None:
+        for ttls in (self.ttls, self.defaults):
+            for name in (method, protocol):
+                if name in ttls:
+                    return ttls[name]
+        return self.default_ttl
+
+    def stale(self, protocol: str, method: str) -> int:
+        """How long entries of ``method`` are served stale after their TTL."""
+        if {protocol, method} & self.stale_methods:
+            return self.stale_ttl
+        return 0
+
+    @property
+    def max_ttl(self) -> int | None:
+        """Upper bound of every TTL of the policy, None when some never expire."""
+        if self.default_ttl is None:
+            return None
+        ttls = [self.default_ttl, *self.ttls.values(), *self.defaults.values()]
+        return max(ttls) + self.stale_ttl
@@ -0,0 +1,121 @@
+"""Serializers of cached protocol results."""
+
+import functools
+import importlib
+import logging
+import pkgutil
+import zlib
+from typing import Any
+
+from aiocache.serializers import BaseSerializer
+from pydantic import BaseModel, TypeAdapter
+
+from mcp_tracker.tracker.proto import types
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"mt1"
+RAW = b"j"
+ZLIB = b"z"
+
+
+@functools.cache
+def proto_models() -> dict[str, type[BaseModel]]:
+    """Models defined in `proto.types`, by class name."""
+    models: dict[str, type[BaseModel]] = {}
+    for module_info in sorted(
+        pkgutil.iter_modules(types.__path__), key=lambda info: info.name
+    ):
+        module = importlib.import_module(f"{types.__name__}.{module_info.name}")
+        for name, obj in vars(module).items():
+            if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+                continue
+            if obj.__module__ == module.__name__:
+                models[name] = obj
+    return dict(sorted(models.items()))
+
+
+def type_tag(value: Any) -> str:
+    """Tag of the type ``value`` is loaded back as.
+
+    ``Issue`` for a model, ``list[Issue]`` for a list of them and an empty tag
+    for plain JSON values. Only models of `proto.types` can be stored.
+    """
+    if isinstance(value, BaseModel):
+        return _model_name(value)
+    if isinstance(value, list) and any(isinstance(item, BaseModel) for item in value):
+        names = {_model_name(item) for item in value}
+        if len(names) > 1:
+            raise TypeError(f"Cannot cache a list of mixed models: {sorted(names)}")
+        return f"list[{names.pop()}]"
+    return ""
+
+
+def _model_name(value: Any) -> str:
+    name = type(value).__name__
+    if proto_models().get(name) is not type(value):
+        raise TypeError(f"Cannot cache {type(value).__qualname__}")
+    return name
+
+
+@functools.cache
+def _adapter(tag: str) -> TypeAdapter[Any]:
+    if not tag:
+        return TypeAdapter(Any)
+    if tag.startswith("list[") and tag.endswith("]"):
+        return TypeAdapter(list[proto_models()[tag[5:-1]]])  # type: ignore[arg-type,misc]
+    return TypeAdapter(proto_models()[tag])
+
+
+class ModelSerializer(BaseSerializer):
+    """Stores models of `proto.types` as type-tagged JSON.
+
+    Values are dumped with `model_dump` semantics and loaded back with model
+    validation, so loading can only ever build those models - unlike pickle,
+    a shared Redis cannot be used to run code. Payloads of at least
+    ``compress_min_bytes`` are zlib-compressed; 0 disables compression.
+
+    Anything that cannot be loaded - entries of another format, or of a model
+    that no longer matches - loads as None, i.e. as a cache miss.
+    """
+
+    DEFAULT_ENCODING = None
+
+    def __init__(
+        self,
+        *args: Any,
+        compress_min_bytes: int = 1024,
+        compress_level: int = 6,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.compress_min_bytes = compress_min_bytes
+        self.compress_level = compress_level
+
+    def dumps(self, value: Any) -> bytes:
+        tag = type_tag(value)
+        payload = (
+            tag.encode()
+            + b"\n"
+            + _adapter(tag).dump_json(value, by_alias=True, exclude_unset=True)
+        )
+        if 0 < self.compress_min_bytes <= len(payload):
+            return MAGIC + ZLIB + zlib.compress(payload, self.compress_level)
+        return MAGIC + RAW + payload
+
+    def loads(self, value: bytes | None) -> Any:
+        if value is None:
+            return None
+        try:
+            if value[: len(MAGIC)] != MAGIC:
+                raise ValueError("unknown format")
+            codec, payload = value[len(MAGIC) : len(MAGIC) + 1], value[len(MAGIC) + 1 :]
+            if codec == ZLIB:
+                payload = zlib.decompress(payload)
+            elif codec != RAW:
+                raise ValueError(f"unknown codec {codec!r}")
+            tag, _, body = payload.partition(b"\n")
+            return _adapter(tag.decode()).validate_json(body)
+        except Exception as e:
+            logger.debug("Treating unreadable cache entry as a miss: %s", e)
+            return None
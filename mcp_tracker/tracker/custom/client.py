@@ -1,25 +1,50 @@
 import asyncio
 import datetime
+import functools
 import logging
 import random
 import time
 from asyncio import CancelledError
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Coroutine, Mapping
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Literal
+from contextlib import asynccontextmanager
+from typing import Any, Concatenate, Literal, ParamSpec, TypeVar, cast
 
 import jwt
 import yandexcloud
-from aiohttp import ClientResponse, ClientSession, ClientTimeout
-from pydantic import BaseModel, RootModel
+from aiohttp import (
+    ClientConnectionError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    ClientTimeout,
+)
+from pydantic import AliasChoices, BaseModel, RootModel
 from yandex.cloud.iam.v1.iam_token_service_pb2 import CreateIamTokenRequest
 from yandex.cloud.iam.v1.iam_token_service_pb2_grpc import IamTokenServiceStub
 from yarl import URL
 
+from mcp_tracker.tracker.custom.conditional import (
+    ConditionalCache,
+    ConditionalCacheStats,
+)
 from mcp_tracker.tracker.custom.errors import IssueNotFound
+from mcp_tracker.tracker.custom.pool import ConnectionPoolSettings, ConnectionPoolStats
+from mcp_tracker.tracker.custom.ratelimit import AdaptiveRateLimiter, rate_limit_key
+from mcp_tracker.tracker.custom.retry import RetryPolicy, RetryStats, parse_retry_after
+from mcp_tracker.tracker.custom.singleflight import SingleFlight, SingleFlightStats
+from mcp_tracker.tracker.custom.streaming import iter_json_array
+from mcp_tracker.tracker.custom.workflow import (
+    WorkflowCache,
+    WorkflowCacheStats,
+    WorkflowState,
+)
 from mcp_tracker.tracker.proto.common import YandexAuth
 from mcp_tracker.tracker.proto.fields import GlobalDataProtocol
 from mcp_tracker.tracker.proto.issues import IssueProtocol
 from mcp_tracker.tracker.proto.queues import QueuesProtocol
+from mcp_tracker.tracker.proto.types.bulkchange import BulkChange
 from mcp_tracker.tracker.proto.types.fields import GlobalField, LocalField
 from mcp_tracker.tracker.proto.types.inputs import (
     IssueUpdateFollower,
@@ -36,9 +61,11 @@ from mcp_tracker.tracker.proto.types.issues import (
     ChecklistItem,
     Issue,
     IssueAttachment,
+    IssueBatch,
     IssueComment,
     IssueLink,
     IssueLinkRelationship,
+    IssueScrollPage,
     IssueTransition,
     Worklog,
 )
@@ -75,6 +102,90 @@ ChangelogList = RootModel[list[ChangelogEntry]]
 
 logger = logging.getLogger(__name__)
 
+# Methods that are safe to repeat; POST endpoints that only read data (such as
+# `_search`) opt in explicitly with `idempotent=True`.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Number of keys requested per `_search` call in `issues_get_many`.
+ISSUES_GET_MANY_CHUNK = 100
+
+# Pages requested concurrently by `queues_list_all` after the first one.
+QUEUES_PREFETCH_WINDOW = 4
+
+# Delays between bulk change status polls: doubled after every poll up to the max.
+BULKCHANGE_POLL_INITIAL = 0.5
+BULKCHANGE_POLL_MAX = 5.0
+
+# Responses to `_execute` meaning that the transition is not available to the
+# issue, as opposed to failures of the request itself.
+TRANSITION_REJECTED_STATUSES = frozenset({400, 409, 422})
+
+# Read size for streamed responses; bounds the buffered data besides one element.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+def api_fields(model: type[BaseModel], fields: list[str]) -> str:
+    """Build the `fields` query parameter selecting ``fields`` of ``model``.
+
+    Model attribute names are translated to the API's camelCase names, taken
+    from the first validation alias; unknown names are passed through as is.
+    """
+    names: list[str] = []
+    for name in fields:
+        info = model.model_fields.get(name)
+        alias = info.validation_alias if info is not None else None
+        if isinstance(alias, AliasChoices) and isinstance(alias.choices[0], str):
+            name = alias.choices[0]
+        elif isinstance(alias, str):
+            name = alias
+        names.append(name)
+    return ",".join(dict.fromkeys(names))
+
+
+def total_pages(headers: Mapping[str, str], per_page: int) -> int | None:
+    """Read the page count of a paginated list from its response headers.
+
+    Tracker announces it in ``X-Total-Pages``; ``X-Total-Count`` is used when
+    only the number of items is known.
+    """
+    try:
+        if (pages := headers.get("X-Total-Pages")) is not None:
+            return int(pages)
+        if (count := headers.get("X-Total-Count")) is not None:
+            return -(-int(count) // per_page)
+    except ValueError:
+        pass
+    return None
+
+
+def coalesced(
+    method: Callable[Concatenate["TrackerClient", P], Coroutine[Any, Any, T]],
+) -> Callable[Concatenate["TrackerClient", P], Coroutine[Any, Any, T]]:
+    """Coalesce concurrent identical calls of a read method into one request.
+
+    Calls are identical when they have the same method, arguments and resolved
+    auth headers, so different users never share a response.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "TrackerClient", *args: P.args, **kwargs: P.kwargs) -> T:
+        if self._single_flight is None:
+            return await method(self, *args, **kwargs)
+
+        headers = await self._build_headers(cast(YandexAuth | None, kwargs.get("auth")))
+        key = (
+            method.__name__,
+            repr(args),
+            repr(sorted((k, v) for k, v in kwargs.items() if k != "auth")),
+            tuple(sorted(headers.items())),
+        )
+        return await self._single_flight.do(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
 
 class ServiceAccountSettings(BaseModel):
     key_id: str
@@ -114,9 +225,19 @@ class ServiceAccountStore:
         self._iam_service = self._yc_sdk.client(IamTokenServiceStub)
         self._executor = ThreadPoolExecutor(max_workers=2)
         self._iam_token: IAMTokenInfo | None = None
+        self._generation = 0
         self._lock = asyncio.Lock()
         self._refresh_task: asyncio.Task[None] | None = None
 
+    @property
+    def generation(self) -> int:
+        """Number of IAM tokens fetched so far, changes on every rotation."""
+        return self._generation
+
+    @property
+    def service_account_id(self) -> str:
+        return self._settings.service_account_id
+
     async def prepare(self):
         self._refresh_task = asyncio.create_task(self._refresher())
 
@@ -142,6 +263,7 @@ class ServiceAccountStore:
                 )
 
                 self._iam_token = iam_token
+                self._generation += 1
                 logger.info("Successfully fetched new IAM token.")
 
         return self._iam_token.token
@@ -181,6 +303,8 @@ class ServiceAccountStore:
 
 
 class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProtocol):
+    HEADERS_CACHE_SIZE: int = 1024
+
     def __init__(
         self,
         *,
@@ -192,6 +316,12 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         cloud_org_id: str | None = None,
         base_url: str = "https://api.tracker.yandex.net",
         timeout: float = 10,
+        pool: ConnectionPoolSettings | None = None,
+        retry: RetryPolicy | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        coalesce_reads: bool = True,
+        conditional_cache: ConditionalCache | None = None,
+        workflow_cache: WorkflowCache | None = None,
     ):
         self._token = token
         self._token_type = token_type
@@ -201,22 +331,147 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         )
         self._org_id = org_id
         self._cloud_org_id = cloud_org_id
-
+        self._headers_cache: OrderedDict[
+            tuple[str | None, str | None, str | None], Mapping[str, str]
+        ] = OrderedDict()
+        self._headers_generation = 0
+
+        self._retry_policy = retry or RetryPolicy()
+        self._retry_stats = RetryStats()
+        self._rate_limiter = rate_limiter
+        self._single_flight = SingleFlight() if coalesce_reads else None
+        self._conditional_cache = conditional_cache
+        self._workflow_cache = workflow_cache
+        self._pool_settings = pool or ConnectionPoolSettings()
+        self._pool_stats = ConnectionPoolStats()
         self._session = ClientSession(
             base_url=base_url,
             timeout=ClientTimeout(total=timeout),
+            connector=self._pool_settings.make_connector(),
+            trace_configs=[self._pool_stats.make_trace_config()],
         )
 
+    @property
+    def pool_stats(self) -> ConnectionPoolStats:
+        return self._pool_stats.snapshot()
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        return self._retry_stats.snapshot()
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        if self._single_flight is None:
+            return SingleFlightStats()
+        return self._single_flight.stats
+
+    @property
+    def conditional_cache_stats(self) -> ConditionalCacheStats:
+        if self._conditional_cache is None:
+            return ConditionalCacheStats()
+        return self._conditional_cache.stats
+
+    @property
+    def workflow_cache_stats(self) -> WorkflowCacheStats:
+        if self._workflow_cache is None:
+            return WorkflowCacheStats()
+        return self._workflow_cache.stats
+
     async def prepare(self):
         if self._service_account_store:
             await self._service_account_store.prepare()
+        if self._pool_settings.warmup_connections > 0:
+            await self._warmup_connections(self._pool_settings.warmup_connections)
 
     async def close(self):
         if self._service_account_store:
             await self._service_account_store.close()
+        logger.info("Tracker connection pool stats: %s", self._pool_stats)
+        logger.info("Tracker retry stats: %s", self._retry_stats)
+        if self._single_flight is not None:
+            logger.info(
+                "Tracker request coalescing stats: %s", self._single_flight.stats
+            )
+        if self._conditional_cache is not None:
+            logger.info(
+                "Tracker conditional cache stats: %s", self._conditional_cache.stats
+            )
+        if self._workflow_cache is not None:
+            logger.info("Tracker workflow cache stats: %s", self._workflow_cache.stats)
+        if self._rate_limiter is not None:
+            logger.info("Tracker rate limiter stats: %s", self._rate_limiter.stats)
+            await self._rate_limiter.close()
         await self._session.close()
 
-    async def _build_headers(self, auth: YandexAuth | None = None) -> dict[str, str]:
+    async def _warmup_connections(self, count: int) -> None:
+        """Open ``count`` keep-alive connections to the API host in advance.
+
+        The probes are unauthenticated, so the response status is irrelevant: the
+        point is to pay for DNS resolution and the TLS handshake before the first
+        tool call does.
+        """
+
+        async def probe() -> None:
+            async with self._session.head("/") as response:
+                await response.release()
+
+        results = await asyncio.gather(
+            *(probe() for _ in range(count)), return_exceptions=True
+        )
+        failed = [r for r in results if isinstance(r, BaseException)]
+        if failed:
+            logger.warning(
+                "Failed to warm up %d of %d connections: %s",
+                len(failed),
+                count,
+                failed[0],
+            )
+
+    def _iam_token_generation(self) -> int:
+        store = self._service_account_store
+        return store.generation if store is not None else 0
+
+    async def _build_headers(self, auth: YandexAuth | None = None) -> Mapping[str, str]:
+        """Return the auth headers for ``auth``, memoized per identity.
+
+        The returned mapping is shared between calls and must not be mutated.
+        All memoized headers are dropped once the service account store rotates
+        its IAM token.
+        """
+        generation = self._iam_token_generation()
+        if generation != self._headers_generation:
+            self._headers_cache.clear()
+            self._headers_generation = generation
+
+        key = (
+            (auth.token, auth.org_id, auth.cloud_org_id) if auth else (None, None, None)
+        )
+        headers = self._headers_cache.get(key)
+        if headers is not None:
+            self._headers_cache.move_to_end(key)
+            return headers
+
+        headers = await self._make_headers(auth)
+        # A token rotated while the headers were built must not be memoized.
+        if self._iam_token_generation() == generation:
+            self._headers_cache[key] = headers
+            if len(self._headers_cache) > self.HEADERS_CACHE_SIZE:
+                self._headers_cache.popitem(last=False)
+        return headers
+
+    def _principal(self, auth: YandexAuth | None = None) -> str | None:
+        """Stable name of the credentials used for ``auth`` if their token rotates.
+
+        Only service account IAM tokens rotate; other tokens identify the caller
+        by themselves. Follows the priority of `_make_headers`.
+        """
+        if (auth and auth.token) or self._token or self._static_iam_token:
+            return None
+        if self._service_account_store is not None:
+            return f"service-account:{self._service_account_store.service_account_id}"
+        return None
+
+    async def _make_headers(self, auth: YandexAuth | None = None) -> dict[str, str]:
         # Priority: OAuth from auth > static OAuth > static IAM token > service account
         auth_header = None
 
@@ -258,42 +513,245 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
 
         return headers
 
+    @asynccontextmanager
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        auth: YandexAuth | None = None,
+        idempotent: bool | None = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ClientResponse]:
+        """Send a request to the Tracker API, retrying transient failures.
+
+        Only idempotent requests are retried: by default these are the methods in
+        `IDEMPOTENT_METHODS`, writes are sent exactly once. Every attempt first
+        waits for the rate limiter, if one is configured. The final response is
+        yielded as is, so callers keep handling statuses themselves. ``headers``
+        are sent in addition to the auth headers.
+        """
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        policy = self._retry_policy
+        headers = {**(await self._build_headers(auth)), **(headers or {})}
+        limiter = self._rate_limiter
+        limiter_key = (
+            rate_limit_key(headers, self._principal(auth))
+            if limiter is not None
+            else ""
+        )
+        deadline = time.monotonic() + policy.budget
+
+        attempt = 1
+        while True:
+            if limiter is not None:
+                await limiter.acquire(limiter_key)
+            try:
+                response = await self._session.request(
+                    method, url, headers=headers, **kwargs
+                )
+            except (ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = self._retry_delay(idempotent, attempt, deadline, None)
+                if delay is None:
+                    raise
+                reason = type(e).__name__
+            else:
+                if response.status == 429 and limiter is not None:
+                    await limiter.throttled(limiter_key)
+                if response.status not in policy.retry_statuses:
+                    break
+                delay = self._retry_delay(
+                    idempotent,
+                    attempt,
+                    deadline,
+                    parse_retry_after(response.headers.get("Retry-After")),
+                )
+                if delay is None:
+                    break
+                reason = str(response.status)
+                response.release()
+
+            self._retry_stats.record_retry(reason)
+            logger.warning(
+                "Retrying %s %s after %s in %.2fs (attempt %d of %d)",
+                method,
+                url,
+                reason,
+                delay,
+                attempt,
+                policy.max_attempts,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+        try:
+            yield response
+        finally:
+            response.release()
+
+    def _retry_delay(
+        self,
+        idempotent: bool,
+        attempt: int,
+        deadline: float,
+        retry_after: float | None,
+    ) -> float | None:
+        """Return the delay before the next attempt, or None to give up."""
+        if not idempotent:
+            return None
+        delay = self._retry_policy.next_delay(
+            attempt, deadline - time.monotonic(), retry_after
+        )
+        if delay is None:
+            self._retry_stats.gave_up += 1
+        return delay
+
+    async def _get_validated(
+        self,
+        url: str,
+        parse: Callable[[bytes], T],
+        *,
+        auth: YandexAuth | None = None,
+        params: dict[str, Any] | None = None,
+        not_found: Callable[[], Exception] | None = None,
+    ) -> T:
+        """GET ``url`` revalidating the previously parsed result, if any.
+
+        When a conditional cache is configured the request carries the stored
+        validators and a 304 response returns the stored object without
+        downloading or parsing the body again.
+        """
+        cache = self._conditional_cache
+        key: tuple[Any, ...] = ()
+        entry = None
+        if cache is not None:
+            identity = rate_limit_key(
+                await self._build_headers(auth), self._principal(auth)
+            )
+            key = (url, repr(sorted((params or {}).items())), identity)
+            entry = cache.lookup(key)
+
+        async with self._request(
+            "GET",
+            url,
+            auth=auth,
+            params=params,
+            headers=entry.validators if entry is not None else None,
+        ) as response:
+            if cache is not None and entry is not None and response.status == 304:
+                return cast(T, cache.not_modified(key, entry))
+            if response.status == 404 and not_found is not None:
+                raise not_found()
+            response.raise_for_status()
+            result = parse(await response.read())
+            if cache is not None:
+                cache.store(key, response.headers, result)
+            return result
+
+    @coalesced
     async def queues_list(
-        self, per_page: int = 100, page: int = 1, *, auth: YandexAuth | None = None
+        self,
+        per_page: int = 100,
+        page: int = 1,
+        *,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
     ) -> list[Queue]:
-        params = {
+        queues, _ = await self._queues_page(per_page, page, fields=fields, auth=auth)
+        return queues
+
+    @coalesced
+    async def queues_list_all(
+        self,
+        per_page: int = 100,
+        *,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
+    ) -> list[Queue]:
+        """Fetch the queues of every page.
+
+        The page count announced with the first page drives concurrent fetching
+        of the remaining ones, at most `QUEUES_PREFETCH_WINDOW` at a time. When
+        Tracker sends no totals, pages are read one by one until an empty one.
+        """
+        result, total_pages = await self._queues_page(
+            per_page, 1, fields=fields, auth=auth
+        )
+        if total_pages is None:
+            page = 1
+            queues = result
+            while queues:
+                page += 1
+                queues, _ = await self._queues_page(
+                    per_page, page, fields=fields, auth=auth
+                )
+                result.extend(queues)
+            return result
+
+        semaphore = asyncio.Semaphore(QUEUES_PREFETCH_WINDOW)
+
+        async def fetch(page: int) -> list[Queue]:
+            async with semaphore:
+                queues, _ = await self._queues_page(
+                    per_page, page, fields=fields, auth=auth
+                )
+                return queues
+
+        pages = await asyncio.gather(*(fetch(p) for p in range(2, total_pages + 1)))
+        for queues in pages:
+            result.extend(queues)
+        return result
+
+    async def _queues_page(
+        self,
+        per_page: int,
+        page: int,
+        *,
+        fields: list[str] | None,
+        auth: YandexAuth | None,
+    ) -> tuple[list[Queue], int | None]:
+        """Fetch one page of queues along with the total page count, if known."""
+        params: dict[str, Any] = {
             "perPage": per_page,
             "page": page,
         }
-        async with self._session.get(
-            "v3/queues", headers=await self._build_headers(auth), params=params
+        if fields is not None:
+            params["fields"] = api_fields(Queue, fields)
+        async with self._request(
+            "GET", "v3/queues", auth=auth, params=params
         ) as response:
             response.raise_for_status()
-            return QueueList.model_validate_json(await response.read()).root
+            queues = QueueList.model_validate_json(await response.read()).root
+            return queues, total_pages(response.headers, per_page)
 
+    @coalesced
     async def queues_get_local_fields(
         self, queue_id: str, *, auth: YandexAuth | None = None
     ) -> list[LocalField]:
-        async with self._session.get(
-            f"v3/queues/{queue_id}/localFields", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v3/queues/{queue_id}/localFields", auth=auth
         ) as response:
             response.raise_for_status()
             return LocalFieldList.model_validate_json(await response.read()).root
 
+    @coalesced
     async def queues_get_tags(
         self, queue_id: str, *, auth: YandexAuth | None = None
     ) -> list[str]:
-        async with self._session.get(
-            f"v3/queues/{queue_id}/tags", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v3/queues/{queue_id}/tags", auth=auth
         ) as response:
             response.raise_for_status()
             return QueueTagList.model_validate_json(await response.read()).root
 
+    @coalesced
     async def queues_get_versions(
         self, queue_id: str, *, auth: YandexAuth | None = None
     ) -> list[QueueVersion]:
-        async with self._session.get(
-            f"v3/queues/{queue_id}/versions", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v3/queues/{queue_id}/versions", auth=auth
         ) as response:
             response.raise_for_status()
             return VersionList.model_validate_json(await response.read()).root
@@ -316,23 +774,27 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         if due_date is not None:
             body["dueDate"] = due_date.isoformat()
 
-        async with self._session.post(
+        async with self._request(
+            "POST",
             "v3/versions/",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
         ) as response:
             response.raise_for_status()
             return QueueVersion.model_validate_json(await response.read())
 
+    @coalesced
     async def queues_get_fields(
         self, queue_id: str, *, auth: YandexAuth | None = None
     ) -> list[GlobalField]:
-        async with self._session.get(
-            f"v3/queues/{queue_id}/fields", headers=await self._build_headers(auth)
-        ) as response:
-            response.raise_for_status()
-            return GlobalFieldList.model_validate_json(await response.read()).root
+        fields = await self._get_validated(
+            f"v3/queues/{queue_id}/fields",
+            GlobalFieldList.model_validate_json,
+            auth=auth,
+        )
+        return fields.root
 
+    @coalesced
     async def queue_get(
         self,
         queue_id: str,
@@ -344,71 +806,78 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         if expand:
             params["expand"] = ",".join(expand)
 
-        async with self._session.get(
+        return await self._get_validated(
             f"v3/queues/{queue_id}",
-            headers=await self._build_headers(auth),
+            Queue.model_validate_json,
+            auth=auth,
             params=params if params else None,
-        ) as response:
-            response.raise_for_status()
-            return Queue.model_validate_json(await response.read())
+        )
 
+    @coalesced
     async def get_global_fields(
         self, *, auth: YandexAuth | None = None
     ) -> list[GlobalField]:
-        async with self._session.get(
-            "v3/fields", headers=await self._build_headers(auth)
-        ) as response:
-            response.raise_for_status()
-            return GlobalFieldList.model_validate_json(await response.read()).root
+        items = await self._get_validated(
+            "v3/fields", GlobalFieldList.model_validate_json, auth=auth
+        )
+        return items.root
 
+    @coalesced
     async def get_statuses(self, *, auth: YandexAuth | None = None) -> list[Status]:
-        async with self._session.get(
-            "v3/statuses", headers=await self._build_headers(auth)
-        ) as response:
-            response.raise_for_status()
-            return StatusList.model_validate_json(await response.read()).root
+        items = await self._get_validated(
+            "v3/statuses", StatusList.model_validate_json, auth=auth
+        )
+        return items.root
 
+    @coalesced
     async def get_issue_types(
         self, *, auth: YandexAuth | None = None
     ) -> list[IssueType]:
-        async with self._session.get(
-            "v3/issuetypes", headers=await self._build_headers(auth)
-        ) as response:
-            response.raise_for_status()
-            return IssueTypeList.model_validate_json(await response.read()).root
+        items = await self._get_validated(
+            "v3/issuetypes", IssueTypeList.model_validate_json, auth=auth
+        )
+        return items.root
 
+    @coalesced
     async def get_priorities(self, *, auth: YandexAuth | None = None) -> list[Priority]:
-        async with self._session.get(
-            "v3/priorities", headers=await self._build_headers(auth)
-        ) as response:
-            response.raise_for_status()
-            return PriorityList.model_validate_json(await response.read()).root
+        items = await self._get_validated(
+            "v3/priorities", PriorityList.model_validate_json, auth=auth
+        )
+        return items.root
 
+    @coalesced
     async def get_resolutions(
         self, *, auth: YandexAuth | None = None
     ) -> list[Resolution]:
-        async with self._session.get(
-            "v3/resolutions", headers=await self._build_headers(auth)
-        ) as response:
-            response.raise_for_status()
-            return ResolutionList.model_validate_json(await response.read()).root
+        items = await self._get_validated(
+            "v3/resolutions", ResolutionList.model_validate_json, auth=auth
+        )
+        return items.root
 
+    @coalesced
     async def issue_get(
-        self, issue_id: str, *, auth: YandexAuth | None = None
+        self,
+        issue_id: str,
+        *,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
     ) -> Issue:
-        async with self._session.get(
-            f"v3/issues/{issue_id}", headers=await self._build_headers(auth)
-        ) as response:
-            if response.status == 404:
-                raise IssueNotFound(issue_id)
-            response.raise_for_status()
-            return Issue.model_validate_json(await response.read())
+        return await self._get_validated(
+            f"v3/issues/{issue_id}",
+            Issue.model_validate_json,
+            auth=auth,
+            params={"fields": api_fields(Issue, fields)}
+            if fields is not None
+            else None,
+            not_found=lambda: IssueNotFound(issue_id),
+        )
 
+    @coalesced
     async def issues_get_links(
         self, issue_id: str, *, auth: YandexAuth | None = None
     ) -> list[IssueLink]:
-        async with self._session.get(
-            f"v3/issues/{issue_id}/links", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v3/issues/{issue_id}/links", auth=auth
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
@@ -426,9 +895,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         """Создать связь задачи с другой задачей."""
         body: dict[str, Any] = {"relationship": relationship, "issue": issue}
 
-        async with self._session.post(
+        async with self._request(
+            "POST",
             f"v3/issues/{issue_id}/links",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
         ) as response:
             if response.status == 404:
@@ -444,20 +914,22 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         auth: YandexAuth | None = None,
     ) -> None:
         """Удалить связь задачи с другой задачей."""
-        async with self._session.delete(
+        async with self._request(
+            "DELETE",
             f"v3/issues/{issue_id}/links/{link_id}",
-            headers=await self._build_headers(auth),
+            auth=auth,
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
             response.raise_for_status()
             return None
 
+    @coalesced
     async def issue_get_comments(
         self, issue_id: str, *, auth: YandexAuth | None = None
     ) -> list[IssueComment]:
-        async with self._session.get(
-            f"v3/issues/{issue_id}/comments", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v3/issues/{issue_id}/comments", auth=auth
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
@@ -488,9 +960,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         # Чтобы не менять URL (и поведение по умолчанию), передаём его только при false.
         params = {"isAddToFollowers": "false"} if not is_add_to_followers else None
 
-        async with self._session.post(
+        async with self._request(
+            "POST",
             f"v3/issues/{issue_id}/comments",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
             params=params,
         ) as response:
@@ -519,9 +992,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         if markup_type is not None:
             body["markupType"] = markup_type
 
-        async with self._session.patch(
+        async with self._request(
+            "PATCH",
             f"v3/issues/{issue_id}/comments/{comment_id}",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
         ) as response:
             if response.status == 404:
@@ -537,9 +1011,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         auth: YandexAuth | None = None,
     ) -> None:
         """Удалить комментарий из задачи."""
-        async with self._session.delete(
+        async with self._request(
+            "DELETE",
             f"v3/issues/{issue_id}/comments/{comment_id}",
-            headers=await self._build_headers(auth),
+            auth=auth,
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
@@ -552,31 +1027,188 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         *,
         per_page: int = 15,
         page: int = 1,
+        fields: list[str] | None = None,
         auth: YandexAuth | None = None,
     ) -> list[Issue]:
-        params = {
+        params: dict[str, Any] = {
             "perPage": per_page,
             "page": page,
         }
+        if fields is not None:
+            params["fields"] = api_fields(Issue, fields)
 
         body: dict[str, Any] = {
             "query": query,
         }
 
-        async with self._session.post(
+        async with self._request(
+            "POST",
             "v3/issues/_search",
-            headers=await self._build_headers(auth),
+            auth=auth,
+            idempotent=True,
             json=body,
             params=params,
         ) as response:
             response.raise_for_status()
             return IssueList.model_validate_json(await response.read()).root
 
+    async def issues_get_many(
+        self, keys: list[str], *, auth: YandexAuth | None = None
+    ) -> IssueBatch:
+        """Fetch issues by their keys using the `_search` endpoint's `keys` filter.
+
+        Keys are deduplicated and requested in chunks of `ISSUES_GET_MANY_CHUNK`
+        concurrently. Issues are returned in the order of ``keys``; keys that
+        matched no issue are reported in `IssueBatch.missing`.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        chunks = [
+            unique_keys[i : i + ISSUES_GET_MANY_CHUNK]
+            for i in range(0, len(unique_keys), ISSUES_GET_MANY_CHUNK)
+        ]
+
+        async def fetch(chunk: list[str]) -> list[Issue]:
+            async with self._request(
+                "POST",
+                "v3/issues/_search",
+                auth=auth,
+                idempotent=True,
+                json={"keys": chunk},
+                params={"perPage": len(chunk)},
+            ) as response:
+                response.raise_for_status()
+                return IssueList.model_validate_json(await response.read()).root
+
+        found: dict[str, Issue] = {}
+        for issues in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+            for issue in issues:
+                if issue.key is not None:
+                    found[issue.key.upper()] = issue
+
+        result = IssueBatch(issues=[])
+        for key in unique_keys:
+            match = found.get(key.upper())
+            if match is None:
+                result.missing.append(key)
+            else:
+                result.issues.append(match)
+        return result
+
+    async def issues_find_stream(
+        self,
+        query: str,
+        *,
+        per_page: int = 15,
+        page: int = 1,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
+    ) -> AsyncIterator[Issue]:
+        """Like `issues_find`, but parse issues one by one as the response arrives.
+
+        Only one issue is kept in memory at a time, and the first issues are
+        available before the whole page has been downloaded.
+        """
+        params: dict[str, Any] = {
+            "perPage": per_page,
+            "page": page,
+        }
+        if fields is not None:
+            params["fields"] = api_fields(Issue, fields)
+
+        body: dict[str, Any] = {
+            "query": query,
+        }
+
+        async with self._request(
+            "POST",
+            "v3/issues/_search",
+            auth=auth,
+            idempotent=True,
+            json=body,
+            params=params,
+        ) as response:
+            response.raise_for_status()
+            chunks = response.content.iter_chunked(STREAM_CHUNK_SIZE)
+            async for element in iter_json_array(chunks):
+                yield Issue.model_validate_json(element)
+
+    async def issues_scroll_page(
+        self,
+        query: str,
+        *,
+        per_scroll: int = 100,
+        scroll_id: str | None = None,
+        scroll_type: Literal["sorted", "unsorted"] = "sorted",
+        scroll_ttl_millis: int = 60000,
+        auth: YandexAuth | None = None,
+    ) -> IssueScrollPage:
+        params: dict[str, Any] = {
+            "perScroll": per_scroll,
+            "scrollTTLMillis": scroll_ttl_millis,
+        }
+        if scroll_id is None:
+            params["scrollType"] = scroll_type
+        else:
+            params["scrollId"] = scroll_id
+
+        body: dict[str, Any] = {
+            "query": query,
+        }
+
+        # Only the request opening a scroll is retried: repeating a continuation
+        # could advance the server-side cursor past a page that was never read.
+        async with self._request(
+            "POST",
+            "v3/issues/_search",
+            auth=auth,
+            idempotent=scroll_id is None,
+            json=body,
+            params=params,
+        ) as response:
+            response.raise_for_status()
+            issues = IssueList.model_validate_json(await response.read()).root
+            next_scroll_id = response.headers.get("X-Scroll-Id")
+            return IssueScrollPage(
+                issues=issues,
+                next_scroll_id=next_scroll_id if len(issues) >= per_scroll else None,
+            )
+
+    async def issues_scroll(
+        self,
+        query: str,
+        *,
+        per_scroll: int = 100,
+        scroll_type: Literal["sorted", "unsorted"] = "sorted",
+        scroll_ttl_millis: int = 60000,
+        auth: YandexAuth | None = None,
+    ) -> AsyncIterator[Issue]:
+        """Iterate over all issues matching ``query`` using scroll search.
+
+        Unlike page numbers, every scroll request costs the same no matter how
+        deep into the result set it is, so this suits exports of many issues.
+        """
+        scroll_id: str | None = None
+        while True:
+            page = await self.issues_scroll_page(
+                query,
+                per_scroll=per_scroll,
+                scroll_id=scroll_id,
+                scroll_type=scroll_type,
+                scroll_ttl_millis=scroll_ttl_millis,
+                auth=auth,
+            )
+            for issue in page.issues:
+                yield issue
+            if page.next_scroll_id is None:
+                return
+            scroll_id = page.next_scroll_id
+
+    @coalesced
     async def issue_get_worklogs(
         self, issue_id: str, *, auth: YandexAuth | None = None
     ) -> list[Worklog]:
-        async with self._session.get(
-            f"v3/issues/{issue_id}/worklog", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v3/issues/{issue_id}/worklog", auth=auth
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
@@ -612,9 +1244,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
             # Формат "+0000" (без двоеточия) совместим с API Трекера.
             body["start"] = start_utc.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
 
-        async with self._session.post(
+        async with self._request(
+            "POST",
             f"v3/issues/{issue_id}/worklog",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
         ) as response:
             if response.status == 404:
@@ -644,9 +1277,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
             start_utc = start.astimezone(datetime.timezone.utc)
             body["start"] = start_utc.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
 
-        async with self._session.patch(
+        async with self._request(
+            "PATCH",
             f"v3/issues/{issue_id}/worklog/{worklog_id}",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
         ) as response:
             if response.status == 404:
@@ -662,26 +1296,29 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         auth: YandexAuth | None = None,
     ) -> None:
         """Удалить запись трудозатрат (worklog) из задачи."""
-        async with self._session.delete(
+        async with self._request(
+            "DELETE",
             f"v3/issues/{issue_id}/worklog/{worklog_id}",
-            headers=await self._build_headers(auth),
+            auth=auth,
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
             response.raise_for_status()
             return None
 
+    @coalesced
     async def issue_get_attachments(
         self, issue_id: str, *, auth: YandexAuth | None = None
     ) -> list[IssueAttachment]:
-        async with self._session.get(
-            f"v3/issues/{issue_id}/attachments", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v3/issues/{issue_id}/attachments", auth=auth
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
             response.raise_for_status()
             return IssueAttachmentList.model_validate_json(await response.read()).root
 
+    @coalesced
     async def users_list(
         self, per_page: int = 50, page: int = 1, *, auth: YandexAuth | None = None
     ) -> list[User]:
@@ -689,36 +1326,36 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
             "perPage": per_page,
             "page": page,
         }
-        async with self._session.get(
-            "v3/users", headers=await self._build_headers(auth), params=params
+        async with self._request(
+            "GET", "v3/users", auth=auth, params=params
         ) as response:
             response.raise_for_status()
             return UserList.model_validate_json(await response.read()).root
 
+    @coalesced
     async def user_get(
         self, user_id: str, *, auth: YandexAuth | None = None
     ) -> User | None:
-        async with self._session.get(
-            f"v3/users/{user_id}", headers=await self._build_headers(auth)
-        ) as response:
+        async with self._request("GET", f"v3/users/{user_id}", auth=auth) as response:
             if response.status == 404:
                 return None
             response.raise_for_status()
             return User.model_validate_json(await response.read())
 
+    @coalesced
     async def user_get_current(self, *, auth: YandexAuth | None = None) -> User:
-        async with self._session.get(
-            "v3/myself", headers=await self._build_headers(auth)
-        ) as response:
+        async with self._request("GET", "v3/myself", auth=auth) as response:
             response.raise_for_status()
             return User.model_validate_json(await response.read())
 
+    @coalesced
     async def issue_get_checklist(
         self, issue_id: str, *, auth: YandexAuth | None = None
     ) -> list[ChecklistItem]:
-        async with self._session.get(
+        async with self._request(
+            "GET",
             f"v3/issues/{issue_id}/checklistItems",
-            headers=await self._build_headers(auth),
+            auth=auth,
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
@@ -730,8 +1367,8 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
             "query": query,
         }
 
-        async with self._session.post(
-            "v3/issues/_count", headers=await self._build_headers(auth), json=body
+        async with self._request(
+            "POST", "v3/issues/_count", auth=auth, idempotent=True, json=body
         ) as response:
             response.raise_for_status()
             return int(await response.text())
@@ -772,23 +1409,23 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
             if k not in body:
                 body[k] = v
 
-        async with self._session.post(
-            "v3/issues", headers=await self._build_headers(auth), json=body
-        ) as response:
+        async with self._request("POST", "v3/issues", auth=auth, json=body) as response:
             response.raise_for_status()
             return Issue.model_validate_json(await response.read())
 
+    @coalesced
     async def issue_get_transitions(
         self, issue_id: str, *, auth: YandexAuth | None = None
     ) -> list[IssueTransition]:
-        async with self._session.get(
-            f"v2/issues/{issue_id}/transitions", headers=await self._build_headers(auth)
+        async with self._request(
+            "GET", f"v2/issues/{issue_id}/transitions", auth=auth
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
             response.raise_for_status()
             return IssueTransitionList.model_validate_json(await response.read()).root
 
+    @coalesced
     async def issue_get_changelog(
         self,
         issue_id: str,
@@ -807,9 +1444,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         if type is not None:
             params["type"] = type
 
-        async with self._session.get(
+        async with self._request(
+            "GET",
             f"v3/issues/{issue_id}/changelog",
-            headers=await self._build_headers(auth),
+            auth=auth,
             params=params,
         ) as response:
             if response.status == 404:
@@ -852,9 +1490,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         if fields is not None:
             body.update(fields)
 
-        async with self._session.post(
+        async with self._request(
+            "POST",
             f"v3/issues/{issue_id}/transitions/{transition_id}/_execute",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
         ) as response:
             if response.status == 404:
@@ -871,47 +1510,92 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         fields: dict[str, str | int | list[str]] | None = None,
         auth: YandexAuth | None = None,
     ) -> list[IssueTransition]:
-        # Fetch transitions and statuses in parallel
-        async with asyncio.TaskGroup() as tg:
-            transitions_task = tg.create_task(
-                self.issue_get_transitions(issue_id, auth=auth)
-            )
-            statuses_task = tg.create_task(self.get_statuses(auth=auth))
+        if fields is None:
+            fields = {}
 
-        transitions = transitions_task.result()
-        statuses = statuses_task.result()
+        fields["resolution"] = resolution_id
 
-        # Build a map of status key -> status type
-        status_type_map: dict[str, str | None] = {
-            status.key: status.type for status in statuses
-        }
+        cache = self._workflow_cache
+        if cache is None:
+            transition_id = await self._find_done_transition(issue_id, auth=auth)
+            return await self.issue_execute_transition(
+                issue_id, transition_id, comment=comment, fields=fields, auth=auth
+            )
 
-        # Find a transition to a status with type="done"
-        done_transition: IssueTransition | None = None
-        for transition in transitions:
-            if transition.to and transition.to.key:
-                status_type = status_type_map.get(transition.to.key)
-                if status_type == "done":
-                    done_transition = transition
-                    break
+        headers = await self._build_headers(auth)
+        org = (headers.get("X-Org-ID"), headers.get("X-Cloud-Org-ID"))
+        issue = await self.issue_get(issue_id, fields=["type", "status"], auth=auth)
+        state: WorkflowState = (
+            issue_id.split("-")[0],
+            issue.type.key if issue.type is not None else None,
+            issue.status.key if issue.status is not None else None,
+        )
 
-        if done_transition is None:
-            raise ValueError(
-                f"No transition to a 'done' status found for issue {issue_id}. "
-                f"Available transitions: {[t.id for t in transitions]}."
-            )
+        guess = cache.done_transition(org, state)
+        if guess is None:
+            cache.record_miss()
+        else:
+            try:
+                result = await self.issue_execute_transition(
+                    issue_id, guess, comment=comment, fields=fields, auth=auth
+                )
+            except IssueNotFound:
+                # Tracker answers 404 for transitions unavailable to the issue.
+                pass
+            except ClientResponseError as e:
+                if e.status not in TRANSITION_REJECTED_STATUSES:
+                    raise
+            else:
+                cache.record_hit()
+                return result
+            cache.record_rejected()
+            cache.forget_done_transition(org, state)
+
+        transition_id = await self._find_done_transition(issue_id, org=org, auth=auth)
+        result = await self.issue_execute_transition(
+            issue_id, transition_id, comment=comment, fields=fields, auth=auth
+        )
+        cache.remember_done_transition(org, state, transition_id)
+        return result
 
-        if fields is None:
-            fields = {}
+    async def _find_done_transition(
+        self,
+        issue_id: str,
+        *,
+        org: tuple[str | None, str | None] | None = None,
+        auth: YandexAuth | None = None,
+    ) -> str:
+        """Return the id of a transition of the issue to a status of type "done".
 
-        fields["resolution"] = resolution_id
+        The status type map of ``org`` comes from the workflow cache when it
+        holds one; otherwise statuses are fetched along with the transitions.
+        """
+        cache = self._workflow_cache if org is not None else None
+        status_types = cache.status_types(org) if cache is not None else None
+        if status_types is None:
+            async with asyncio.TaskGroup() as tg:
+                transitions_task = tg.create_task(
+                    self.issue_get_transitions(issue_id, auth=auth)
+                )
+                statuses_task = tg.create_task(self.get_statuses(auth=auth))
+            transitions = transitions_task.result()
+            if cache is not None:
+                status_types = cache.store_statuses(org, statuses_task.result())
+            else:
+                status_types = {
+                    status.key: status.type for status in statuses_task.result()
+                }
+        else:
+            transitions = await self.issue_get_transitions(issue_id, auth=auth)
 
-        return await self.issue_execute_transition(
-            issue_id,
-            done_transition.id,
-            comment=comment,
-            fields=fields,
-            auth=auth,
+        for transition in transitions:
+            if transition.to and transition.to.key:
+                if status_types.get(transition.to.key) == "done":
+                    return transition.id
+
+        raise ValueError(
+            f"No transition to a 'done' status found for issue {issue_id}. "
+            f"Available transitions: {[t.id for t in transitions]}."
         )
 
     async def issue_update(
@@ -969,9 +1653,10 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         if version is not None:
             params["version"] = version
 
-        async with self._session.patch(
+        async with self._request(
+            "PATCH",
             f"v3/issues/{issue_id}",
-            headers=await self._build_headers(auth),
+            auth=auth,
             json=body,
             params=params if params else None,
         ) as response:
@@ -1001,12 +1686,97 @@ class TrackerClient(QueuesProtocol, IssueProtocol, GlobalDataProtocol, UsersProt
         if initial_status:
             params["initialStatus"] = "true"
 
-        async with self._session.post(
+        async with self._request(
+            "POST",
             f"v3/issues/{issue_id}/_move",
-            headers=await self._build_headers(auth),
+            auth=auth,
             params=params,
         ) as response:
             if response.status == 404:
                 raise IssueNotFound(issue_id)
             response.raise_for_status()
             return Issue.model_validate_json(await response.read())
+
+    async def issues_bulk_update(
+        self,
+        issue_ids: list[str],
+        values: dict[str, Any],
+        *,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange:
+        return await self._bulkchange(
+            "_update", {"issues": issue_ids, "values": values}, auth=auth
+        )
+
+    async def issues_bulk_transition(
+        self,
+        issue_ids: list[str],
+        transition_id: str,
+        *,
+        comment: str | None = None,
+        fields: dict[str, str | int | list[str]] | None = None,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange:
+        body: dict[str, Any] = {"transition": transition_id, "issues": issue_ids}
+        values: dict[str, Any] = dict(fields or {})
+        if comment is not None:
+            values["comment"] = comment
+        if values:
+            body["values"] = values
+        return await self._bulkchange("_transition", body, auth=auth)
+
+    async def issues_bulk_move(
+        self,
+        issue_ids: list[str],
+        queue: str,
+        *,
+        move_all_fields: bool = False,
+        initial_status: bool = False,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange:
+        body: dict[str, Any] = {"queue": queue, "issues": issue_ids}
+        if move_all_fields:
+            body["moveAllFields"] = True
+        if initial_status:
+            body["initialStatus"] = True
+        return await self._bulkchange("_move", body, auth=auth)
+
+    async def bulkchange_get(
+        self, bulk_change_id: str, *, auth: YandexAuth | None = None
+    ) -> BulkChange:
+        async with self._request(
+            "GET", f"v2/bulkchange/{bulk_change_id}", auth=auth
+        ) as response:
+            response.raise_for_status()
+            return BulkChange.model_validate_json(await response.read())
+
+    async def bulkchange_wait(
+        self,
+        bulk_change_id: str,
+        *,
+        timeout: float = 60.0,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange:
+        """Poll a bulk change job until it finishes or ``timeout`` seconds pass.
+
+        Returns the last observed state, which is unfinished on timeout.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = BULKCHANGE_POLL_INITIAL
+        while True:
+            bulk_change = await self.bulkchange_get(bulk_change_id, auth=auth)
+            remaining = deadline - loop.time()
+            if bulk_change.finished or remaining <= 0:
+                return bulk_change
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, BULKCHANGE_POLL_MAX)
+
+    async def _bulkchange(
+        self, operation: str, body: dict[str, Any], *, auth: YandexAuth | None
+    ) -> BulkChange:
+        async with self._request(
+            "POST", f"v2/bulkchange/{operation}", auth=auth, json=body
+        ) as response:
+            response.raise_for_status()
+            return BulkChange.model_validate_json(await response.read())
@@ -0,0 +1,96 @@
+import copy
+import dataclasses
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ConditionalCacheStats:
+    """Counters of conditional requests.
+
+    ``hits`` are 304 responses served from the stored object, ``revalidations``
+    are conditional requests that returned a new body and ``misses`` are
+    requests sent without validators.
+    """
+
+    hits: int = 0
+    revalidations: int = 0
+    misses: int = 0
+
+    def snapshot(self) -> "ConditionalCacheStats":
+        return dataclasses.replace(self)
+
+
+@dataclass
+class ConditionalEntry:
+    """A stored object with the validators of the response that carried it."""
+
+    etag: str | None
+    last_modified: str | None
+    value: Any
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers revalidating the object."""
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ConditionalCache:
+    """Store of parsed responses along with their HTTP validators.
+
+    Only responses carrying an ``ETag`` or ``Last-Modified`` header are stored.
+    The least recently used entries are evicted once ``max_entries`` is reached.
+    Stored objects are never handed out directly: callers always get a deep copy,
+    so mutating a result does not affect later revalidations.
+
+    A request revalidates the entry it got from `lookup`, which concurrent
+    requests may evict or replace before the response arrives, so a 304 is
+    answered from that entry rather than from whatever is stored by then.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, ConditionalEntry] = OrderedDict()
+        self._stats = ConditionalCacheStats()
+
+    @property
+    def stats(self) -> ConditionalCacheStats:
+        return self._stats.snapshot()
+
+    def lookup(self, key: Hashable) -> ConditionalEntry | None:
+        """Return the entry stored for ``key``, if any."""
+        return self._entries.get(key)
+
+    def not_modified(self, key: Hashable, entry: ConditionalEntry) -> Any:
+        """Return a copy of the revalidated ``entry`` after a 304 response."""
+        if self._entries.get(key) is entry:
+            self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return copy.deepcopy(entry.value)
+
+    def store(self, key: Hashable, headers: Mapping[str, str], value: Any) -> None:
+        """Remember ``value`` with the validators of the response that carried it."""
+        if key in self._entries:
+            self._stats.revalidations += 1
+        else:
+            self._stats.misses += 1
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag is None and last_modified is None:
+            self._entries.pop(key, None)
+            return
+
+        self._entries[key] = ConditionalEntry(
+            etag=etag, last_modified=last_modified, value=copy.deepcopy(value)
+        )
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,108 @@
+import dataclasses
+import time
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TCPConnector,
+    TraceConfig,
+    TraceConnectionQueuedEndParams,
+    TraceConnectionQueuedStartParams,
+)
+from pydantic import BaseModel
+
+
+class ConnectionPoolSettings(BaseModel):
+    """Tuning knobs for the aiohttp connection pool used by ``TrackerClient``.
+
+    ``limit`` and ``limit_per_host`` follow aiohttp semantics: ``0`` means
+    unlimited. Since every request goes to the same Tracker API host,
+    ``limit_per_host`` is effectively the concurrency cap towards Tracker.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    dns_cache_ttl: int | None = 10
+    warmup_connections: int = 0
+
+    def make_connector(self) -> TCPConnector:
+        return TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.dns_cache_ttl != 0,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+
+@dataclass
+class ConnectionPoolStats:
+    """Pool utilisation counters collected through aiohttp tracing hooks."""
+
+    requests_total: int = 0
+    requests_in_flight: int = 0
+    requests_in_flight_peak: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued_total: int = 0
+    queued_seconds_total: float = 0.0
+
+    def snapshot(self) -> "ConnectionPoolStats":
+        return dataclasses.replace(self)
+
+    def make_trace_config(self) -> TraceConfig:
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(self._on_request_start)
+        trace_config.on_request_end.append(self._on_request_done)
+        trace_config.on_request_exception.append(self._on_request_done)
+        trace_config.on_connection_create_end.append(self._on_connection_create)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reuse)
+        trace_config.on_connection_queued_start.append(self._on_queued_start)
+        trace_config.on_connection_queued_end.append(self._on_queued_end)
+        return trace_config
+
+    async def _on_request_start(
+        self, _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.requests_total += 1
+        self.requests_in_flight += 1
+        self.requests_in_flight_peak = max(
+            self.requests_in_flight_peak, self.requests_in_flight
+        )
+
+    async def _on_request_done(
+        self, _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.requests_in_flight -= 1
+
+    async def _on_connection_create(
+        self, _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_created += 1
+
+    async def _on_connection_reuse(
+        self, _session: ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        self.connections_reused += 1
+
+    async def _on_queued_start(
+        self,
+        _session: ClientSession,
+        ctx: SimpleNamespace,
+        _params: TraceConnectionQueuedStartParams,
+    ) -> None:
+        self.queued_total += 1
+        ctx.queued_at = time.monotonic()
+
+    async def _on_queued_end(
+        self,
+        _session: ClientSession,
+        ctx: SimpleNamespace,
+        _params: TraceConnectionQueuedEndParams,
+    ) -> None:
+        queued_at = getattr(ctx, "queued_at", None)
+        if queued_at is not None:
+            self.queued_seconds_total += time.monotonic() - queued_at
@@ -0,0 +1,229 @@
+import asyncio
+import dataclasses
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitSettings(BaseModel):
+    """Adaptive (AIMD) token bucket parameters, rates are requests per second.
+
+    Every identity starts at ``initial_rate``. A 429 response multiplies the
+    rate by ``decrease_factor`` (never going below ``min_rate``); afterwards the
+    rate grows back by ``increase_step`` per second up to ``max_rate``.
+    """
+
+    initial_rate: float = 10.0
+    min_rate: float = 0.5
+    max_rate: float = 50.0
+    burst: float = 10.0
+    increase_step: float = 0.5
+    decrease_factor: float = 0.5
+    max_identities: int = 10_000
+
+
+@dataclass
+class RateLimitStats:
+    acquired: int = 0
+    queued: int = 0
+    queued_seconds_total: float = 0.0
+    throttled: int = 0
+
+    def snapshot(self) -> "RateLimitStats":
+        return dataclasses.replace(self)
+
+
+@dataclass
+class _Bucket:
+    rate: float
+    tokens: float
+    updated_at: float
+
+
+def rate_limit_key(headers: Mapping[str, str], principal: str | None = None) -> str:
+    """Derive a limiter key from the resolved auth and organization headers.
+
+    ``principal`` stands in for the ``Authorization`` header when the token is
+    rotated, e.g. for a service account: its bucket must survive the rotation.
+    The key is hashed so tokens never end up in memory dumps of the limiter
+    state or in Redis key names.
+    """
+    identity = "\n".join(
+        (
+            headers.get("Authorization", "") if principal is None else principal,
+            headers.get("X-Org-ID", ""),
+            headers.get("X-Cloud-Org-ID", ""),
+        )
+    )
+    return hashlib.sha256(identity.encode()).hexdigest()[:32]
+
+
+class AdaptiveRateLimiter:
+    """In-process adaptive rate limiter keyed by Tracker identity.
+
+    Calls over the current rate are not rejected: each caller reserves a token
+    and sleeps until its slot comes, so excess calls queue up in FIFO order.
+    """
+
+    def __init__(self, settings: RateLimitSettings | None = None):
+        self._settings = settings or RateLimitSettings()
+        self._buckets: OrderedDict[str, _Bucket] = OrderedDict()
+        self._stats = RateLimitStats()
+
+    @property
+    def stats(self) -> RateLimitStats:
+        return self._stats.snapshot()
+
+    async def acquire(self, key: str) -> None:
+        delay = await self._reserve(key)
+        self._stats.acquired += 1
+        if delay > 0:
+            self._stats.queued += 1
+            self._stats.queued_seconds_total += delay
+            await asyncio.sleep(delay)
+
+    async def throttled(self, key: str) -> None:
+        """Record a 429 response for ``key`` and back off its rate."""
+        self._stats.throttled += 1
+        await self._decrease(key)
+
+    async def close(self) -> None:
+        return None
+
+    async def _reserve(self, key: str) -> float:
+        return self._reserve_local(key, time.monotonic())
+
+    async def _decrease(self, key: str) -> None:
+        bucket = self._bucket(key, time.monotonic())
+        bucket.rate = max(
+            self._settings.min_rate, bucket.rate * self._settings.decrease_factor
+        )
+        logger.warning("Tracker API throttled, lowering rate to %.2f rps", bucket.rate)
+
+    def _reserve_local(self, key: str, now: float) -> float:
+        bucket = self._bucket(key, now)
+        bucket.tokens -= 1
+        if bucket.tokens >= 0:
+            return 0.0
+        return -bucket.tokens / bucket.rate
+
+    def _bucket(self, key: str, now: float) -> _Bucket:
+        settings = self._settings
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _Bucket(
+                rate=settings.initial_rate, tokens=settings.burst, updated_at=now
+            )
+            self._buckets[key] = bucket
+            if len(self._buckets) > settings.max_identities:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+
+        elapsed = max(now - bucket.updated_at, 0.0)
+        bucket.tokens = min(settings.burst, bucket.tokens + elapsed * bucket.rate)
+        bucket.rate = min(
+            settings.max_rate, bucket.rate + elapsed * settings.increase_step
+        )
+        bucket.updated_at = now
+        return bucket
+
+
+# Both scripts use the Redis server clock so replicas with skewed clocks still
+# agree on how many tokens have been refilled.
+_RESERVE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local initial_rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_rate = tonumber(ARGV[3])
+local increase_step = tonumber(ARGV[4])
+local ttl = tonumber(ARGV[5])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'rate', 'ts')
+local tokens = tonumber(state[1]) or burst
+local rate = tonumber(state[2]) or initial_rate
+local ts = tonumber(state[3]) or now
+local elapsed = math.max(now - ts, 0)
+tokens = math.min(burst, tokens + elapsed * rate) - 1
+rate = math.min(max_rate, rate + elapsed * increase_step)
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'rate', tostring(rate), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], ttl)
+if tokens >= 0 then
+  return '0'
+end
+return tostring(-tokens / rate)
+"""
+
+_DECREASE_SCRIPT = """
+local initial_rate = tonumber(ARGV[1])
+local min_rate = tonumber(ARGV[2])
+local decrease_factor = tonumber(ARGV[3])
+local rate = tonumber(redis.call('HGET', KEYS[1], 'rate')) or initial_rate
+rate = math.max(min_rate, rate * decrease_factor)
+redis.call('HSET', KEYS[1], 'rate', tostring(rate))
+return tostring(rate)
+"""
+
+
+class RedisRateLimiter(AdaptiveRateLimiter):
+    """Adaptive rate limiter whose buckets live in Redis.
+
+    All server replicas pointed at the same Redis share one bucket per identity,
+    so together they respect a single Tracker quota. If Redis is unavailable the
+    limiter degrades to the in-process bucket instead of failing the call.
+    """
+
+    KEY_PREFIX = "tracker:ratelimit:"
+    # Idle buckets expire so Redis does not accumulate one hash per past identity.
+    BUCKET_TTL = 3600
+
+    def __init__(self, redis: Redis, settings: RateLimitSettings | None = None):
+        super().__init__(settings)
+        self._redis = redis
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+    async def _reserve(self, key: str) -> float:
+        s = self._settings
+        try:
+            delay = await self._redis.eval(  # type: ignore[misc]
+                _RESERVE_SCRIPT,
+                1,
+                self.KEY_PREFIX + key,
+                s.initial_rate,
+                s.burst,
+                s.max_rate,
+                s.increase_step,
+                self.BUCKET_TTL,
+            )
+        except RedisError as e:
+            logger.warning("Redis rate limiter unavailable, using local bucket: %s", e)
+            return await super()._reserve(key)
+        return float(delay)
+
+    async def _decrease(self, key: str) -> None:
+        s = self._settings
+        try:
+            rate = await self._redis.eval(  # type: ignore[misc]
+                _DECREASE_SCRIPT,
+                1,
+                self.KEY_PREFIX + key,
+                s.initial_rate,
+                s.min_rate,
+                s.decrease_factor,
+            )
+        except RedisError as e:
+            logger.warning("Redis rate limiter unavailable, using local bucket: %s", e)
+            await super()._decrease(key)
+            return
+        logger.warning("Tracker API throttled, lowering rate to %.2f rps", float(rate))
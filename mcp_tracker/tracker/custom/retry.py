@@ -0,0 +1,76 @@
+import datetime
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+
+from pydantic import BaseModel
+
+
+class RetryPolicy(BaseModel):
+    """Retry policy for Tracker API calls.
+
+    Delays follow exponential backoff with full jitter, unless the server asks for
+    a specific delay via ``Retry-After``. ``budget`` caps the total time a single
+    call may spend waiting between attempts; a retry that would not fit into the
+    remaining budget is not attempted and the last response is returned as is.
+    """
+
+    max_attempts: int = 1
+    backoff_base: float = 0.5
+    backoff_max: float = 10.0
+    budget: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before the attempt following ``attempt`` (1-based)."""
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self, attempt: int, remaining_budget: float, retry_after: float | None
+    ) -> float | None:
+        """Return how long to wait before retrying, or None to stop retrying."""
+        if attempt >= self.max_attempts:
+            return None
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+        if delay > remaining_budget:
+            return None
+        return delay
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    delta = retry_at - datetime.datetime.now(datetime.timezone.utc)
+    return max(delta.total_seconds(), 0.0)
+
+
+@dataclass
+class RetryStats:
+    """Retry counters; ``reasons`` is keyed by HTTP status or exception name."""
+
+    retries: int = 0
+    gave_up: int = 0
+    reasons: Counter[str] = field(default_factory=Counter)
+
+    def record_retry(self, reason: str) -> None:
+        self.retries += 1
+        self.reasons[reason] += 1
+
+    def snapshot(self) -> "RetryStats":
+        return RetryStats(
+            retries=self.retries, gave_up=self.gave_up, reasons=Counter(self.reasons)
+        )
@@ -0,0 +1,54 @@
+import asyncio
+import copy
+import dataclasses
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    leaders: int = 0
+    coalesced: int = 0
+
+    def snapshot(self) -> "SingleFlightStats":
+        return dataclasses.replace(self)
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one upstream call.
+
+    The first caller for a key starts the call; callers arriving while it is in
+    flight await the same task and receive a deep copy of its result, so callers
+    can mutate what they got without affecting each other. The upstream call runs
+    in its own task: cancelling one caller does not cancel it for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self._stats = SingleFlightStats()
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        return self._stats.snapshot()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is not None:
+            self._stats.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(task))
+
+        self._stats.leaders += 1
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        task.add_done_callback(lambda t: self._forget(key, t))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved even if every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,132 @@
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+
+# Characters that change the nesting state outside of JSON strings. Everything
+# else (numbers, literals, whitespace) is skipped in one regex search.
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+# Body of a JSON string up to its closing quote or the end of the buffer. The
+# match stops before a trailing backslash whose escaped byte has not arrived yet.
+_STRING_BODY = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+
+class JsonArraySplitter:
+    """Incrementally split a top-level JSON array into raw element bytes.
+
+    Bytes are fed as they arrive and every complete element is returned as soon
+    as its closing delimiter is seen, so at most one element plus one chunk is
+    buffered. Elements are not validated here: they are handed to pydantic as is.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._finished = False
+        self._count = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        if self._finished:
+            if chunk.strip():
+                raise ValueError("Unexpected data after the end of the JSON array")
+            return []
+
+        buffer = self._buffer
+        buffer += chunk
+        elements: list[bytes] = []
+        pos = self._pos
+        while True:
+            if self._in_string:
+                end = self._string_end(pos)
+                if end < 0:
+                    pos = self._string_resume(pos)
+                    break
+                self._in_string = False
+                pos = end + 1
+                continue
+
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            index = match.start()
+            char = buffer[index]
+            pos = index + 1
+
+            if not self._started:
+                if char != ord("[") or buffer[:index].strip():
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                self._depth = 1
+                del buffer[:pos]
+                pos = 0
+            elif char == ord('"'):
+                self._in_string = True
+            elif char in b"[{":
+                self._depth += 1
+            elif char in b"]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._append(elements, index, last=True)
+                    self._finished = True
+                    if buffer[pos:].strip():
+                        raise ValueError(
+                            "Unexpected data after the end of the JSON array"
+                        )
+                    buffer.clear()
+                    pos = 0
+                    break
+            elif char == ord(",") and self._depth == 1:
+                self._append(elements, index, last=False)
+                del buffer[:pos]
+                pos = 0
+
+        self._pos = pos
+        return elements
+
+    def close(self) -> None:
+        if not self._finished:
+            raise ValueError("Incomplete JSON array")
+
+    def _string_end(self, pos: int) -> int:
+        """Return the index of the closing quote at or after ``pos``, or -1.
+
+        ``pos`` must not point into the middle of an escape sequence.
+        """
+        buffer = self._buffer
+        end = buffer.find(b'"', pos)
+        if end > pos and buffer[end - 1] == ord("\\"):
+            # Escaped quotes are rare, so only then pay for the regex.
+            end = _STRING_BODY.match(buffer, pos).end()  # type: ignore[union-attr]
+            if end == len(buffer) or buffer[end] != ord('"'):
+                return -1
+        return end
+
+    def _string_resume(self, pos: int) -> int:
+        """Return where to continue scanning an unterminated string."""
+        buffer = self._buffer
+        end = len(buffer)
+        backslashes = 0
+        while end - backslashes > pos and buffer[end - backslashes - 1] == ord("\\"):
+            backslashes += 1
+        # Stop before an escape whose escaped byte is still to come.
+        return end - backslashes % 2
+
+    def _append(self, elements: list[bytes], end: int, *, last: bool) -> None:
+        element = bytes(self._buffer[:end]).strip()
+        if element:
+            elements.append(element)
+            self._count += 1
+        elif not last or self._count:
+            # Only "[]" may have no elements; "[,1]" and "[1,]" are invalid.
+            raise ValueError("Empty element in JSON array")
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Yield raw elements of a JSON array read from an async stream of chunks."""
+    splitter = JsonArraySplitter()
+    async for chunk in chunks:
+        for element in splitter.feed(chunk):
+            yield element
+    splitter.close()
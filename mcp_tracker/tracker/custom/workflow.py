@@ -0,0 +1,96 @@
+import dataclasses
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+
+from mcp_tracker.tracker.proto.types.statuses import Status
+
+# (queue, issue type key, status key) of an issue being closed.
+WorkflowState = tuple[str, str | None, str | None]
+
+
+@dataclass
+class WorkflowCacheStats:
+    """Counters of `issue_close` resolution.
+
+    ``hits`` are closes executed with a remembered transition, ``rejected`` are
+    remembered transitions Tracker refused and ``misses`` are closes that had to
+    discover the transition.
+    """
+
+    hits: int = 0
+    rejected: int = 0
+    misses: int = 0
+
+    def snapshot(self) -> "WorkflowCacheStats":
+        return dataclasses.replace(self)
+
+
+class WorkflowCache:
+    """In-memory workflow metadata used to close issues without listing transitions.
+
+    Keeps the status key -> status type map of every organization for ``ttl``
+    seconds, and the id of the last transition that closed an issue of a given
+    queue, type and status. Workflows are configured per queue and issue type,
+    so the same transition closes the next issue in that state; a rejected guess
+    is forgotten. At most ``max_entries`` states are remembered, least recently
+    used first out.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 3600.0,
+        max_entries: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._status_types: dict[Hashable, tuple[float, dict[str, str | None]]] = {}
+        self._done_transitions: OrderedDict[Hashable, str] = OrderedDict()
+        self._stats = WorkflowCacheStats()
+
+    @property
+    def stats(self) -> WorkflowCacheStats:
+        return self._stats.snapshot()
+
+    def status_types(self, org: Hashable) -> dict[str, str | None] | None:
+        entry = self._status_types.get(org)
+        if entry is None or self._clock() - entry[0] >= self._ttl:
+            return None
+        return entry[1]
+
+    def store_statuses(
+        self, org: Hashable, statuses: Iterable[Status]
+    ) -> dict[str, str | None]:
+        types: dict[str, str | None] = {status.key: status.type for status in statuses}
+        self._status_types[org] = (self._clock(), types)
+        return types
+
+    def done_transition(self, org: Hashable, state: WorkflowState) -> str | None:
+        transition_id = self._done_transitions.get((org, state))
+        if transition_id is not None:
+            self._done_transitions.move_to_end((org, state))
+        return transition_id
+
+    def remember_done_transition(
+        self, org: Hashable, state: WorkflowState, transition_id: str
+    ) -> None:
+        self._done_transitions[(org, state)] = transition_id
+        self._done_transitions.move_to_end((org, state))
+        if len(self._done_transitions) > self._max_entries:
+            self._done_transitions.popitem(last=False)
+
+    def forget_done_transition(self, org: Hashable, state: WorkflowState) -> None:
+        self._done_transitions.pop((org, state), None)
+
+    def record_hit(self) -> None:
+        self._stats.hits += 1
+
+    def record_rejected(self) -> None:
+        self._stats.rejected += 1
+
+    def record_miss(self) -> None:
+        self._stats.misses += 1
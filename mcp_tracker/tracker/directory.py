@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .matching import NameMatcher, normalize_name
+from .proto.common import YandexAuth
+from .proto.types.users import User
+from .proto.users import UsersProtocol
+
+logger = logging.getLogger(__name__)
+
+OrgKey = tuple[str | None, str | None]
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _org_key(auth: YandexAuth | None) -> OrgKey:
+    if auth is None:
+        return None, None
+    return auth.org_id, auth.cloud_org_id
+
+
+@dataclass(frozen=True)
+class UserMatch:
+    user: User
+    score: float
+
+
+@dataclass
+class UserIndex:
+    """Lookup structures over all users of one organization."""
+
+    users: list[User]
+    built_at: float
+    matcher: NameMatcher
+    by_login: dict[str, User] = field(default_factory=dict)
+    by_email: dict[str, User] = field(default_factory=dict)
+    by_trigram: dict[str, set[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, users: list[User], built_at: float) -> "UserIndex":
+        matcher = NameMatcher(
+            " ".join(part for part in (user.first_name, user.last_name) if part)
+            for user in users
+        )
+        index = cls(users=users, built_at=built_at, matcher=matcher)
+        for idx, user in enumerate(users):
+            index.by_login.setdefault(user.login.strip().lower(), user)
+            if user.email:
+                index.by_email.setdefault(user.email.strip().lower(), user)
+            for token in matcher.choices[idx].split():
+                for trigram in _trigrams(token):
+                    index.by_trigram.setdefault(trigram, set()).add(idx)
+        return index
+
+    def exact(self, query: str) -> User | None:
+        return self.by_login.get(query) or self.by_email.get(query)
+
+    def candidates(self, query: str) -> list[int]:
+        """Indexes of users sharing a name trigram with ``query``.
+
+        All users are candidates when nothing matches, so that misspelled
+        queries can still be scored.
+        """
+        found: set[int] = set()
+        for token in normalize_name(query).split():
+            for trigram in _trigrams(token):
+                found |= self.by_trigram.get(trigram, set())
+        return sorted(found) if found else list(range(len(self.users)))
+
+
+class UserDirectory:
+    """Per-organization in-memory index of Tracker users.
+
+    The index of an organization is built from `UsersProtocol.users_list` on
+    first use. After ``ttl`` seconds it is still served while a background task
+    rebuilds it. At most ``max_orgs`` indexes are kept, least recently used
+    ones are dropped first.
+    """
+
+    def __init__(
+        self,
+        users: UsersProtocol,
+        *,
+        ttl: float = 600.0,
+        max_orgs: int = 16,
+        page_size: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._users = users
+        self._ttl = ttl
+        self._max_orgs = max_orgs
+        self._page_size = page_size
+        self._clock = clock
+        self._indexes: OrderedDict[OrgKey, UserIndex] = OrderedDict()
+        self._builds: dict[OrgKey, asyncio.Task[UserIndex]] = {}
+
+    async def search(
+        self,
+        query: str,
+        *,
+        auth: YandexAuth | None = None,
+        limit: int = 3,
+        score_cutoff: float = 80.0,
+    ) -> list[User]:
+        """Find users by exact login or email, or by fuzzy match of their name."""
+        matches = await self.match(
+            [query], auth=auth, limit=limit, score_cutoff=score_cutoff
+        )
+        return [match.user for match in matches[query]]
+
+    async def match(
+        self,
+        queries: list[str],
+        *,
+        auth: YandexAuth | None = None,
+        limit: int = 3,
+        score_cutoff: float = 80.0,
+    ) -> dict[str, list[UserMatch]]:
+        """Match several queries at once, keeping the scores of the matches.
+
+        An exact login or email hit is the only match of its query, with a
+        score of 100. Names are compared after transliteration, so "Ivanov"
+        matches "Иванов".
+        """
+        index = await self.get_index(auth=auth)
+
+        result: dict[str, list[UserMatch]] = {}
+        for query in queries:
+            exact = index.exact(query.strip().lower())
+            if exact is not None:
+                result[query] = [UserMatch(exact, 100.0)]
+                continue
+            [matches] = index.matcher.match(
+                [query],
+                limit=limit,
+                score_cutoff=score_cutoff,
+                candidates=index.candidates(query),
+            )
+            result[query] = [
+                UserMatch(index.users[match.index], match.score) for match in matches
+            ]
+        return result
+
+    async def get_index(self, *, auth: YandexAuth | None = None) -> UserIndex:
+        key = _org_key(auth)
+        index = self._indexes.get(key)
+        if index is None:
+            task = self._builds.get(key) or self._start_build(key, auth)
+            # Callers waiting for the same build must not cancel it for others.
+            return await asyncio.shield(task)
+
+        self._indexes.move_to_end(key)
+        if self._clock() - index.built_at >= self._ttl and key not in self._builds:
+            # Serve the stale index while a fresh one is being built.
+            self._start_build(key, auth, background=True)
+        return index
+
+    def invalidate(self, *, auth: YandexAuth | None = None) -> None:
+        self._indexes.pop(_org_key(auth), None)
+
+    async def close(self) -> None:
+        tasks = list(self._builds.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start_build(
+        self, key: OrgKey, auth: YandexAuth | None, *, background: bool = False
+    ) -> asyncio.Task[UserIndex]:
+        task = asyncio.create_task(self._load(key, auth))
+        self._builds[key] = task
+
+        def done(task: asyncio.Task[UserIndex]) -> None:
+            if self._builds.get(key) is task:
+                del self._builds[key]
+            if task.cancelled():
+                return
+            exc = task.exception()
+            if background and exc is not None:
+                logger.warning("Failed to refresh user directory: %s", exc)
+
+        task.add_done_callback(done)
+        return task
+
+    async def _load(self, key: OrgKey, auth: YandexAuth | None) -> UserIndex:
+        started_at = self._clock()
+        users: list[User] = []
+        page = 1
+        while True:
+            batch = await self._users.users_list(
+                per_page=self._page_size, page=page, auth=auth
+            )
+            if not batch:
+                break
+            users.extend(batch)
+            page += 1
+
+        index = UserIndex.build(users, built_at=started_at)
+        self._indexes[key] = index
+        self._indexes.move_to_end(key)
+        while len(self._indexes) > self._max_orgs:
+            self._indexes.popitem(last=False)
+        return index
@@ -0,0 +1,99 @@
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+from rapidfuzz import fuzz, process, utils
+
+# Russian passport (ICAO) style transliteration; fuzzy scoring absorbs the
+# differences to other schemes ("kh" vs "h", "y" vs "j").
+_CYRILLIC_TO_LATIN = str.maketrans(
+    {
+        "а": "a",
+        "б": "b",
+        "в": "v",
+        "г": "g",
+        "д": "d",
+        "е": "e",
+        "ё": "e",
+        "ж": "zh",
+        "з": "z",
+        "и": "i",
+        "й": "y",
+        "к": "k",
+        "л": "l",
+        "м": "m",
+        "н": "n",
+        "о": "o",
+        "п": "p",
+        "р": "r",
+        "с": "s",
+        "т": "t",
+        "у": "u",
+        "ф": "f",
+        "х": "kh",
+        "ц": "ts",
+        "ч": "ch",
+        "ш": "sh",
+        "щ": "shch",
+        "ъ": "",
+        "ы": "y",
+        "ь": "",
+        "э": "e",
+        "ю": "yu",
+        "я": "ya",
+    }
+)
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase, transliterate Cyrillic to Latin and strip punctuation."""
+    return utils.default_process(text.lower().translate(_CYRILLIC_TO_LATIN))
+
+
+@dataclass(frozen=True)
+class NameMatch:
+    index: int
+    score: float
+
+
+class NameMatcher:
+    """Fuzzy matcher over a fixed list of names.
+
+    Names are normalized once when the matcher is built, so a query is scored
+    against all of them (or a subset of them) in a single `rapidfuzz` call.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        self._choices = [normalize_name(name) for name in names]
+
+    @property
+    def choices(self) -> Sequence[str]:
+        return self._choices
+
+    def match(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int = 3,
+        score_cutoff: float = 80.0,
+        candidates: Sequence[int] | None = None,
+    ) -> list[list[NameMatch]]:
+        """Return the best matches of every query, best first.
+
+        ``candidates`` restricts scoring to names at these indexes.
+        """
+        choices: Sequence[str] | dict[int, str] = self._choices
+        if candidates is not None:
+            choices = {idx: self._choices[idx] for idx in candidates}
+
+        results: list[list[NameMatch]] = []
+        for query in queries:
+            matches = process.extract(
+                normalize_name(query),
+                choices,
+                scorer=fuzz.WRatio,
+                processor=None,
+                limit=limit,
+                score_cutoff=score_cutoff,
+            )
+            results.append([NameMatch(idx, score) for _name, score, idx in matches])
+        return results
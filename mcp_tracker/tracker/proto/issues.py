@@ -1,7 +1,9 @@
 import datetime
-from typing import Any, Protocol, runtime_checkable
+from collections.abc import AsyncIterator
+from typing import Any, Literal, Protocol, runtime_checkable
 
 from .common import YandexAuth
+from .types.bulkchange import BulkChange
 from .types.inputs import (
     IssueUpdateFollower,
     IssueUpdateParent,
@@ -15,9 +17,11 @@ from .types.issues import (
     ChecklistItem,
     Issue,
     IssueAttachment,
+    IssueBatch,
     IssueComment,
     IssueLink,
     IssueLinkRelationship,
+    IssueScrollPage,
     IssueTransition,
     Worklog,
 )
@@ -26,7 +30,11 @@ from .types.issues import (
 @runtime_checkable
 class IssueProtocol(Protocol):
     async def issue_get(
-        self, issue_id: str, *, auth: YandexAuth | None = None
+        self,
+        issue_id: str,
+        *,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
     ) -> Issue: ...
     async def issue_get_comments(
         self, issue_id: str, *, auth: YandexAuth | None = None
@@ -84,8 +92,40 @@ class IssueProtocol(Protocol):
         *,
         per_page: int = 15,
         page: int = 1,
+        fields: list[str] | None = None,
         auth: YandexAuth | None = None,
     ) -> list[Issue]: ...
+    async def issues_get_many(
+        self, keys: list[str], *, auth: YandexAuth | None = None
+    ) -> IssueBatch: ...
+    def issues_find_stream(
+        self,
+        query: str,
+        *,
+        per_page: int = 15,
+        page: int = 1,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
+    ) -> AsyncIterator[Issue]: ...
+    async def issues_scroll_page(
+        self,
+        query: str,
+        *,
+        per_scroll: int = 100,
+        scroll_id: str | None = None,
+        scroll_type: Literal["sorted", "unsorted"] = "sorted",
+        scroll_ttl_millis: int = 60000,
+        auth: YandexAuth | None = None,
+    ) -> IssueScrollPage: ...
+    def issues_scroll(
+        self,
+        query: str,
+        *,
+        per_scroll: int = 100,
+        scroll_type: Literal["sorted", "unsorted"] = "sorted",
+        scroll_ttl_millis: int = 60000,
+        auth: YandexAuth | None = None,
+    ) -> AsyncIterator[Issue]: ...
     async def issue_get_worklogs(
         self, issue_id: str, *, auth: YandexAuth | None = None
     ) -> list[Worklog]: ...
@@ -204,6 +244,46 @@ class IssueProtocol(Protocol):
         auth: YandexAuth | None = None,
     ) -> Issue: ...
 
+    async def issues_bulk_update(
+        self,
+        issue_ids: list[str],
+        values: dict[str, Any],
+        *,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange: ...
+
+    async def issues_bulk_transition(
+        self,
+        issue_ids: list[str],
+        transition_id: str,
+        *,
+        comment: str | None = None,
+        fields: dict[str, str | int | list[str]] | None = None,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange: ...
+
+    async def issues_bulk_move(
+        self,
+        issue_ids: list[str],
+        queue: str,
+        *,
+        move_all_fields: bool = False,
+        initial_status: bool = False,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange: ...
+
+    async def bulkchange_get(
+        self, bulk_change_id: str, *, auth: YandexAuth | None = None
+    ) -> BulkChange: ...
+
+    async def bulkchange_wait(
+        self,
+        bulk_change_id: str,
+        *,
+        timeout: float = 60.0,
+        auth: YandexAuth | None = None,
+    ) -> BulkChange: ...
+
 
 class IssueProtocolWrap(IssueProtocol):
     def __init__(self, original: IssueProtocol):
@@ -9,7 +9,20 @@ from .types.queues import Queue, QueueExpandOption, QueueVersion
 @runtime_checkable
 class QueuesProtocol(Protocol):
     async def queues_list(
-        self, per_page: int = 100, page: int = 1, *, auth: YandexAuth | None = None
+        self,
+        per_page: int = 100,
+        page: int = 1,
+        *,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
+    ) -> list[Queue]: ...
+
+    async def queues_list_all(
+        self,
+        per_page: int = 100,
+        *,
+        fields: list[str] | None = None,
+        auth: YandexAuth | None = None,
     ) -> list[Queue]: ...
 
     async def queue_get(
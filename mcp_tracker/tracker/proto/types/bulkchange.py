@@ -0,0 +1,89 @@
+from pydantic import AliasChoices, Field
+
+from mcp_tracker.tracker.proto.types.base import (
+    BaseTrackerEntity,
+    NoneExcludedField,
+    none_excluder,
+)
+from mcp_tracker.tracker.proto.types.mixins import CreatedMixin
+
+# Statuses after which a bulk change job no longer changes.
+BULK_CHANGE_FINISHED_STATUSES = frozenset({"COMPLETED", "FAILED"})
+
+
+class BulkChange(CreatedMixin, BaseTrackerEntity):
+    """A bulk change job applying one change to many issues asynchronously."""
+
+    id: str
+    status: str | None = None
+    status_text: str | None = Field(
+        None,
+        validation_alias=AliasChoices("statusText", "status_text"),
+        exclude_if=none_excluder,
+    )
+    execution_chunk_percent: int | None = Field(
+        None,
+        validation_alias=AliasChoices(
+            "executionChunkPercent", "execution_chunk_percent"
+        ),
+        exclude_if=none_excluder,
+    )
+    execution_issue_percent: int | None = Field(
+        None,
+        validation_alias=AliasChoices(
+            "executionIssuePercent", "execution_issue_percent"
+        ),
+        exclude_if=none_excluder,
+    )
+    total_issues: int | None = Field(
+        None,
+        validation_alias=AliasChoices("totalIssues", "total_issues"),
+        exclude_if=none_excluder,
+    )
+    total_completed_issues: int | None = Field(
+        None,
+        validation_alias=AliasChoices("totalCompletedIssues", "total_completed_issues"),
+        exclude_if=none_excluder,
+    )
+
+    @property
+    def finished(self) -> bool:
+        return self.status in BULK_CHANGE_FINISHED_STATUSES
+
+
+class BulkChangeResult(BaseTrackerEntity):
+    """A bulk change job in its last observed state and its overall outcome.
+
+    Tracker reports job-level counters only, not which issues failed. `success`
+    is `None` when the outcome is unknown: the job has not finished yet, or only
+    part of the issues were changed.
+    """
+
+    bulk_change: BulkChange
+    issues: list[str]
+    success: bool | None = None
+    error: str | None = NoneExcludedField
+
+    @classmethod
+    def from_bulk_change(
+        cls, bulk_change: BulkChange, issues: list[str]
+    ) -> "BulkChangeResult":
+        success: bool | None = None
+        error: str | None = None
+        if bulk_change.status == "FAILED":
+            success = False
+            error = bulk_change.status_text or "Bulk change failed"
+        elif bulk_change.status == "COMPLETED":
+            total = bulk_change.total_issues
+            completed = bulk_change.total_completed_issues
+            if total is None or completed is None or completed >= total:
+                success = True
+            else:
+                error = (
+                    f"Only {completed} of {total} issues were changed, "
+                    "check the issues to find out which ones"
+                )
+        else:
+            error = f"Bulk change is still {bulk_change.status or 'running'}"
+
+        return cls(bulk_change=bulk_change, issues=issues, success=success, error=error)
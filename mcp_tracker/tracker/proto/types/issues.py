@@ -253,3 +253,22 @@ class ChangelogPage(BaseTrackerEntity):
 
     entries: list[ChangelogEntry]
     next_cursor: str | None = None
+
+
+class IssueScrollPage(BaseTrackerEntity):
+    """A page of issues from a scroll search plus the id to fetch the next page.
+
+    `next_scroll_id` is taken from the `X-Scroll-Id` response header; it is `None`
+    when the result set is exhausted. Pass it back as the `scroll_id` argument to
+    continue.
+    """
+
+    issues: list[Issue]
+    next_scroll_id: str | None = None
+
+
+class IssueBatch(BaseTrackerEntity):
+    """Issues fetched by their keys plus the requested keys that were not found."""
+
+    issues: list[Issue]
+    missing: list[str] = Field(default_factory=list)
@@ -1,11 +1,13 @@
 from typing import Literal
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from mcp_tracker.tracker.proto.types.base import BaseTrackerEntity
 
 
 class Status(BaseTrackerEntity):
+    model_config = ConfigDict(frozen=True)
+
     version: int = Field(description="Status version")
     key: str = Field(description="Status key")
     name: str = Field(description="Displayed status name")
@@ -4,7 +4,7 @@ from mcp_tracker.tracker.proto.types.base import BaseTrackerEntity
 
 
 class User(BaseTrackerEntity):
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     uid: int
     login: str
@@ -39,3 +39,18 @@ def yandex_auth() -> YandexAuth:
 def yandex_auth_cloud() -> YandexAuth:
     """YandexAuth with cloud_org_id for testing."""
     return YandexAuth(token="auth-token", cloud_org_id="cloud-org")
+
+
+class Clock:
+    """Manually advanced clock for code taking a ``clock`` callable."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Clock:
+    return Clock()
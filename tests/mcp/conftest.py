@@ -13,6 +13,7 @@ from mcp.types import CallToolResult
 from mcp_tracker.mcp.context import AppContext
 from mcp_tracker.mcp.server import Lifespan, create_mcp_server
 from mcp_tracker.settings import Settings
+from mcp_tracker.tracker.directory import UserDirectory
 from mcp_tracker.tracker.proto.fields import GlobalDataProtocol
 from mcp_tracker.tracker.proto.issues import IssueProtocol
 from mcp_tracker.tracker.proto.queues import QueuesProtocol
@@ -140,6 +141,7 @@ def mock_app_context(
         issues=mock_issues_protocol,
         fields=mock_fields_protocol,
         users=mock_users_protocol,
+        user_directory=UserDirectory(mock_users_protocol),
     )
 
 
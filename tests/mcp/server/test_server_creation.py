@@ -1,7 +1,7 @@
 import pytest
 from mcp.client.session import ClientSession
 
-# Read-only tool names (24 tools) - always registered
+# Read-only tool names (27 tools) - always registered
 READ_ONLY_TOOL_NAMES = [
     # Queue tools (5)
     "queues_get_all",
@@ -16,11 +16,13 @@ READ_ONLY_TOOL_NAMES = [
     "get_priorities",
     "get_resolutions",
     "issue_get_url",
-    # Issue read tools (10)
+    # Issue read tools (12)
     "issue_get",
+    "issues_get_many",
     "issue_get_comments",
     "issue_get_links",
     "issues_find",
+    "issues_scroll",
     "issues_count",
     "issue_get_worklogs",
     "issue_get_attachments",
@@ -50,6 +52,11 @@ WRITE_TOOL_NAMES = [
     "issue_add_link",
     "issue_delete_link",
     "issue_move",
+    "issues_bulk_update",
+    "issues_bulk_transition",
+    "issues_bulk_move",
+    "issues_add_comments",
+    "issues_add_worklogs",
 ]
 
 # All tool names that should be registered in normal mode
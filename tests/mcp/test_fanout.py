@@ -0,0 +1,67 @@
+import asyncio
+
+from mcp_tracker.mcp.fanout import ItemError, fan_out
+from mcp_tracker.tracker.custom.errors import IssueNotFound
+
+
+class TestFanOut:
+    async def test_keeps_order_of_keys(self) -> None:
+        async def call(key: str) -> str:
+            await asyncio.sleep(0.01 if key == "A-1" else 0)
+            return key.lower()
+
+        result = await fan_out(["A-1", "A-2", "A-1"], call, concurrency=4)
+
+        assert list(result.items()) == [("A-1", "a-1"), ("A-2", "a-2")]
+
+    async def test_limits_concurrency(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def call(key: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return key
+
+        result = await fan_out(range(10), call, concurrency=3)
+
+        assert list(result.values()) == list(range(10))
+        assert peak == 3
+
+    async def test_failure_is_isolated(self) -> None:
+        async def call(key: str) -> str:
+            if key == "A-2":
+                raise IssueNotFound(key)
+            return key
+
+        result = await fan_out(["A-1", "A-2"], call, concurrency=2)
+
+        assert result["A-1"] == "A-1"
+        assert result["A-2"] == ItemError(error="Issue with ID 'A-2' not found.")
+
+    async def test_slow_calls_are_cancelled_at_deadline(self) -> None:
+        cancelled: list[str] = []
+
+        async def call(key: str) -> str:
+            if key == "SLOW-1":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(key)
+                    raise
+            return key
+
+        result = await fan_out(["FAST-1", "SLOW-1"], call, concurrency=2, timeout=0.05)
+
+        assert result["FAST-1"] == "FAST-1"
+        assert result["SLOW-1"] == ItemError(error="Timed out after 0.05 seconds")
+        assert cancelled == ["SLOW-1"]
+
+    async def test_no_keys(self) -> None:
+        async def call(key: str) -> str:
+            return key
+
+        assert await fan_out([], call, concurrency=2) == {}
@@ -1,7 +1,9 @@
+from typing import Any
 from unittest.mock import AsyncMock
 
 from mcp.client.session import ClientSession
 
+from mcp_tracker.tracker.custom.errors import IssueNotFound
 from mcp_tracker.tracker.proto.types.issues import (
     ChangelogComments,
     ChangelogEntry,
@@ -11,8 +13,10 @@ from mcp_tracker.tracker.proto.types.issues import (
     ChecklistItem,
     Issue,
     IssueAttachment,
+    IssueBatch,
     IssueComment,
     IssueLink,
+    IssueScrollPage,
     IssueTransition,
     Worklog,
 )
@@ -70,6 +74,25 @@ class TestIssueGet:
         # Description should be None when excluded
         assert content.get("description") is None
 
+    async def test_with_fields(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_issue: Issue,
+    ) -> None:
+        mock_issues_protocol.issue_get.return_value = sample_issue
+
+        result = await client_session.call_tool(
+            "issue_get", {"issue_id": "TEST-123", "fields": ["key", "description"]}
+        )
+
+        assert not result.isError
+        call_kwargs = mock_issues_protocol.issue_get.call_args.kwargs
+        assert call_kwargs["fields"] == ["key", "description"]
+        content = get_tool_result_content(result)
+        assert content["key"] == sample_issue.key
+        assert content.get("summary") is None
+
     async def test_restricted_queue_raises_error(
         self,
         client_session_with_limits: ClientSession,
@@ -83,6 +106,42 @@ class TestIssueGet:
         mock_issues_protocol.issue_get.assert_not_called()
 
 
+class TestIssuesGetMany:
+    async def test_returns_batch(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_issue: Issue,
+    ) -> None:
+        mock_issues_protocol.issues_get_many.return_value = IssueBatch(
+            issues=[sample_issue], missing=["TEST-999"]
+        )
+
+        result = await client_session.call_tool(
+            "issues_get_many", {"issue_ids": ["TEST-123", "TEST-999"]}
+        )
+
+        assert not result.isError
+        args, _ = mock_issues_protocol.issues_get_many.call_args
+        assert args == (["TEST-123", "TEST-999"],)
+        content = get_tool_result_content(result)
+        assert [issue["key"] for issue in content["issues"]] == [sample_issue.key]
+        assert content["issues"][0].get("description") is None
+        assert content["missing"] == ["TEST-999"]
+
+    async def test_restricted_queue_raises_error(
+        self,
+        client_session_with_limits: ClientSession,
+        mock_issues_protocol: AsyncMock,
+    ) -> None:
+        result = await client_session_with_limits.call_tool(
+            "issues_get_many", {"issue_ids": ["TEST-123", "RESTRICTED-123"]}
+        )
+
+        assert result.isError
+        mock_issues_protocol.issues_get_many.assert_not_called()
+
+
 class TestIssueGetComments:
     async def test_returns_comments(
         self,
@@ -191,6 +250,53 @@ class TestIssuesFind:
         for issue in content:
             assert issue.get("description") is None
 
+    async def test_pushes_fields_to_tracker(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_issues: list[Issue],
+    ) -> None:
+        mock_issues_protocol.issues_find.return_value = sample_issues
+
+        result = await client_session.call_tool(
+            "issues_find",
+            {"query": "Queue: TEST", "fields": ["key", "description", "summary"]},
+        )
+
+        assert not result.isError
+        call_kwargs = mock_issues_protocol.issues_find.call_args.kwargs
+        # description is not requested while include_description is False
+        assert call_kwargs["fields"] == ["key", "summary"]
+
+
+class TestIssuesScroll:
+    async def test_returns_page(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_issues: list[Issue],
+    ) -> None:
+        mock_issues_protocol.issues_scroll_page.return_value = IssueScrollPage(
+            issues=sample_issues, next_scroll_id="scroll-2"
+        )
+
+        result = await client_session.call_tool(
+            "issues_scroll",
+            {"query": "Queue: TEST", "scroll_id": "scroll-1", "per_page": 50},
+        )
+
+        assert not result.isError
+        args, kwargs = mock_issues_protocol.issues_scroll_page.call_args
+        assert args == ("Queue: TEST",)
+        assert kwargs["scroll_id"] == "scroll-1"
+        assert kwargs["per_scroll"] == 50
+        assert kwargs["scroll_ttl_millis"] == 600_000
+        content = get_tool_result_content(result)
+        assert content["next_scroll_id"] == "scroll-2"
+        assert len(content["issues"]) == len(sample_issues)
+        for issue in content["issues"]:
+            assert issue.get("description") is None
+
 
 class TestIssuesCount:
     async def test_returns_count(
@@ -232,6 +338,28 @@ class TestIssueGetWorklogs:
         assert "TEST-124" in content
         assert len(content["TEST-123"]) == len(sample_worklogs)
 
+    async def test_failed_issue_does_not_fail_others(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_worklogs: list[Worklog],
+    ) -> None:
+        async def get_worklogs(issue_id: str, **kwargs: Any) -> list[Worklog]:
+            if issue_id == "TEST-404":
+                raise IssueNotFound(issue_id)
+            return sample_worklogs
+
+        mock_issues_protocol.issue_get_worklogs.side_effect = get_worklogs
+
+        result = await client_session.call_tool(
+            "issue_get_worklogs", {"issue_ids": ["TEST-123", "TEST-404"]}
+        )
+
+        assert not result.isError
+        content = get_tool_result_content(result)
+        assert len(content["TEST-123"]) == len(sample_worklogs)
+        assert content["TEST-404"] == {"error": "Issue with ID 'TEST-404' not found."}
+
     async def test_restricted_queue_raises_error(
         self,
         client_session_with_limits: ClientSession,
@@ -8,6 +8,7 @@ from mcp.server import FastMCP
 from mcp.shared.context import RequestContext
 from mcp.types import ElicitRequestParams, ElicitResult
 
+from mcp_tracker.tracker.proto.types.bulkchange import BulkChange
 from mcp_tracker.tracker.proto.types.issues import (
     Issue,
     IssueComment,
@@ -123,6 +124,220 @@ class TestIssueExecuteTransition:
         mock_issues_protocol.issue_execute_transition.assert_not_called()
 
 
+class TestIssuesBulkChange:
+    async def test_bulk_update_waits_for_job(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+    ) -> None:
+        mock_issues_protocol.issues_bulk_update.return_value = BulkChange(
+            id="bc1", status="CREATED"
+        )
+        mock_issues_protocol.bulkchange_wait.return_value = BulkChange(
+            id="bc1", status="COMPLETED", totalIssues=2, totalCompletedIssues=2
+        )
+
+        result = await client_session.call_tool(
+            "issues_bulk_update",
+            {"issue_ids": ["TEST-1", "TEST-2"], "values": {"priority": "critical"}},
+        )
+
+        assert not result.isError
+        args = mock_issues_protocol.issues_bulk_update.call_args.args
+        assert args == (["TEST-1", "TEST-2"], {"priority": "critical"})
+        assert mock_issues_protocol.bulkchange_wait.call_args.args == ("bc1",)
+        content = get_tool_result_content(result)
+        assert content["bulk_change"]["status"] == "COMPLETED"
+        assert content["issues"] == ["TEST-1", "TEST-2"]
+        assert content["success"] is True
+        assert "error" not in content
+
+    async def test_bulk_transition_reports_failed_job(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+    ) -> None:
+        mock_issues_protocol.issues_bulk_transition.return_value = BulkChange(
+            id="bc2", status="FAILED", statusText="Transition is not available"
+        )
+
+        result = await client_session.call_tool(
+            "issues_bulk_transition",
+            {
+                "issue_ids": ["TEST-1"],
+                "transition_id": "close",
+                "comment": "Done",
+                "fields": {"resolution": "fixed"},
+            },
+        )
+
+        assert not result.isError
+        mock_issues_protocol.bulkchange_wait.assert_not_called()
+        call = mock_issues_protocol.issues_bulk_transition.call_args
+        assert call.kwargs["comment"] == "Done"
+        assert call.kwargs["fields"] == {"resolution": "fixed"}
+        content = get_tool_result_content(result)
+        assert content["issues"] == ["TEST-1"]
+        assert content["success"] is False
+        assert content["error"] == "Transition is not available"
+
+    async def test_bulk_move_checks_target_queue(
+        self,
+        client_session_with_limits: ClientSession,
+        mock_issues_protocol: AsyncMock,
+    ) -> None:
+        result = await client_session_with_limits.call_tool(
+            "issues_bulk_move",
+            {"issue_ids": ["ALLOWED-1"], "queue": "RESTRICTED"},
+        )
+
+        assert result.isError
+        mock_issues_protocol.issues_bulk_move.assert_not_called()
+
+    async def test_every_issue_is_checked_before_submitting(
+        self,
+        client_session_with_limits: ClientSession,
+        mock_issues_protocol: AsyncMock,
+    ) -> None:
+        result = await client_session_with_limits.call_tool(
+            "issues_bulk_update",
+            {"issue_ids": ["ALLOWED-1", "RESTRICTED-2"], "values": {"tags": ["x"]}},
+        )
+
+        assert result.isError
+        mock_issues_protocol.issues_bulk_update.assert_not_called()
+
+    async def test_read_only_queue_rejected(
+        self,
+        client_session_with_read_only_queues: ClientSession,
+        mock_issues_protocol: AsyncMock,
+    ) -> None:
+        result = await client_session_with_read_only_queues.call_tool(
+            "issues_bulk_transition",
+            {"issue_ids": ["TEST-1", "READONLY-1"], "transition_id": "close"},
+        )
+
+        assert result.isError
+        mock_issues_protocol.issues_bulk_transition.assert_not_called()
+
+
+class TestIssuesAddCommentsAndWorklogs:
+    async def test_adds_comments_and_reports_failures_per_item(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_comment: IssueComment,
+    ) -> None:
+        async def add_comment(issue_id: str, **kwargs: Any) -> IssueComment:
+            if issue_id == "TEST-2":
+                raise RuntimeError("Tracker is down")
+            return sample_comment
+
+        mock_issues_protocol.issue_add_comment.side_effect = add_comment
+
+        result = await client_session.call_tool(
+            "issues_add_comments",
+            {
+                "items": [
+                    {"issue_id": "TEST-1", "text": "Deployed", "markup_type": "md"},
+                    {"issue_id": "TEST-2", "text": "Deployed"},
+                ]
+            },
+        )
+
+        assert not result.isError
+        first, second = get_tool_result_content(result)
+        assert first["issue_id"] == "TEST-1"
+        assert first["success"] is True
+        assert first["result"]["text"] == sample_comment.text
+        assert second == {
+            "issue_id": "TEST-2",
+            "success": False,
+            "result": None,
+            "error": "Tracker is down",
+        }
+        call = mock_issues_protocol.issue_add_comment.call_args_list[0]
+        assert call.args == ("TEST-1",)
+        assert call.kwargs["markup_type"] == "md"
+
+    async def test_same_issue_may_appear_twice(
+        self,
+        client_session: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_worklog: Worklog,
+    ) -> None:
+        mock_issues_protocol.issue_add_worklog.return_value = sample_worklog
+
+        result = await client_session.call_tool(
+            "issues_add_worklogs",
+            {
+                "items": [
+                    {"issue_id": "TEST-1", "duration": "PT1H"},
+                    {"issue_id": "TEST-1", "duration": "PT2H", "comment": "Review"},
+                ]
+            },
+        )
+
+        assert not result.isError
+        content = get_tool_result_content(result)
+        assert [item["success"] for item in content] == [True, True]
+        calls = mock_issues_protocol.issue_add_worklog.call_args_list
+        assert [call.kwargs["duration"] for call in calls] == ["PT1H", "PT2H"]
+
+    async def test_restricted_issue_fails_alone(
+        self,
+        client_session_with_limits: ClientSession,
+        mock_issues_protocol: AsyncMock,
+        sample_worklog: Worklog,
+    ) -> None:
+        mock_issues_protocol.issue_add_worklog.return_value = sample_worklog
+
+        result = await client_session_with_limits.call_tool(
+            "issues_add_worklogs",
+            {
+                "items": [
+                    {"issue_id": "ALLOWED-1", "duration": "PT1H"},
+                    {"issue_id": "RESTRICTED-1", "duration": "PT1H"},
+                ]
+            },
+        )
+
+        assert not result.isError
+        allowed, restricted = get_tool_result_content(result)
+        assert allowed["success"] is True
+        assert restricted["success"] is False
+        assert "RESTRICTED-1" in restricted["error"]
+        mock_issues_protocol.issue_add_worklog.assert_called_once()
+
+    async def test_dry_run_only_validates_access(
+        self,
+        client_session_with_read_only_queues: ClientSession,
+        mock_issues_protocol: AsyncMock,
+    ) -> None:
+        result = await client_session_with_read_only_queues.call_tool(
+            "issues_add_comments",
+            {
+                "items": [
+                    {"issue_id": "TEST-1", "text": "Hi"},
+                    {"issue_id": "READONLY-1", "text": "Hi"},
+                ],
+                "dry_run": True,
+            },
+        )
+
+        assert not result.isError
+        ok, read_only = get_tool_result_content(result)
+        assert ok == {
+            "issue_id": "TEST-1",
+            "success": True,
+            "result": None,
+            "error": None,
+        }
+        assert read_only["success"] is False
+        assert "read-only" in read_only["error"]
+        mock_issues_protocol.issue_add_comment.assert_not_called()
+
+
 class TestIssueClose:
     async def test_closes_issue(
         self,
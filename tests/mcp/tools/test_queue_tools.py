@@ -14,13 +14,13 @@ class TestQueuesGetAll:
         mock_queues_protocol: AsyncMock,
         sample_queues: list[Queue],
     ) -> None:
-        # First call returns queues, second call returns empty list to stop pagination
-        mock_queues_protocol.queues_list.side_effect = [sample_queues, []]
+        mock_queues_protocol.queues_list_all.return_value = sample_queues
 
         result = await client_session.call_tool("queues_get_all", {})
 
         assert not result.isError
-        mock_queues_protocol.queues_list.assert_called()
+        mock_queues_protocol.queues_list_all.assert_called_once()
+        mock_queues_protocol.queues_list.assert_not_called()
         content = get_tool_result_content(result)
         assert isinstance(content, list)
         assert len(content) == len(sample_queues)
@@ -52,7 +52,7 @@ class TestQueuesGetAll:
     ) -> None:
         # Include an ALLOWED queue in the response
         sample_queues[0].key = "ALLOWED"
-        mock_queues_protocol.queues_list.side_effect = [sample_queues, []]
+        mock_queues_protocol.queues_list_all.return_value = sample_queues
 
         result = await client_session_with_limits.call_tool("queues_get_all", {})
 
@@ -62,6 +62,39 @@ class TestQueuesGetAll:
         # Only the ALLOWED queue should be returned
         assert all(q["key"] == "ALLOWED" for q in content)
 
+    async def test_pushes_fields_to_tracker(
+        self,
+        client_session: ClientSession,
+        mock_queues_protocol: AsyncMock,
+        sample_queues: list[Queue],
+    ) -> None:
+        mock_queues_protocol.queues_list.return_value = sample_queues
+
+        result = await client_session.call_tool(
+            "queues_get_all", {"page": 1, "fields": ["name"]}
+        )
+
+        assert not result.isError
+        call_kwargs = mock_queues_protocol.queues_list.call_args.kwargs
+        assert call_kwargs["fields"] == ["name"]
+
+    async def test_projection_keeps_key_for_queue_limits(
+        self,
+        client_session_with_limits: ClientSession,
+        mock_queues_protocol: AsyncMock,
+        sample_queues: list[Queue],
+    ) -> None:
+        sample_queues[0].key = "ALLOWED"
+        mock_queues_protocol.queues_list.return_value = sample_queues
+
+        result = await client_session_with_limits.call_tool(
+            "queues_get_all", {"page": 1, "fields": ["name"]}
+        )
+
+        assert not result.isError
+        call_kwargs = mock_queues_protocol.queues_list.call_args.kwargs
+        assert call_kwargs["fields"] == ["name", "key"]
+
 
 class TestQueueGetTags:
     async def test_returns_tags(
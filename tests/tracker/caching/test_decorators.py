@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiocache import Cache
+
+from mcp_tracker.settings import Settings
+from mcp_tracker.tracker.caching.decorators import (
+    FRESH_SUFFIX,
+    REFRESH_LOCK_SUFFIX,
+    cached_method,
+)
+from mcp_tracker.tracker.caching.policy import DEFAULT_STALE_METHODS, CachePolicy
+
+KEY = "key"
+
+
+def make(upstream: AsyncMock, **kwargs: Any) -> Any:
+    kwargs.setdefault("ttl", 60)
+    kwargs.setdefault("stale_ttl", 300)
+
+    async def fetch(key: str) -> Any:
+        return await upstream(key)
+
+    return cached_method(
+        cache=Cache.MEMORY, key_builder=lambda f, *args, **kw: KEY, **kwargs
+    )(fetch)
+
+
+async def expire_soft(wrapper: Any) -> None:
+    await wrapper.cache.delete(KEY + FRESH_SUFFIX)
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestStaleWhileRevalidate:
+    async def test_serves_fresh_entries_from_cache(self) -> None:
+        upstream = AsyncMock(return_value="v1")
+        wrapper = make(upstream)
+
+        assert await wrapper("a") == "v1"
+        assert await wrapper("a") == "v1"
+
+        upstream.assert_awaited_once()
+
+    async def test_serves_stale_and_refreshes_once(self) -> None:
+        upstream = AsyncMock(return_value="v1")
+        wrapper = make(upstream)
+        await wrapper("a")
+        await expire_soft(wrapper)
+        upstream.return_value = "v2"
+
+        results = await asyncio.gather(*(wrapper("a") for _ in range(10)))
+        await settle()
+
+        assert results == ["v1"] * 10
+        assert upstream.await_count == 2
+        assert await wrapper("a") == "v2"
+        assert await wrapper.cache.exists(KEY + FRESH_SUFFIX)
+        assert not await wrapper.cache.exists(KEY + REFRESH_LOCK_SUFFIX)
+
+    async def test_skips_refresh_locked_by_another_replica(self) -> None:
+        upstream = AsyncMock(return_value="v1")
+        wrapper = make(upstream)
+        await wrapper("a")
+        await expire_soft(wrapper)
+        await wrapper.cache.set(KEY + REFRESH_LOCK_SUFFIX, True)
+
+        assert await wrapper("a") == "v1"
+        await settle()
+
+        upstream.assert_awaited_once()
+        assert await wrapper.cache.exists(KEY + REFRESH_LOCK_SUFFIX)
+
+    async def test_serves_stale_on_refresh_errors(self) -> None:
+        upstream = AsyncMock(return_value="v1")
+        wrapper = make(upstream, retry_delay=30)
+        await wrapper("a")
+        await expire_soft(wrapper)
+        upstream.side_effect = RuntimeError("Tracker is down")
+
+        assert await wrapper("a") == "v1"
+        await settle()
+        assert await wrapper("a") == "v1"
+        await settle()
+
+        # The failed refresh postponed the next one by marking the entry fresh.
+        assert upstream.await_count == 2
+        assert await wrapper.cache.exists(KEY + FRESH_SUFFIX)
+        assert not await wrapper.cache.exists(KEY + REFRESH_LOCK_SUFFIX)
+
+    async def test_goes_upstream_after_hard_expiry(self) -> None:
+        upstream = AsyncMock(return_value="v1")
+        wrapper = make(upstream)
+        await wrapper("a")
+        await wrapper.cache.clear()
+        upstream.return_value = "v2"
+
+        assert await wrapper("a") == "v2"
+        assert upstream.await_count == 2
+
+    async def test_disabled_without_stale_ttl(self) -> None:
+        upstream = AsyncMock(return_value="v1")
+        wrapper = make(upstream, stale_ttl=0)
+
+        await wrapper("a")
+
+        assert await wrapper.cache.exists(KEY)
+        assert not await wrapper.cache.exists(KEY + FRESH_SUFFIX)
+
+    def test_zero_ttl_leaves_method_uncached(self) -> None:
+        async def fetch() -> None:
+            pass
+
+        assert cached_method(cache=Cache.MEMORY, ttl=0)(fetch) is fetch
+
+
+class TestStalePolicy:
+    def test_stale_methods(self) -> None:
+        policy = CachePolicy(default_ttl=60, stale_ttl=120)
+
+        assert policy.stale("issues", "issue_get") == 120
+        assert policy.stale("queues", "queues_get_fields") == 120
+        assert policy.stale("issues", "issues_find") == 0
+        assert (
+            CachePolicy(stale_ttl=120, stale_methods=frozenset({"users"})).stale(
+                "users", "user_get"
+            )
+            == 120
+        )
+
+    def test_max_ttl_covers_stale_entries(self) -> None:
+        assert CachePolicy(default_ttl=60, defaults={}, stale_ttl=30).max_ttl == 90
+
+    def test_settings(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TOOLS_CACHE_STALE_TTL", "120")
+        monkeypatch.setenv("TOOLS_CACHE_STALE_METHODS", "issue_get, users")
+
+        policy = Settings(tracker_token="token", _env_file=None).cache_policy()  # type: ignore[call-arg]
+
+        assert policy.stale_ttl == 120
+        assert policy.stale_methods == {"issue_get", "users"}
+
+    def test_default_stale_methods(self) -> None:
+        policy = Settings(tracker_token="token", _env_file=None).cache_policy()  # type: ignore[call-arg]
+
+        assert policy.stale_ttl == 0
+        assert policy.stale_methods == DEFAULT_STALE_METHODS
@@ -0,0 +1,239 @@
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from aiocache import Cache
+
+from mcp_tracker.tracker.caching.client import make_cached_protocols
+from mcp_tracker.tracker.caching.invalidation import (
+    ALL_ISSUES_TAG,
+    ISSUE_READS,
+    ISSUE_WRITE_INVALIDATES,
+    Generations,
+    query_tags,
+)
+from mcp_tracker.tracker.proto.common import YandexAuth
+from mcp_tracker.tracker.proto.issues import IssueProtocol
+from mcp_tracker.tracker.proto.types.bulkchange import BulkChange
+from mcp_tracker.tracker.proto.types.issues import Issue, IssueComment, IssueLink
+from mcp_tracker.tracker.proto.types.refs import IssueReference
+
+
+class TestQueryTags:
+    @pytest.mark.parametrize(
+        ("query", "tags"),
+        [
+            ("Queue: TEST", ("queue:TEST",)),
+            ('queue: "TEST" Status: open', ("queue:TEST",)),
+            ("Queue: TEST, OTHER AND Assignee: me()", ("queue:OTHER", "queue:TEST")),
+            ("Assignee: me()", (ALL_ISSUES_TAG,)),
+            ("Queue: !TEST", (ALL_ISSUES_TAG,)),
+            ("Queue: TEST OR Assignee: me()", (ALL_ISSUES_TAG,)),
+            ("queue: test, Other", ("queue:OTHER", "queue:TEST")),
+        ],
+    )
+    def test_tags(self, query: str, tags: tuple[str, ...]) -> None:
+        assert query_tags(query) == tags
+
+
+class TestGenerations:
+    async def test_bump_replaces_tokens(self) -> None:
+        generations = Generations(Cache(Cache.MEMORY))
+
+        assert await generations.tokens(["a", "b"]) == (None, None)
+        await generations.bump(["a"])
+        [first, untouched] = await generations.tokens(["a", "b"])
+        await generations.bump(["a"])
+        [second, _] = await generations.tokens(["a", "b"])
+
+        assert first is not None and second is not None and first != second
+        assert untouched is None
+
+
+class TestInvalidationMap:
+    def test_keys_are_issue_protocol_methods(self) -> None:
+        for write, reads in ISSUE_WRITE_INVALIDATES.items():
+            assert hasattr(IssueProtocol, write)
+            assert set(reads) <= set(ISSUE_READS)
+            assert "issue_get" in reads
+
+
+class TestWriteThroughInvalidation:
+    @pytest.fixture
+    def original(self) -> AsyncMock:
+        original = AsyncMock(spec=IssueProtocol)
+        original.issue_get.return_value = Issue(key="TEST-1")
+        original.issue_get_comments.return_value = [IssueComment(id=1, text="Hi")]
+        original.issues_get_links.return_value = [
+            IssueLink(id=7, object=IssueReference(key="TEST-2"))
+        ]
+        original.issues_find.return_value = [Issue(key="TEST-1")]
+        original.issues_count.return_value = 1
+        return original
+
+    @pytest.fixture
+    def issues(self, original: AsyncMock) -> Any:
+        return make_cached_protocols({"ttl": 300}).issues(original)
+
+    async def test_write_drops_only_affected_reads(
+        self, issues: Any, original: AsyncMock, yandex_auth: YandexAuth
+    ) -> None:
+        for issue_id in ("TEST-1", "TEST-2"):
+            await issues.issue_get(issue_id, auth=yandex_auth)
+            await issues.issue_get_comments(issue_id, auth=yandex_auth)
+        await issues.issues_get_links("TEST-1", auth=yandex_auth)
+
+        await issues.issue_add_comment("TEST-1", text="Hello", auth=yandex_auth)
+
+        for issue_id in ("TEST-1", "TEST-2"):
+            await issues.issue_get(issue_id, auth=yandex_auth)
+            await issues.issue_get_comments(issue_id, auth=yandex_auth)
+        await issues.issues_get_links("TEST-1", auth=yandex_auth)
+
+        assert original.issue_get.call_count == 3
+        assert original.issue_get_comments.call_count == 3
+        assert original.issues_get_links.call_count == 1
+
+    async def test_write_drops_reads_of_other_users(
+        self, issues: Any, original: AsyncMock, yandex_auth: YandexAuth
+    ) -> None:
+        writer = YandexAuth(token="writer-token", org_id=yandex_auth.org_id)
+        await issues.issue_get("TEST-1", auth=yandex_auth)
+        await issues.issue_get_comments("TEST-1", auth=yandex_auth)
+
+        await issues.issue_add_comment("TEST-1", text="Hello", auth=writer)
+
+        await issues.issue_get("TEST-1", auth=yandex_auth)
+        await issues.issue_get_comments("TEST-1", auth=yandex_auth)
+
+        assert original.issue_get.call_count == 2
+        assert original.issue_get_comments.call_count == 2
+
+    async def test_projections_are_invalidated_by_generation(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        await issues.issue_get("TEST-1", fields=["summary"])
+        await issues.issue_get("TEST-1", fields=["summary"])
+        await issues.issue_update("TEST-1", summary="New")
+        await issues.issue_get("TEST-1", fields=["summary"])
+
+        assert original.issue_get.call_count == 2
+
+    async def test_queries_of_written_queue_are_invalidated(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        await issues.issues_find("Queue: TEST")
+        await issues.issues_find("Queue: OTHER")
+        await issues.issues_count("Assignee: me()")
+
+        await issues.issue_add_worklog("TEST-1", duration="PT1H")
+
+        await issues.issues_find("Queue: TEST")
+        await issues.issues_find("Queue: OTHER")
+        await issues.issues_count("Assignee: me()")
+
+        assert [
+            call.kwargs["query"] for call in original.issues_find.call_args_list
+        ] == [
+            "Queue: TEST",
+            "Queue: OTHER",
+            "Queue: TEST",
+        ]
+        assert original.issues_count.call_count == 2
+
+    async def test_tags_ignore_case_of_keys(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        await issues.issues_find("queue: test")
+        await issues.issue_get("TEST-1", fields=["summary"])
+
+        await issues.issue_update("test-1", summary="New")
+
+        await issues.issues_find("queue: test")
+        await issues.issue_get("TEST-1", fields=["summary"])
+
+        assert original.issues_find.call_count == 2
+        assert original.issue_get.call_count == 2
+
+    async def test_issue_create_invalidates_its_queue(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        await issues.issues_find("Queue: NEW")
+        await issues.issue_create("NEW", "Summary")
+        await issues.issues_find("Queue: NEW")
+
+        assert original.issues_find.call_count == 2
+
+    async def test_issue_move_drops_old_key_and_both_queues(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        await issues.issue_get_comments("TEST-1")
+        await issues.issues_find("Queue: TEST")
+        await issues.issues_find("Queue: NEW")
+
+        await issues.issue_move("TEST-1", "NEW")
+
+        await issues.issue_get_comments("TEST-1")
+        await issues.issues_find("Queue: TEST")
+        await issues.issues_find("Queue: NEW")
+
+        assert original.issue_get_comments.call_count == 2
+        assert original.issues_find.call_count == 4
+
+    async def test_bulk_change_is_invalidated_again_when_finished(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        original.issues_bulk_update.return_value = BulkChange(
+            id="bc1", status="CREATED"
+        )
+        original.bulkchange_wait.return_value = BulkChange(id="bc1", status="COMPLETED")
+
+        await issues.issues_bulk_update(["TEST-1"], {"priority": "critical"})
+        # Read while the job runs, caching the old values again.
+        await issues.issue_get("TEST-1")
+        await issues.issues_find("Queue: TEST")
+        await issues.bulkchange_wait("bc1")
+        await issues.issue_get("TEST-1")
+        await issues.issues_find("Queue: TEST")
+        await issues.bulkchange_wait("bc1")
+        await issues.issue_get("TEST-1")
+
+        assert original.issue_get.call_count == 2
+        assert original.issues_find.call_count == 2
+
+    async def test_deleted_link_is_dropped_on_both_ends(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        await issues.issues_get_links("TEST-1")
+        await issues.issues_get_links("TEST-2")
+
+        await issues.issue_delete_link("TEST-1", 7)
+
+        await issues.issues_get_links("TEST-1")
+        await issues.issues_get_links("TEST-2")
+
+        assert original.issues_get_links.call_count == 4
+
+    async def test_failed_write_keeps_cache(
+        self, issues: Any, original: AsyncMock
+    ) -> None:
+        original.issue_update.side_effect = RuntimeError("conflict")
+        await issues.issue_get("TEST-1")
+
+        with pytest.raises(RuntimeError):
+            await issues.issue_update("TEST-1", summary="New")
+        await issues.issue_get("TEST-1")
+
+        assert original.issue_get.call_count == 1
+
+    async def test_cache_errors_do_not_fail_the_write(
+        self, issues: Any, original: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        async def broken(*args: Any, **kwargs: Any) -> None:
+            raise ConnectionError("redis is down")
+
+        monkeypatch.setattr(Generations, "bump", broken)
+
+        await issues.issue_update("TEST-1", summary="New")
+
+        original.issue_update.assert_called_once()
@@ -1,5 +1,5 @@
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -11,12 +11,26 @@ from mcp_tracker.tracker.proto.types.issues import (
     ChecklistItem,
     Issue,
     IssueAttachment,
+    IssueBatch,
     IssueComment,
     IssueLink,
+    IssueScrollPage,
     IssueTransition,
     Worklog,
 )
-from mcp_tracker.tracker.proto.types.refs import IssueReference
+from mcp_tracker.tracker.proto.types.refs import (
+    IssueReference,
+    IssueTypeReference,
+    StatusReference,
+)
+
+
+def issue_in_state(key: str, status: str, type: str = "bug") -> Issue:
+    return Issue(
+        key=key,
+        type=IssueTypeReference(key=type),
+        status=StatusReference(key=status),
+    )
 
 
 class TestCachingIssuesProtocol:
@@ -84,7 +98,9 @@ class TestCachingIssuesProtocol:
     ) -> None:
         result = await caching_issues_protocol.issue_get("TEST-1", auth=yandex_auth)
 
-        mock_original.issue_get.assert_called_once_with("TEST-1", auth=yandex_auth)
+        mock_original.issue_get.assert_called_once_with(
+            "TEST-1", fields=None, auth=yandex_auth
+        )
         assert result == mock_original.issue_get.return_value
 
     async def test_issues_get_links_calls_original(
@@ -121,7 +137,7 @@ class TestCachingIssuesProtocol:
         result = await caching_issues_protocol.issue_delete_link("TEST-1", 10)
 
         mock_original.issue_delete_link.assert_called_once_with("TEST-1", 10, auth=None)
-        assert result == mock_original.issue_delete_link.return_value
+        assert result is None
 
     async def test_issues_find_calls_original_with_all_params(
         self,
@@ -134,10 +150,87 @@ class TestCachingIssuesProtocol:
         )
 
         mock_original.issues_find.assert_called_once_with(
-            query="query", per_page=20, page=3, auth=yandex_auth
+            query="query", per_page=20, page=3, fields=None, auth=yandex_auth
         )
         assert result == mock_original.issues_find.return_value
 
+    async def test_issues_find_stream_is_not_cached(
+        self, caching_issues_protocol: Any, mock_original: AsyncMock
+    ) -> None:
+        stream = MagicMock()
+        mock_original.issues_find_stream = MagicMock(return_value=stream)
+
+        first = caching_issues_protocol.issues_find_stream("query", per_page=20)
+        second = caching_issues_protocol.issues_find_stream("query", per_page=20)
+
+        assert first is stream
+        assert second is stream
+        assert mock_original.issues_find_stream.call_count == 2
+        mock_original.issues_find_stream.assert_called_with(
+            "query", per_page=20, page=1, fields=None, auth=None
+        )
+
+    async def test_issues_get_many_primes_issue_get(
+        self,
+        caching_issues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+    ) -> None:
+        mock_original.issues_get_many.return_value = IssueBatch(
+            issues=[Issue(key="TEST-7", summary="Batch issue")], missing=["TEST-8"]
+        )
+
+        batch = await caching_issues_protocol.issues_get_many(
+            ["TEST-7", "TEST-8"], auth=yandex_auth
+        )
+        batch.issues[0].summary = "changed by caller"
+        issue = await caching_issues_protocol.issue_get("TEST-7", auth=yandex_auth)
+
+        assert issue.summary == "Batch issue"
+        mock_original.issue_get.assert_not_called()
+        mock_original.issues_get_many.assert_called_once_with(
+            ["TEST-7", "TEST-8"], auth=yandex_auth
+        )
+
+    async def test_issue_get_projection_is_part_of_cache_key(
+        self,
+        caching_issues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+    ) -> None:
+        await caching_issues_protocol.issue_get("TEST-1", auth=yandex_auth)
+        await caching_issues_protocol.issue_get(
+            "TEST-1", fields=["key", "summary"], auth=yandex_auth
+        )
+        await caching_issues_protocol.issue_get(
+            "TEST-1", fields=["key", "summary"], auth=yandex_auth
+        )
+
+        assert mock_original.issue_get.call_count == 2
+        mock_original.issue_get.assert_called_with(
+            "TEST-1", fields=["key", "summary"], auth=yandex_auth
+        )
+
+    async def test_issues_scroll_page_is_not_cached(
+        self, caching_issues_protocol: Any, mock_original: AsyncMock
+    ) -> None:
+        mock_original.issues_scroll_page.return_value = IssueScrollPage(
+            issues=[], next_scroll_id=None
+        )
+
+        await caching_issues_protocol.issues_scroll_page("query", scroll_id="s-1")
+        await caching_issues_protocol.issues_scroll_page("query", scroll_id="s-1")
+
+        assert mock_original.issues_scroll_page.call_count == 2
+        mock_original.issues_scroll_page.assert_called_with(
+            "query",
+            per_scroll=100,
+            scroll_id="s-1",
+            scroll_type="sorted",
+            scroll_ttl_millis=60000,
+            auth=None,
+        )
+
     async def test_issue_get_worklogs_calls_original(
         self, caching_issues_protocol: Any, mock_original: AsyncMock
     ) -> None:
@@ -200,6 +293,70 @@ class TestCachingIssuesProtocol:
         mock_original.issue_get_transitions.assert_called_once_with("TEST-1", auth=None)
         assert result == mock_original.issue_get_transitions.return_value
 
+    async def test_transitions_are_shared_by_issues_in_one_state(
+        self,
+        caching_issues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+    ) -> None:
+        mock_original.issues_get_many.return_value = IssueBatch(
+            issues=[
+                issue_in_state("TEST-1", "open"),
+                issue_in_state("TEST-2", "open"),
+                issue_in_state("TEST-3", "inProgress"),
+                issue_in_state("TEST-4", "open", type="task"),
+                issue_in_state("OTHER-1", "open"),
+            ]
+        )
+        await caching_issues_protocol.issues_get_many(
+            ["TEST-1", "TEST-2", "TEST-3", "TEST-4", "OTHER-1"], auth=yandex_auth
+        )
+
+        for issue_id in ("TEST-1", "TEST-2", "TEST-3", "TEST-4", "OTHER-1"):
+            result = await caching_issues_protocol.issue_get_transitions(
+                issue_id, auth=yandex_auth
+            )
+            assert result == mock_original.issue_get_transitions.return_value
+
+        assert [
+            call.args for call in mock_original.issue_get_transitions.call_args_list
+        ] == [("TEST-1",), ("TEST-3",), ("TEST-4",), ("OTHER-1",)]
+
+    async def test_transitions_of_issue_in_unknown_state_are_not_cached(
+        self, caching_issues_protocol: Any, mock_original: AsyncMock
+    ) -> None:
+        await caching_issues_protocol.issue_get_transitions("TEST-1")
+        await caching_issues_protocol.issue_get_transitions("TEST-1")
+
+        assert mock_original.issue_get_transitions.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("issue_execute_transition", ("TEST-1", "start")),
+            ("issue_close", ("TEST-1", "fixed")),
+        ],
+    )
+    async def test_status_change_forgets_workflow_state(
+        self,
+        caching_issues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+        method: str,
+        args: tuple[str, str],
+    ) -> None:
+        mock_original.issue_get.return_value = issue_in_state("TEST-1", "open")
+        await caching_issues_protocol.issue_get("TEST-1", auth=yandex_auth)
+        await caching_issues_protocol.issue_get_transitions("TEST-1", auth=yandex_auth)
+
+        await getattr(caching_issues_protocol, method)(*args, auth=yandex_auth)
+        mock_original.issue_get.return_value = issue_in_state("TEST-1", "inProgress")
+        await caching_issues_protocol.issue_get("TEST-1", auth=yandex_auth)
+        await caching_issues_protocol.issue_get_transitions("TEST-1", auth=yandex_auth)
+
+        assert mock_original.issue_get.call_count == 2
+        assert mock_original.issue_get_transitions.call_count == 2
+
     async def test_issue_get_changelog_calls_original(
         self,
         caching_issues_protocol: Any,
@@ -429,6 +586,42 @@ class TestCachingIssuesProtocol:
         )
         assert result == mock_original.issue_move.return_value
 
+    async def test_bulkchange_calls_are_not_cached(
+        self,
+        caching_issues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+    ) -> None:
+        await caching_issues_protocol.bulkchange_get("bc1", auth=yandex_auth)
+        await caching_issues_protocol.bulkchange_get("bc1", auth=yandex_auth)
+        await caching_issues_protocol.bulkchange_wait(
+            "bc1", timeout=5, auth=yandex_auth
+        )
+
+        assert mock_original.bulkchange_get.call_count == 2
+        mock_original.bulkchange_wait.assert_called_once_with(
+            "bc1", timeout=5, auth=yandex_auth
+        )
+
+    async def test_issues_bulk_move_calls_original(
+        self,
+        caching_issues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+    ) -> None:
+        result = await caching_issues_protocol.issues_bulk_move(
+            ["TEST-1"], "NEWQUEUE", initial_status=True, auth=yandex_auth
+        )
+
+        mock_original.issues_bulk_move.assert_called_once_with(
+            ["TEST-1"],
+            "NEWQUEUE",
+            move_all_fields=False,
+            initial_status=True,
+            auth=yandex_auth,
+        )
+        assert result == mock_original.issues_bulk_move.return_value
+
     async def test_issue_move_forwards_optional_flags(
         self,
         caching_issues_protocol: Any,
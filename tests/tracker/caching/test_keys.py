@@ -0,0 +1,149 @@
+import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic.fields import FieldInfo
+
+from mcp_tracker.tracker.caching.client import WorkflowState, make_cached_protocols
+from mcp_tracker.tracker.caching.keys import (
+    KEY_VERSION,
+    auth_scope,
+    key_builder,
+    normalize,
+    schema_hash,
+)
+from mcp_tracker.tracker.proto.common import YandexAuth
+from mcp_tracker.tracker.proto.types.issues import Issue
+from mcp_tracker.tracker.proto.types.refs import IssueReference
+from mcp_tracker.tracker.proto.types.statuses import Status
+
+ALICE = YandexAuth(token="alice-token", org_id="org")
+BOB = YandexAuth(token="bob-token", org_id="org")
+CAROL = YandexAuth(token="carol-token", org_id="other-org")
+
+
+async def get_statuses(self: object, *, auth: YandexAuth | None = None) -> None: ...
+
+
+async def issue_get(
+    self: object, issue_id: str, *, auth: YandexAuth | None = None
+) -> None: ...
+
+
+class TestAuthScope:
+    def test_org_wide_scope_ignores_token(self) -> None:
+        assert auth_scope(ALICE, org_wide=True) == auth_scope(BOB, org_wide=True)
+        assert auth_scope(ALICE, org_wide=True) != auth_scope(CAROL, org_wide=True)
+        assert auth_scope(None, org_wide=True) == "default"
+
+    def test_user_scope_is_a_hashed_identity(self) -> None:
+        scope = auth_scope(ALICE)
+
+        assert scope.startswith("user:")
+        assert "alice-token" not in scope
+        assert scope != auth_scope(BOB)
+        assert scope != auth_scope(YandexAuth(token="alice-token", org_id="other"))
+
+
+class TestKeyBuilder:
+    def test_keys_are_compact_and_readable(self) -> None:
+        build = key_builder(noself=True)
+
+        key = build(issue_get, object(), "TEST-1" * 100, auth=ALICE)
+
+        assert "alice-token" not in key
+        assert key.startswith(f"mcp_tracker:v{KEY_VERSION}:{schema_hash()}:")
+        assert key.split(":")[3] == "issue_get"
+        assert len(key) < 80
+
+    def test_equivalent_calls_share_a_key(self) -> None:
+        build = key_builder(noself=True)
+
+        assert build(issue_get, object(), "TEST-1") == build(
+            issue_get, object(), issue_id="TEST-1", auth=None
+        )
+        assert build(issue_get, object(), "TEST-1") != build(
+            issue_get, object(), "TEST-2"
+        )
+
+    def test_org_dictionaries_share_keys_across_users(self) -> None:
+        build = key_builder(noself=True)
+
+        assert build(get_statuses, None, auth=ALICE) == build(
+            get_statuses, None, auth=BOB
+        )
+        assert build(issue_get, None, "TEST-1", auth=ALICE) != build(
+            issue_get, None, "TEST-1", auth=BOB
+        )
+
+    def test_self_is_kept_unless_noself(self) -> None:
+        first, second = object(), object()
+
+        assert key_builder()(issue_get, first, "TEST-1") != key_builder()(
+            issue_get, second, "TEST-1"
+        )
+        assert key_builder(noself=True)(issue_get, first, "TEST-1") == key_builder(
+            noself=True
+        )(issue_get, second, "TEST-1")
+
+    def test_schema_change_changes_keys(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        before = key_builder()(issue_get, None, "TEST-1")
+        monkeypatch.setitem(Issue.model_fields, "new_field", FieldInfo())
+        schema_hash.cache_clear()
+        try:
+            after = key_builder()(issue_get, None, "TEST-1")
+        finally:
+            monkeypatch.undo()
+            schema_hash.cache_clear()
+
+        assert before != after
+
+
+class TestNormalize:
+    def test_values_are_normalized(self) -> None:
+        state = WorkflowState(queue="TEST", type="bug", status="open", issue_id="X-1")
+
+        assert normalize(
+            {
+                "date": datetime.date(2024, 1, 2),
+                "state": state,
+                "tags": {"b", "a"},
+                "model": IssueReference(key="TEST-1"),
+            }
+        ) == {
+            "date": "2024-01-02",
+            "model": normalize(IssueReference(key="TEST-1").model_dump(mode="json")),
+            "state": {"queue": "TEST", "type": "bug", "status": "open"},
+            "tags": ["a", "b"],
+        }
+
+
+class TestSharedEntries:
+    async def test_org_dictionaries_are_shared_by_the_org(self) -> None:
+        original = AsyncMock()
+        original.get_statuses.return_value = [
+            Status(version=1, key="open", name="Open", order=1)
+        ]
+        global_data = make_cached_protocols({"ttl": 300, "noself": True}).global_data(
+            original
+        )
+
+        for auth in (ALICE, BOB, CAROL):
+            await global_data.get_statuses(auth=auth)
+
+        assert [
+            call.kwargs["auth"] for call in original.get_statuses.call_args_list
+        ] == [
+            ALICE,
+            CAROL,
+        ]
+
+    async def test_issues_are_private_to_the_user(self) -> None:
+        original = AsyncMock()
+        original.issue_get.return_value = Issue(key="TEST-1")
+        issues = make_cached_protocols({"ttl": 300, "noself": True}).issues(original)
+
+        for auth in (ALICE, BOB, ALICE):
+            await issues.issue_get("TEST-1", auth=auth)
+
+        assert original.issue_get.call_count == 2
@@ -0,0 +1,238 @@
+import asyncio
+import pickle
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from aiocache import Cache
+from aiocache.base import BaseCache
+from aiocache.serializers import PickleSerializer
+
+from mcp_tracker.tracker.caching.client import make_cached_protocols
+from mcp_tracker.tracker.caching.local import (
+    LocalCache,
+    LocalCacheStats,
+    LocalCacheSync,
+    TieredCache,
+)
+from mcp_tracker.tracker.proto.fields import GlobalDataProtocol
+from mcp_tracker.tracker.proto.issues import IssueProtocol
+from mcp_tracker.tracker.proto.types.issues import Issue
+from mcp_tracker.tracker.proto.types.statuses import Status
+from tests.conftest import Clock
+
+
+class FakePubSub:
+    def __init__(self, redis: "FakeRedis"):
+        self._redis = redis
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def __aenter__(self) -> "FakePubSub":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self._redis.subscribers.remove(self._queue)
+
+    async def subscribe(self, channel: str) -> None:
+        self._redis.subscribers.append(self._queue)
+        self._queue.put_nowait({"type": "subscribe", "data": 1})
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self._queue.get()
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.subscribers: list[asyncio.Queue[dict[str, Any]]] = []
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self)
+
+    async def publish(self, channel: str, message: str) -> None:
+        for queue in self.subscribers:
+            queue.put_nowait({"type": "message", "data": message.encode()})
+
+
+@pytest.fixture
+def backend() -> BaseCache:
+    return Cache(Cache.MEMORY, serializer=PickleSerializer())
+
+
+class TestLocalCache:
+    def test_least_recently_used_bytes_are_evicted(self) -> None:
+        local = LocalCache(max_bytes=10)
+
+        local.set("a", b"1234")
+        local.set("b", b"1234")
+        local.get("a")
+        local.set("c", b"1234")
+
+        assert local.get("a") == b"1234"
+        assert local.get("b") is None
+        assert local.size == 8
+        assert local.stats == LocalCacheStats(hits=2, misses=1, evictions=1)
+
+    def test_oversized_entries_are_not_kept(self) -> None:
+        local = LocalCache(max_bytes=3)
+
+        local.set("a", b"1234")
+
+        assert local.get("a") is None
+        assert local.size == 0
+
+    def test_entries_expire_with_the_shorter_ttl(self, clock: Clock) -> None:
+        local = LocalCache(ttl=10, clock=clock)
+
+        local.set("a", b"a")
+        local.set("b", b"b", ttl=2)
+        clock.now = 2
+
+        assert local.get("a") == b"a"
+        assert local.get("b") is None
+        clock.now = 10
+        assert local.get("a") is None
+        assert local.size == 0
+
+    def test_reads_started_before_invalidation_are_not_stored(self) -> None:
+        local = LocalCache()
+
+        epoch = local.epoch
+        local.invalidate(["a"])
+        local.set("a", b"stale", epoch=epoch)
+
+        assert local.get("a") is None
+
+
+class TestTieredCache:
+    async def test_hits_are_served_locally_as_fresh_objects(
+        self, backend: BaseCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await backend.set("key", Issue(key="TEST-1"))
+        tiered = TieredCache(backend, LocalCache())
+        monkeypatch.setattr(backend, "get", AsyncMock(wraps=backend.get))
+
+        first = await tiered.get("key")
+        second = await tiered.get("key")
+
+        assert first == second == Issue(key="TEST-1")
+        assert first is not second
+        assert backend.get.call_count == 1  # type: ignore[attr-defined]
+
+    async def test_object_hits_skip_deserialization(
+        self, backend: BaseCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        await backend.set("key", [Issue(key="TEST-1")])
+        local = LocalCache()
+        tiered = TieredCache(backend, local, objects=True)
+        loads = Mock(wraps=backend.serializer.loads)
+        monkeypatch.setattr(backend.serializer, "loads", loads)
+
+        first = await tiered.get("key")
+        first[0].summary = "Changed"
+        second = await tiered.get("key")
+        second.append(Issue(key="TEST-2"))
+
+        assert await tiered.get("key") == [Issue(key="TEST-1")]
+        assert loads.call_count == 1
+        assert local.size == len(pickle.dumps([Issue(key="TEST-1")]))
+
+    async def test_misses_are_not_stored(self, backend: BaseCache) -> None:
+        local = LocalCache()
+        tiered = TieredCache(backend, local)
+
+        assert await tiered.get("key", default=0) == 0
+        assert local.size == 0
+
+    async def test_writes_and_deletes_reach_both_tiers(
+        self, backend: BaseCache
+    ) -> None:
+        tiered = TieredCache(backend, LocalCache())
+
+        await tiered.set("key", "value", ttl=60)
+        assert await tiered.get("key") == "value"
+
+        await tiered.delete("key")
+        assert await tiered.get("key") is None
+        assert await backend.get("key") is None
+
+
+class TestLocalCacheSync:
+    async def test_writes_invalidate_other_replicas(self, backend: BaseCache) -> None:
+        redis = FakeRedis()
+        replicas = []
+        for _ in range(2):
+            local = LocalCache()
+            sync = LocalCacheSync(redis, local)
+            sync.start()
+            replicas.append((TieredCache(backend, local, sync), local, sync))
+        await asyncio.sleep(0.01)
+
+        [(first, _, _), (second, second_local, _)] = replicas
+        await first.set("key", "old")
+        await asyncio.sleep(0.01)
+        assert await second.get("key") == "old"
+
+        await first.set("key", "new")
+        await asyncio.sleep(0.01)
+
+        assert await second.get("key") == "new"
+        assert second_local.stats.invalidations == 1
+        for _, _, sync in replicas:
+            await sync.close()
+
+    def test_own_messages_are_ignored(self) -> None:
+        local = LocalCache()
+        sync = LocalCacheSync(FakeRedis(), local)
+        local.set("key", b"value")
+
+        sync.handle({"type": "subscribe", "data": 1})
+        sync.handle(
+            {
+                "type": "message",
+                "data": f'{{"origin": "{sync._origin}", "keys": ["key"]}}',
+            }
+        )
+        assert local.get("key") == b"value"
+
+        sync.handle({"type": "message", "data": '{"origin": "x", "keys": ["key"]}'})
+        assert local.get("key") is None
+
+
+class TestLocalCacheInProtocols:
+    async def test_invalidation_reaches_local_cache(self) -> None:
+        original = AsyncMock(spec=IssueProtocol)
+        original.issue_get.return_value = Issue(key="TEST-1")
+        local = LocalCache()
+        issues = make_cached_protocols(
+            {"ttl": 300, "serializer": PickleSerializer()}, local=local
+        ).issues(original)
+
+        await issues.issue_get("TEST-1")
+        await issues.issue_get("TEST-1")
+        await issues.issue_update("TEST-1", summary="New")
+        await issues.issue_get("TEST-1")
+
+        assert original.issue_get.call_count == 2
+        assert local.stats.hits == 1
+
+    async def test_statuses_are_kept_as_objects(self) -> None:
+        original = AsyncMock(spec=GlobalDataProtocol)
+        original.get_statuses.return_value = [
+            Status(id="1", version=1, key="open", name="Open", order=1)
+        ]
+        serializer = PickleSerializer()
+        global_data = make_cached_protocols(
+            {"ttl": 300, "serializer": serializer}, local=LocalCache()
+        ).global_data(original)
+        [first_status] = await global_data.get_statuses()
+
+        with patch.object(serializer, "loads", wraps=serializer.loads) as loads:
+            first = await global_data.get_statuses()
+            first.clear()
+            second = await global_data.get_statuses()
+
+        assert second == original.get_statuses.return_value
+        assert second[0] is first_status
+        assert loads.call_count == 0
@@ -0,0 +1,143 @@
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_tracker.settings import Settings
+from mcp_tracker.tracker.caching.client import make_cached_protocols
+from mcp_tracker.tracker.caching.policy import CachePolicy
+from mcp_tracker.tracker.proto.issues import IssueProtocol
+from mcp_tracker.tracker.proto.types.issues import Issue, IssueBatch
+
+
+class TestCachePolicy:
+    @pytest.mark.parametrize(
+        ("protocol", "method", "ttl"),
+        [
+            ("issues", "issues_find", 0),
+            ("issues", "issue_get", 600),
+            ("issues", "issues_count", 600),
+            ("queues", "queue_get", 3600),
+            ("global_data", "get_statuses", 86400),
+            ("users", "user_get", 30),
+            ("other", "method", 3600),
+        ],
+    )
+    def test_lookup_order(self, protocol: str, method: str, ttl: int) -> None:
+        policy = CachePolicy(
+            default_ttl=3600,
+            ttls={"issues_find": 0, "issues": 600, "user_get": 30},
+            defaults={"issues_count": 60, "issues": 300, "global_data": 86400},
+        )
+
+        assert policy.ttl(protocol, method) == ttl
+
+    def test_max_ttl(self) -> None:
+        assert CachePolicy(default_ttl=60, ttls={"a": 120}).max_ttl == 86400
+        assert CachePolicy(default_ttl=60, defaults={}).max_ttl == 60
+        assert CachePolicy(default_ttl=None).max_ttl is None
+
+
+class TestSettingsTTLs:
+    def test_parses_env_list(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TOOLS_CACHE_TTLS", "global_data=86400, issues_find=0,")
+
+        settings = Settings(tracker_token="token", _env_file=None)  # type: ignore[call-arg]
+
+        assert settings.tools_cache_ttls == {"global_data": 86400, "issues_find": 0}
+        assert settings.cache_policy().ttl("issues", "issues_find") == 0
+
+    def test_rejects_malformed_items(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("TOOLS_CACHE_TTLS", "issues_find")
+
+        with pytest.raises(ValidationError):
+            Settings(tracker_token="token", _env_file=None)  # type: ignore[call-arg]
+
+    @pytest.mark.parametrize(
+        ("protocol", "method"),
+        [
+            ("issues", "issue_get"),
+            ("issues", "issues_find"),
+            ("global_data", "get_statuses"),
+            ("queues", "queue_get"),
+            ("users", "user_get"),
+        ],
+    )
+    def test_explicit_redis_ttl_wins_over_defaults(
+        self, monkeypatch: pytest.MonkeyPatch, protocol: str, method: str
+    ) -> None:
+        monkeypatch.setenv("TOOLS_CACHE_REDIS_TTL", "30")
+
+        policy = Settings(tracker_token="token", _env_file=None).cache_policy()  # type: ignore[call-arg]
+
+        assert policy.ttl(protocol, method) == 30
+        assert policy.max_ttl == 30
+
+    def test_ttls_override_explicit_redis_ttl(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TOOLS_CACHE_REDIS_TTL", "30")
+        monkeypatch.setenv("TOOLS_CACHE_TTLS", "global_data=600")
+
+        policy = Settings(tracker_token="token", _env_file=None).cache_policy()  # type: ignore[call-arg]
+
+        assert policy.ttl("global_data", "get_statuses") == 600
+        assert policy.ttl("issues", "issue_get") == 30
+
+    def test_defaults_apply_while_redis_ttl_is_unset(self) -> None:
+        policy = Settings(tracker_token="token", _env_file=None).cache_policy()  # type: ignore[call-arg]
+
+        assert policy.ttl("issues", "issue_get") == 300
+        assert policy.ttl("global_data", "get_statuses") == 86400
+
+
+class TestPolicyAppliedToProtocols:
+    @pytest.fixture
+    def original(self) -> AsyncMock:
+        original = AsyncMock(spec=IssueProtocol)
+        original.issue_get.return_value = Issue(key="TEST-1")
+        original.issues_get_many.return_value = IssueBatch(issues=[Issue(key="TEST-1")])
+        original.issues_find.return_value = [Issue(key="TEST-1")]
+        original.issues_count.return_value = 1
+        return original
+
+    def issues(self, original: AsyncMock, **ttls: int) -> Any:
+        policy = CachePolicy(default_ttl=300, ttls=ttls)
+        return make_cached_protocols({"ttl": 300}, policy).issues(original)
+
+    async def test_disabled_method_always_calls_original(
+        self, original: AsyncMock
+    ) -> None:
+        issues = self.issues(original, issues_find=0)
+
+        await issues.issues_find("Queue: TEST")
+        await issues.issues_find("Queue: TEST")
+        await issues.issues_count("Queue: TEST")
+        await issues.issues_count("Queue: TEST")
+
+        assert original.issues_find.call_count == 2
+        assert original.issues_count.call_count == 1
+
+    async def test_disabled_protocol_is_not_primed(self, original: AsyncMock) -> None:
+        issues = self.issues(original, issues=0)
+
+        await issues.issues_get_many(["TEST-1"])
+        await issues.issue_get("TEST-1")
+        await issues.issue_get("TEST-1", fields=["summary"])
+        await issues.issue_update("TEST-1", summary="New")
+        await issues.issue_get("TEST-1")
+
+        assert original.issue_get.call_count == 3
+
+    async def test_entries_use_method_ttl(
+        self, original: AsyncMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        issues = self.issues(original, issue_get=42)
+        cache = type(issues)._issue_get.cache
+        monkeypatch.setattr(cache, "set", AsyncMock(wraps=cache.set))
+
+        await issues.issue_get("TEST-1")
+        await issues.issues_get_many(["TEST-1"])
+
+        assert [call.kwargs["ttl"] for call in cache.set.call_args_list] == [42, 42]
@@ -52,7 +52,7 @@ class TestCachingQueuesProtocol:
         )
 
         mock_original.queues_list.assert_called_once_with(
-            per_page=50, page=2, auth=yandex_auth
+            per_page=50, page=2, fields=None, auth=yandex_auth
         )
         assert result == mock_original.queues_list.return_value
 
@@ -62,10 +62,28 @@ class TestCachingQueuesProtocol:
         result = await caching_queues_protocol.queues_list(per_page=100, page=1)
 
         mock_original.queues_list.assert_called_once_with(
-            per_page=100, page=1, auth=None
+            per_page=100, page=1, fields=None, auth=None
         )
         assert result == mock_original.queues_list.return_value
 
+    async def test_queues_list_all_is_cached_as_one_unit(
+        self,
+        caching_queues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+    ) -> None:
+        mock_original.queues_list_all.return_value = [
+            Queue(id=1, key="TEST", name="Test Queue")
+        ]
+
+        first = await caching_queues_protocol.queues_list_all(auth=yandex_auth)
+        second = await caching_queues_protocol.queues_list_all(auth=yandex_auth)
+
+        assert first == second == mock_original.queues_list_all.return_value
+        mock_original.queues_list_all.assert_called_once_with(
+            per_page=100, fields=None, auth=yandex_auth
+        )
+
     async def test_queues_get_local_fields_calls_original(
         self,
         caching_queues_protocol: Any,
@@ -122,6 +140,25 @@ class TestCachingQueuesProtocol:
         )
         assert result == mock_original.queue_create_version.return_value
 
+    async def test_queue_create_version_drops_versions_of_every_user(
+        self,
+        caching_queues_protocol: Any,
+        mock_original: AsyncMock,
+        yandex_auth: YandexAuth,
+    ) -> None:
+        other = YandexAuth(token="other-token", org_id=yandex_auth.org_id)
+        await caching_queues_protocol.queues_get_versions("TEST", auth=yandex_auth)
+        await caching_queues_protocol.queues_get_versions("TEST", auth=other)
+
+        await caching_queues_protocol.queue_create_version(
+            "TEST", name="2.0", auth=yandex_auth
+        )
+        await caching_queues_protocol.queues_get_versions("TEST", auth=yandex_auth)
+        await caching_queues_protocol.queues_get_versions("TEST", auth=other)
+        await caching_queues_protocol.queues_get_versions("TEST", auth=other)
+
+        assert mock_original.queues_get_versions.call_count == 4
+
     async def test_queues_get_fields_calls_original(
         self,
         caching_queues_protocol: Any,
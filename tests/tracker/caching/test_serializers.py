@@ -0,0 +1,126 @@
+import pickle
+from typing import Any
+
+import pytest
+from aiocache.serializers import PickleSerializer
+from pydantic import BaseModel
+
+from mcp_tracker.settings import Settings
+from mcp_tracker.tracker.caching.serializers import ModelSerializer, type_tag
+from mcp_tracker.tracker.proto.types.issues import Issue, IssueLink
+from mcp_tracker.tracker.proto.types.refs import IssueReference
+from mcp_tracker.tracker.proto.types.statuses import Status
+
+
+def issues_page(count: int = 50) -> list[Issue]:
+    return [
+        Issue.model_validate(
+            {
+                "self": f"https://api.tracker.yandex.net/v3/issues/TEST-{idx}",
+                "id": f"593cd211ef7e8a33{idx:08d}",
+                "key": f"TEST-{idx}",
+                "version": idx,
+                "summary": f"Issue number {idx}",
+                "description": f"Steps to reproduce issue {idx}: " + "x" * idx,
+                "status": {"id": "1", "key": "open", "display": "Open"},
+                "type": {"id": "1", "key": "bug", "display": "Bug"},
+                "createdBy": {"id": f"user{idx}", "display": f"User {idx}"},
+                "followers": [{"id": "1", "display": "A"}],
+                "createdAt": "2023-01-01T12:00:00.000+0000",
+                "tags": ["backend", f"tag{idx}"],
+                "customField": {"value": idx},
+            }
+        )
+        for idx in range(count)
+    ]
+
+
+class Foreign(BaseModel):
+    key: str
+
+
+class TestModelSerializer:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            issues_page(),
+            Issue(key="TEST-1", summary="Summary"),
+            [IssueLink(id=1, object=IssueReference(key="TEST-2"))],
+            [Status(version=1, key="open", name="Open", order=1)],
+            [],
+            ["tag1", "tag2"],
+            42,
+            "generation-token",
+        ],
+    )
+    def test_round_trip(self, value: Any) -> None:
+        serializer = ModelSerializer()
+
+        loaded = serializer.loads(serializer.dumps(value))
+
+        assert loaded == value
+        assert type(loaded) is type(value)
+
+    def test_extra_fields_survive(self) -> None:
+        serializer = ModelSerializer()
+        [issue] = issues_page(1)
+
+        loaded = serializer.loads(serializer.dumps(issue))
+
+        assert loaded.model_extra["customField"] == {"value": 0}
+
+    def test_large_payloads_are_compressed(self) -> None:
+        page = issues_page()
+
+        compressed = ModelSerializer(compress_min_bytes=1024).dumps(page)
+        plain = ModelSerializer(compress_min_bytes=0).dumps(page)
+
+        assert len(compressed) < len(plain) / 4
+        assert len(compressed) < len(PickleSerializer().dumps(page)) / 2
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            Foreign(key="A"),
+            [Issue(key="A"), IssueReference(key="B")],
+            [Issue(), object()],
+        ],
+    )
+    def test_only_proto_models_are_stored(self, value: Any) -> None:
+        with pytest.raises(TypeError):
+            ModelSerializer().dumps(value)
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pickle.dumps(Issue(key="TEST-1")),
+            b"mt1j" + b"Gone\n{}",
+            b"mt1x" + b"\n{}",
+            b"mt1z" + b"not zlib",
+        ],
+    )
+    def test_unreadable_entries_are_misses(self, raw: bytes) -> None:
+        assert ModelSerializer().loads(raw) is None
+
+    def test_type_tags(self) -> None:
+        assert type_tag(Issue()) == "Issue"
+        assert type_tag([Issue()]) == "list[Issue]"
+        assert type_tag(["a"]) == ""
+
+
+class TestSettingsSerializer:
+    def test_pickle_can_be_selected(self) -> None:
+        settings = Settings(
+            tracker_token="token",
+            tools_cache_serializer="pickle",
+            _env_file=None,  # type: ignore[call-arg]
+        )
+
+        assert isinstance(settings.cache_kwargs()["serializer"], PickleSerializer)
+
+    def test_json_is_the_default(self) -> None:
+        settings = Settings(tracker_token="token", _env_file=None)  # type: ignore[call-arg]
+
+        serializer = settings.cache_kwargs()["serializer"]
+        assert isinstance(serializer, ModelSerializer)
+        assert serializer.compress_min_bytes == 1024
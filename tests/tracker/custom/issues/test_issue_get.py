@@ -54,6 +54,25 @@ class TestIssueGet:
             }
         )
 
+    async def test_with_fields(self, tracker_client: TrackerClient) -> None:
+        capture = RequestCapture(payload={"key": "TEST-123", "summary": "Summary"})
+
+        with aioresponses() as m:
+            m.get(
+                "https://api.tracker.yandex.net/v3/issues/TEST-123"
+                "?fields=key,summary,previousStatus",
+                callback=capture.callback,
+            )
+
+            result = await tracker_client.issue_get(
+                "TEST-123", fields=["key", "summary", "previous_status"]
+            )
+
+            assert result.summary == "Summary"
+            assert result.description is None
+
+        capture.last_request.assert_params({"fields": "key,summary,previousStatus"})
+
     async def test_not_found(self, tracker_client: TrackerClient) -> None:
         with aioresponses() as m:
             m.get("https://api.tracker.yandex.net/v3/issues/NOTFOUND-123", status=404)
@@ -0,0 +1,167 @@
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+
+from mcp_tracker.tracker.custom import client as client_module
+from mcp_tracker.tracker.custom.client import TrackerClient
+from mcp_tracker.tracker.proto.types.bulkchange import BulkChange, BulkChangeResult
+from tests.aioresponses_utils import RequestCapture
+
+BULKCHANGE_URL = "https://api.tracker.yandex.net/v2/bulkchange"
+
+
+def bulk_change_data(status: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "self": f"{BULKCHANGE_URL}/bc1",
+        "id": "bc1",
+        "status": status,
+        "statusText": extra.pop("statusText", None),
+        "createdAt": "2024-01-01T00:00:00.000+0000",
+        **extra,
+    }
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(client_module, "BULKCHANGE_POLL_INITIAL", 0.001)
+    monkeypatch.setattr(client_module, "BULKCHANGE_POLL_MAX", 0.001)
+
+
+class TestIssuesBulkChange:
+    async def test_bulk_update(self, tracker_client: TrackerClient) -> None:
+        capture = RequestCapture(payload=bulk_change_data("CREATED"))
+
+        with aioresponses() as m:
+            m.post(f"{BULKCHANGE_URL}/_update", callback=capture.callback)
+
+            result = await tracker_client.issues_bulk_update(
+                ["TEST-1", "TEST-2"], {"priority": "critical"}
+            )
+
+        assert result.id == "bc1"
+        assert not result.finished
+        capture.last_request.assert_json_body(
+            {"issues": ["TEST-1", "TEST-2"], "values": {"priority": "critical"}}
+        )
+
+    async def test_bulk_transition_puts_comment_into_values(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        capture = RequestCapture(payload=bulk_change_data("CREATED"))
+
+        with aioresponses() as m:
+            m.post(f"{BULKCHANGE_URL}/_transition", callback=capture.callback)
+
+            await tracker_client.issues_bulk_transition(
+                ["TEST-1"],
+                "close",
+                comment="Done",
+                fields={"resolution": "fixed"},
+            )
+
+        capture.last_request.assert_json_body(
+            {
+                "transition": "close",
+                "issues": ["TEST-1"],
+                "values": {"resolution": "fixed", "comment": "Done"},
+            }
+        )
+
+    async def test_bulk_transition_without_values(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        capture = RequestCapture(payload=bulk_change_data("CREATED"))
+
+        with aioresponses() as m:
+            m.post(f"{BULKCHANGE_URL}/_transition", callback=capture.callback)
+
+            await tracker_client.issues_bulk_transition(["TEST-1"], "start")
+
+        capture.last_request.assert_json_body(
+            {"transition": "start", "issues": ["TEST-1"]}
+        )
+
+    async def test_bulk_move(self, tracker_client: TrackerClient) -> None:
+        capture = RequestCapture(payload=bulk_change_data("CREATED"))
+
+        with aioresponses() as m:
+            m.post(f"{BULKCHANGE_URL}/_move", callback=capture.callback)
+
+            await tracker_client.issues_bulk_move(
+                ["TEST-1"], "NEWQUEUE", move_all_fields=True
+            )
+
+        capture.last_request.assert_json_body(
+            {"queue": "NEWQUEUE", "issues": ["TEST-1"], "moveAllFields": True}
+        )
+
+
+class TestBulkChangeWait:
+    async def test_polls_until_finished(self, tracker_client: TrackerClient) -> None:
+        with aioresponses() as m:
+            m.get(f"{BULKCHANGE_URL}/bc1", payload=bulk_change_data("CREATED"))
+            m.get(f"{BULKCHANGE_URL}/bc1", payload=bulk_change_data("RUNNING"))
+            m.get(
+                f"{BULKCHANGE_URL}/bc1",
+                payload=bulk_change_data(
+                    "COMPLETED", totalIssues=2, totalCompletedIssues=2
+                ),
+            )
+
+            result = await tracker_client.bulkchange_wait("bc1", timeout=5)
+
+        assert result.status == "COMPLETED"
+        assert result.total_completed_issues == 2
+
+    async def test_returns_unfinished_state_on_timeout(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            m.get(
+                f"{BULKCHANGE_URL}/bc1",
+                payload=bulk_change_data("RUNNING"),
+                repeat=True,
+            )
+
+            result = await tracker_client.bulkchange_wait("bc1", timeout=0.01)
+
+        assert result.status == "RUNNING"
+        assert not result.finished
+
+
+class TestBulkChangeResult:
+    @pytest.mark.parametrize(
+        ("bulk_change", "success", "error"),
+        [
+            (BulkChange(id="bc1", status="COMPLETED"), True, None),
+            (
+                BulkChange(
+                    id="bc1",
+                    status="COMPLETED",
+                    totalIssues=2,
+                    totalCompletedIssues=1,
+                ),
+                None,
+                "Only 1 of 2 issues were changed, check the issues to find out which ones",
+            ),
+            (
+                BulkChange(id="bc1", status="FAILED", statusText="No access"),
+                False,
+                "No access",
+            ),
+            (
+                BulkChange(id="bc1", status="RUNNING"),
+                None,
+                "Bulk change is still RUNNING",
+            ),
+        ],
+    )
+    def test_job_outcome(
+        self, bulk_change: BulkChange, success: bool | None, error: str | None
+    ) -> None:
+        result = BulkChangeResult.from_bulk_change(bulk_change, ["A-1", "A-2"])
+
+        assert result.issues == ["A-1", "A-2"]
+        assert result.success is success
+        assert result.error == error
@@ -48,3 +48,87 @@ class TestIssuesFind:
         capture.assert_called_once()
         capture.last_request.assert_params({"perPage": 50, "page": 2})
         capture.last_request.assert_json_field("query", "Queue: TEST")
+
+    async def test_with_fields(self, tracker_client: TrackerClient) -> None:
+        capture = RequestCapture(payload=[{"key": "TEST-123", "storyPoints": 3}])
+
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search"
+                "?page=1&perPage=15&fields=key,storyPoints,createdAt",
+                callback=capture.callback,
+            )
+
+            result = await tracker_client.issues_find(
+                "Queue: TEST", fields=["key", "story_points", "created_at"]
+            )
+
+            assert result[0].key == "TEST-123"
+            assert result[0].story_points == 3
+
+        capture.last_request.assert_params(
+            {"perPage": 15, "page": 1, "fields": "key,storyPoints,createdAt"}
+        )
+
+
+class TestIssuesFindStream:
+    async def test_yields_issues(
+        self, tracker_client: TrackerClient, sample_issue_data: dict[str, Any]
+    ) -> None:
+        search_response = [
+            sample_issue_data,
+            {**sample_issue_data, "key": "TEST-124", "description": "a, [b] {c}"},
+        ]
+        capture = RequestCapture(payload=search_response)
+
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search?page=2&perPage=50",
+                callback=capture.callback,
+            )
+
+            result = [
+                issue
+                async for issue in tracker_client.issues_find_stream(
+                    "Queue: TEST", per_page=50, page=2
+                )
+            ]
+
+        assert [issue.key for issue in result] == ["TEST-123", "TEST-124"]
+        assert result[1].description == "a, [b] {c}"
+        capture.last_request.assert_json_field("query", "Queue: TEST")
+
+    async def test_with_fields(self, tracker_client: TrackerClient) -> None:
+        capture = RequestCapture(payload=[{"key": "TEST-123", "storyPoints": 3}])
+
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search"
+                "?page=1&perPage=15&fields=key,storyPoints",
+                callback=capture.callback,
+            )
+
+            result = [
+                issue
+                async for issue in tracker_client.issues_find_stream(
+                    "Queue: TEST", fields=["key", "story_points"]
+                )
+            ]
+
+        assert [issue.story_points for issue in result] == [3]
+        capture.last_request.assert_params(
+            {"perPage": 15, "page": 1, "fields": "key,storyPoints"}
+        )
+
+    async def test_empty_page(self, tracker_client: TrackerClient) -> None:
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search?page=1&perPage=15",
+                payload=[],
+            )
+
+            result = [
+                issue async for issue in tracker_client.issues_find_stream("Queue: X")
+            ]
+
+        assert result == []
@@ -0,0 +1,86 @@
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from mcp_tracker.tracker.custom import client as client_module
+from mcp_tracker.tracker.custom.client import TrackerClient
+from mcp_tracker.tracker.proto.types.issues import IssueBatch
+from tests.aioresponses_utils import RequestCapture
+
+
+class TestIssuesGetMany:
+    async def test_success(
+        self, tracker_client: TrackerClient, sample_issue_data: dict[str, Any]
+    ) -> None:
+        capture = RequestCapture(
+            payload=[
+                {**sample_issue_data, "key": "TEST-2"},
+                {**sample_issue_data, "key": "TEST-1"},
+            ]
+        )
+
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search?perPage=3",
+                callback=capture.callback,
+            )
+
+            result = await tracker_client.issues_get_many(
+                ["TEST-1", "TEST-2", "TEST-3", "TEST-1"]
+            )
+
+        assert isinstance(result, IssueBatch)
+        assert [issue.key for issue in result.issues] == ["TEST-1", "TEST-2"]
+        assert result.missing == ["TEST-3"]
+        capture.assert_request_count(1)
+        capture.last_request.assert_json_body({"keys": ["TEST-1", "TEST-2", "TEST-3"]})
+
+    async def test_keys_are_requested_in_chunks(
+        self,
+        tracker_client: TrackerClient,
+        sample_issue_data: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(client_module, "ISSUES_GET_MANY_CHUNK", 2)
+
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search?perPage=2",
+                payload=[{**sample_issue_data, "key": "TEST-1"}],
+                repeat=True,
+            )
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search?perPage=1",
+                payload=[{**sample_issue_data, "key": "TEST-5"}],
+            )
+
+            result = await tracker_client.issues_get_many(
+                ["TEST-1", "TEST-2", "TEST-3", "TEST-4", "TEST-5"]
+            )
+
+            url = URL("https://api.tracker.yandex.net/v3/issues/_search?perPage=2")
+            assert len(m.requests[("POST", url)]) == 2
+
+        assert [issue.key for issue in result.issues] == ["TEST-1", "TEST-5"]
+        assert result.missing == ["TEST-2", "TEST-3", "TEST-4"]
+
+    async def test_key_match_is_case_insensitive(
+        self, tracker_client: TrackerClient, sample_issue_data: dict[str, Any]
+    ) -> None:
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues/_search?perPage=1",
+                payload=[{**sample_issue_data, "key": "TEST-1"}],
+            )
+
+            result = await tracker_client.issues_get_many(["test-1"])
+
+        assert len(result.issues) == 1
+        assert result.missing == []
+
+    async def test_empty_keys(self, tracker_client: TrackerClient) -> None:
+        result = await tracker_client.issues_get_many([])
+
+        assert result == IssueBatch(issues=[], missing=[])
@@ -0,0 +1,112 @@
+import re
+from typing import Any
+
+import pytest
+from aiohttp import ClientResponseError
+from aioresponses import aioresponses
+from pytest_mock import MockerFixture
+
+from mcp_tracker.tracker.custom.client import TrackerClient
+from mcp_tracker.tracker.custom.retry import RetryPolicy
+from mcp_tracker.tracker.proto.types.issues import IssueScrollPage
+
+SEARCH_URL = re.compile(r"^https://api\.tracker\.yandex\.net/v3/issues/_search\?.*$")
+
+
+def issues(sample_issue_data: dict[str, Any], *keys: str) -> list[dict[str, Any]]:
+    return [{**sample_issue_data, "key": key} for key in keys]
+
+
+def sent_params(m: aioresponses) -> list[dict[str, str]]:
+    return [dict(url.query) for (_, url) in m.requests]
+
+
+class TestIssuesScrollPage:
+    async def test_first_page(
+        self, tracker_client: TrackerClient, sample_issue_data: dict[str, Any]
+    ) -> None:
+        with aioresponses() as m:
+            m.post(
+                SEARCH_URL,
+                payload=issues(sample_issue_data, "TEST-1", "TEST-2"),
+                headers={"X-Scroll-Id": "scroll-1"},
+            )
+
+            page = await tracker_client.issues_scroll_page("Queue: TEST", per_scroll=2)
+
+            assert sent_params(m) == [
+                {"perScroll": "2", "scrollTTLMillis": "60000", "scrollType": "sorted"}
+            ]
+
+        assert isinstance(page, IssueScrollPage)
+        assert [issue.key for issue in page.issues] == ["TEST-1", "TEST-2"]
+        assert page.next_scroll_id == "scroll-1"
+
+    async def test_continuation_passes_scroll_id(
+        self, tracker_client: TrackerClient, sample_issue_data: dict[str, Any]
+    ) -> None:
+        with aioresponses() as m:
+            m.post(
+                SEARCH_URL,
+                payload=issues(sample_issue_data, "TEST-3"),
+                headers={"X-Scroll-Id": "scroll-1"},
+            )
+
+            page = await tracker_client.issues_scroll_page(
+                "Queue: TEST", per_scroll=2, scroll_id="scroll-1"
+            )
+
+            assert sent_params(m)[0]["scrollId"] == "scroll-1"
+            assert "scrollType" not in sent_params(m)[0]
+
+        assert page.next_scroll_id is None
+
+
+class TestIssuesScroll:
+    async def test_iterates_until_exhausted(
+        self, tracker_client: TrackerClient, sample_issue_data: dict[str, Any]
+    ) -> None:
+        with aioresponses() as m:
+            m.post(
+                SEARCH_URL,
+                payload=issues(sample_issue_data, "TEST-1", "TEST-2"),
+                headers={"X-Scroll-Id": "scroll-1"},
+            )
+            m.post(
+                SEARCH_URL,
+                payload=issues(sample_issue_data, "TEST-3", "TEST-4"),
+                headers={"X-Scroll-Id": "scroll-2"},
+            )
+            m.post(SEARCH_URL, payload=[], headers={"X-Scroll-Id": "scroll-3"})
+
+            keys = [
+                issue.key
+                async for issue in tracker_client.issues_scroll(
+                    "Queue: TEST", per_scroll=2
+                )
+            ]
+
+        assert keys == ["TEST-1", "TEST-2", "TEST-3", "TEST-4"]
+
+    async def test_continuation_is_not_retried(
+        self, sample_issue_data: dict[str, Any], mocker: MockerFixture
+    ) -> None:
+        mocker.patch("mcp_tracker.tracker.custom.client.asyncio.sleep")
+        client = TrackerClient(
+            token="token", org_id="org", retry=RetryPolicy(max_attempts=3)
+        )
+
+        with aioresponses() as m:
+            m.post(
+                SEARCH_URL,
+                payload=issues(sample_issue_data, "TEST-1"),
+                headers={"X-Scroll-Id": "scroll-1"},
+            )
+            m.post(SEARCH_URL, status=503)
+
+            with pytest.raises(ClientResponseError):
+                async for _ in client.issues_scroll("Queue: TEST", per_scroll=1):
+                    pass
+        await client.close()
+
+        assert client.retry_stats.retries == 0
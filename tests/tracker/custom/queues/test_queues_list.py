@@ -76,3 +76,96 @@ class TestQueuesList:
                 "X-Cloud-Org-ID": "cloud-org",
             }
         )
+
+    async def test_with_fields(self, tracker_client: TrackerClient) -> None:
+        capture = RequestCapture(payload=[{"key": "TEST", "name": "Test Queue"}])
+
+        with aioresponses() as m:
+            m.get(
+                "https://api.tracker.yandex.net/v3/queues"
+                "?page=1&perPage=100&fields=key,name",
+                callback=capture.callback,
+            )
+
+            result = await tracker_client.queues_list(fields=["key", "name"])
+
+            assert result[0].key == "TEST"
+            assert result[0].description is None
+
+        capture.last_request.assert_params(
+            {"perPage": 100, "page": 1, "fields": "key,name"}
+        )
+
+
+class TestQueuesListAll:
+    @staticmethod
+    def queue(key: str) -> dict[str, Any]:
+        return {"id": 1, "key": key, "name": key}
+
+    async def test_prefetches_pages_from_total_pages(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        url = "https://api.tracker.yandex.net/v3/queues?perPage=2&page={}"
+
+        with aioresponses() as m:
+            m.get(
+                url.format(1),
+                payload=[self.queue("A"), self.queue("B")],
+                headers={"X-Total-Pages": "3", "X-Total-Count": "5"},
+            )
+            m.get(url.format(2), payload=[self.queue("C"), self.queue("D")])
+            m.get(url.format(3), payload=[self.queue("E")])
+
+            result = await tracker_client.queues_list_all(per_page=2)
+
+            # No trailing request for an empty page
+            assert len(m.requests) == 3
+
+        assert [queue.key for queue in result] == ["A", "B", "C", "D", "E"]
+
+    async def test_total_count_is_used_without_total_pages(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        url = "https://api.tracker.yandex.net/v3/queues?perPage=2&page={}"
+
+        with aioresponses() as m:
+            m.get(
+                url.format(1),
+                payload=[self.queue("A"), self.queue("B")],
+                headers={"X-Total-Count": "3"},
+            )
+            m.get(url.format(2), payload=[self.queue("C")])
+
+            result = await tracker_client.queues_list_all(per_page=2)
+
+            assert len(m.requests) == 2
+
+        assert [queue.key for queue in result] == ["A", "B", "C"]
+
+    async def test_reads_until_empty_page_without_totals(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        url = "https://api.tracker.yandex.net/v3/queues?perPage=2&page={}"
+
+        with aioresponses() as m:
+            m.get(url.format(1), payload=[self.queue("A"), self.queue("B")])
+            m.get(url.format(2), payload=[self.queue("C")])
+            m.get(url.format(3), payload=[])
+
+            result = await tracker_client.queues_list_all(per_page=2)
+
+        assert [queue.key for queue in result] == ["A", "B", "C"]
+
+    async def test_single_page(self, tracker_client: TrackerClient) -> None:
+        with aioresponses() as m:
+            m.get(
+                "https://api.tracker.yandex.net/v3/queues?perPage=100&page=1",
+                payload=[self.queue("A")],
+                headers={"X-Total-Pages": "1"},
+            )
+
+            result = await tracker_client.queues_list_all()
+
+            assert len(m.requests) == 1
+
+        assert [queue.key for queue in result] == ["A"]
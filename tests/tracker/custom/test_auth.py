@@ -2,6 +2,7 @@ import pytest
 from pytest_mock import MockerFixture
 
 from mcp_tracker.tracker.custom.client import (
+    IAMTokenInfo,
     ServiceAccountSettings,
     ServiceAccountStore,
     TrackerClient,
@@ -248,3 +249,60 @@ class TestOrganizationHandling:
             ValueError, match="Either org_id or cloud_org_id must be provided"
         ):
             await client._build_headers()
+
+
+class TestHeadersMemoization:
+    async def test_headers_are_memoized_per_identity(self):
+        client = TrackerClient(token="static-token", org_id="test-org")
+
+        first = await client._build_headers()
+        second = await client._build_headers()
+        other = await client._build_headers(YandexAuth(token="auth-token"))
+
+        assert first is second
+        assert other["Authorization"] == "OAuth auth-token"
+        assert first["Authorization"] == "OAuth static-token"
+
+    async def test_service_account_token_is_not_refetched(self, mocker: MockerFixture):
+        mocker.patch("mcp_tracker.tracker.custom.client.yandexcloud.SDK")
+        service_account = ServiceAccountSettings(
+            key_id="key-id", service_account_id="sa-id", private_key="private-key"
+        )
+        client = TrackerClient(
+            token=None, service_account=service_account, org_id="test-org"
+        )
+        store = client._service_account_store
+        assert store is not None
+        mocker.patch.object(
+            store, "_fetch_iam_token", return_value=IAMTokenInfo(token="iam-token-1")
+        )
+        await store.get_iam_token()
+        get_iam_token = mocker.spy(store, "get_iam_token")
+
+        await client._build_headers()
+        await client._build_headers()
+        headers = await client._build_headers()
+
+        assert headers["Authorization"] == "Bearer iam-token-1"
+        get_iam_token.assert_called_once()
+
+    async def test_rotated_iam_token_invalidates_headers(self, mocker: MockerFixture):
+        mocker.patch("mcp_tracker.tracker.custom.client.yandexcloud.SDK")
+        service_account = ServiceAccountSettings(
+            key_id="key-id", service_account_id="sa-id", private_key="private-key"
+        )
+        client = TrackerClient(
+            token=None, service_account=service_account, org_id="test-org"
+        )
+        store = client._service_account_store
+        assert store is not None
+        mocker.patch.object(
+            store,
+            "_fetch_iam_token",
+            side_effect=[IAMTokenInfo(token="old"), IAMTokenInfo(token="new")],
+        )
+
+        assert (await client._build_headers())["Authorization"] == "Bearer old"
+        await store.get_iam_token(force_refresh=True)
+
+        assert (await client._build_headers())["Authorization"] == "Bearer new"
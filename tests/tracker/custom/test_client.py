@@ -1,11 +1,20 @@
-from aiohttp import ClientSession
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from aiohttp import ClientSession, TCPConnector
+from aioresponses import aioresponses
 from pytest_mock import MockerFixture
+from yarl import URL
 
 from mcp_tracker.tracker.custom.client import (
     ServiceAccountSettings,
     ServiceAccountStore,
     TrackerClient,
 )
+from mcp_tracker.tracker.custom.pool import (
+    ConnectionPoolSettings,
+    ConnectionPoolStats,
+)
 
 
 class TestTrackerClientInit:
@@ -108,3 +117,95 @@ class TestTrackerClientInit:
         await client.close()
         mock_close.assert_called_once()
         mock_session_close.assert_called_once()
+
+
+class TestTrackerClientConnectionPool:
+    async def test_default_pool_settings(self):
+        client = TrackerClient(token="test-token", org_id="test-org")
+
+        connector = client._session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 100
+        assert connector.limit_per_host == 0
+        await client.close()
+
+    async def test_custom_pool_settings(self):
+        client = TrackerClient(
+            token="test-token",
+            org_id="test-org",
+            pool=ConnectionPoolSettings(
+                limit=20, limit_per_host=10, keepalive_timeout=30.0
+            ),
+        )
+
+        connector = client._session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 20
+        assert connector.limit_per_host == 10
+        await client.close()
+
+    async def test_pool_stats_track_in_flight_requests(self):
+        stats = ConnectionPoolStats()
+        session, ctx, params = Mock(), SimpleNamespace(), Mock()
+
+        await stats._on_request_start(session, ctx, params)
+        await stats._on_request_start(session, ctx, params)
+        await stats._on_connection_create(session, ctx, params)
+        await stats._on_connection_reuse(session, ctx, params)
+        await stats._on_request_done(session, ctx, params)
+        await stats._on_request_done(session, ctx, params)
+
+        snapshot = stats.snapshot()
+        assert snapshot.requests_total == 2
+        assert snapshot.requests_in_flight == 0
+        assert snapshot.requests_in_flight_peak == 2
+        assert snapshot.connections_created == 1
+        assert snapshot.connections_reused == 1
+
+    async def test_pool_stats_track_queue_wait(self):
+        stats = ConnectionPoolStats()
+        session, ctx, params = Mock(), SimpleNamespace(), Mock()
+
+        await stats._on_queued_start(session, ctx, params)
+        await stats._on_queued_end(session, ctx, params)
+
+        assert stats.queued_total == 1
+        assert stats.queued_seconds_total >= 0
+
+    async def test_pool_stats_snapshot_is_detached(self):
+        client = TrackerClient(token="test-token", org_id="test-org")
+
+        snapshot = client.pool_stats
+        snapshot.requests_total = 42
+
+        assert client.pool_stats.requests_total == 0
+        await client.close()
+
+    async def test_prepare_warms_up_connections(self):
+        client = TrackerClient(
+            token="test-token",
+            org_id="test-org",
+            pool=ConnectionPoolSettings(warmup_connections=3),
+        )
+
+        with aioresponses() as m:
+            m.head("https://api.tracker.yandex.net/", status=401, repeat=True)
+
+            await client.prepare()
+
+            assert (
+                len(m.requests[("HEAD", URL("https://api.tracker.yandex.net/"))]) == 3
+            )
+        await client.close()
+
+    async def test_warmup_failures_do_not_fail_prepare(self):
+        client = TrackerClient(
+            token="test-token",
+            org_id="test-org",
+            pool=ConnectionPoolSettings(warmup_connections=2),
+        )
+
+        with aioresponses():
+            # No mocked routes: every probe fails with a connection error.
+            await client.prepare()
+        await client.close()
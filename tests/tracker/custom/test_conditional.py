@@ -0,0 +1,201 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from mcp_tracker.tracker.custom.client import TrackerClient
+from mcp_tracker.tracker.custom.conditional import ConditionalCache
+from mcp_tracker.tracker.custom.errors import IssueNotFound
+
+ISSUE_URL = "https://api.tracker.yandex.net/v3/issues/TEST-1"
+STATUSES_URL = "https://api.tracker.yandex.net/v3/statuses"
+
+ISSUE: dict[str, Any] = {
+    "self": ISSUE_URL,
+    "id": "1",
+    "key": "TEST-1",
+    "summary": "Test issue",
+    "version": 1,
+}
+
+
+@pytest.fixture
+async def client() -> AsyncGenerator[TrackerClient, None]:
+    client = TrackerClient(
+        token="test-token", org_id="test-org", conditional_cache=ConditionalCache()
+    )
+    yield client
+    await client.close()
+
+
+def sent_headers(m: aioresponses, url: str, index: int) -> dict[str, str]:
+    return m.requests[("GET", URL(url))][index].kwargs["headers"]
+
+
+class TestConditionalCache:
+    def test_lookup_of_unknown_key(self) -> None:
+        assert ConditionalCache().lookup("key") is None
+
+    def test_response_without_validators_is_not_stored(self) -> None:
+        cache = ConditionalCache()
+
+        cache.store("key", {}, [1])
+
+        assert cache.lookup("key") is None
+        assert cache.stats.misses == 1
+
+    def test_stored_value_is_copied(self) -> None:
+        cache = ConditionalCache()
+        value = [1]
+
+        cache.store("key", {"ETag": '"v1"'}, value)
+        value.append(2)
+        entry = cache.lookup("key")
+        assert entry is not None
+        first = cache.not_modified("key", entry)
+        first.append(3)
+
+        assert cache.not_modified("key", entry) == [1]
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        cache = ConditionalCache(max_entries=2)
+
+        cache.store("a", {"ETag": '"a"'}, 1)
+        cache.store("b", {"ETag": '"b"'}, 2)
+        entry = cache.lookup("a")
+        assert entry is not None
+        cache.not_modified("a", entry)
+        cache.store("c", {"ETag": '"c"'}, 3)
+
+        kept = cache.lookup("a")
+        assert kept is not None and kept.validators == {"If-None-Match": '"a"'}
+        assert cache.lookup("b") is None
+
+    def test_not_modified_survives_eviction_meanwhile(self) -> None:
+        cache = ConditionalCache(max_entries=2)
+        cache.store("a", {"ETag": '"a"'}, 1)
+        entry = cache.lookup("a")
+        assert entry is not None
+
+        # Concurrent requests store more entries while "a" is revalidated.
+        cache.store("b", {"ETag": '"b"'}, 2)
+        cache.store("c", {"ETag": '"c"'}, 3)
+
+        assert cache.not_modified("a", entry) == 1
+        assert cache.lookup("a") is None
+        assert cache.stats.hits == 1
+
+    def test_not_modified_survives_removal_meanwhile(self) -> None:
+        cache = ConditionalCache()
+        cache.store("a", {"ETag": '"a"'}, 1)
+        entry = cache.lookup("a")
+        assert entry is not None
+
+        cache.store("a", {}, 2)
+
+        assert cache.not_modified("a", entry) == 1
+
+
+class TestTrackerClientConditionalRequests:
+    async def test_not_modified_reuses_stored_issue(
+        self, client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            m.get(ISSUE_URL, payload=ISSUE, headers={"ETag": '"v1"'})
+            m.get(ISSUE_URL, status=304)
+
+            first = await client.issue_get("TEST-1")
+            second = await client.issue_get("TEST-1")
+
+            assert "If-None-Match" not in sent_headers(m, ISSUE_URL, 0)
+            assert sent_headers(m, ISSUE_URL, 1)["If-None-Match"] == '"v1"'
+
+        assert second == first
+        assert second is not first
+        stats = client.conditional_cache_stats
+        assert (stats.hits, stats.revalidations, stats.misses) == (1, 0, 1)
+
+    async def test_changed_resource_replaces_stored_one(
+        self, client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, payload=[], headers={"ETag": '"v1"'})
+            m.get(
+                STATUSES_URL,
+                payload=[
+                    {"id": "1", "version": 1, "key": "open", "name": "Open", "order": 1}
+                ],
+                headers={"ETag": '"v2"'},
+            )
+            m.get(STATUSES_URL, status=304)
+
+            assert await client.get_statuses() == []
+            changed = await client.get_statuses()
+            assert await client.get_statuses() == changed
+
+            assert sent_headers(m, STATUSES_URL, 2)["If-None-Match"] == '"v2"'
+
+        assert len(changed) == 1
+        assert client.conditional_cache_stats.revalidations == 1
+
+    async def test_last_modified_is_sent_back(self, client: TrackerClient) -> None:
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        with aioresponses() as m:
+            m.get(ISSUE_URL, payload=ISSUE, headers={"Last-Modified": last_modified})
+            m.get(ISSUE_URL, status=304)
+
+            await client.issue_get("TEST-1")
+            await client.issue_get("TEST-1")
+
+            assert sent_headers(m, ISSUE_URL, 1)["If-Modified-Since"] == last_modified
+
+    async def test_both_validators_are_sent_back(self, client: TrackerClient) -> None:
+        last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        with aioresponses() as m:
+            m.get(
+                ISSUE_URL,
+                payload=ISSUE,
+                headers={"ETag": '"v1"', "Last-Modified": last_modified},
+            )
+            m.get(ISSUE_URL, status=304)
+
+            await client.issue_get("TEST-1")
+            await client.issue_get("TEST-1")
+
+            headers = sent_headers(m, ISSUE_URL, 1)
+            assert headers["If-None-Match"] == '"v1"'
+            assert headers["If-Modified-Since"] == last_modified
+
+    async def test_response_without_validators_is_requested_again_in_full(
+        self, client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            m.get(ISSUE_URL, payload=ISSUE, headers={"ETag": '"v1"'})
+            m.get(ISSUE_URL, payload=ISSUE)
+            m.get(ISSUE_URL, payload=ISSUE)
+
+            for _ in range(3):
+                await client.issue_get("TEST-1")
+
+            assert sent_headers(m, ISSUE_URL, 1)["If-None-Match"] == '"v1"'
+            headers = sent_headers(m, ISSUE_URL, 2)
+            assert "If-None-Match" not in headers
+            assert "If-Modified-Since" not in headers
+
+    async def test_not_found_is_still_raised(self, client: TrackerClient) -> None:
+        with aioresponses() as m:
+            m.get(ISSUE_URL, status=404)
+
+            with pytest.raises(IssueNotFound):
+                await client.issue_get("TEST-1")
+
+    async def test_disabled_by_default(self, tracker_client: TrackerClient) -> None:
+        with aioresponses() as m:
+            m.get(ISSUE_URL, payload=ISSUE, headers={"ETag": '"v1"'}, repeat=True)
+
+            await tracker_client.issue_get("TEST-1")
+            await tracker_client.issue_get("TEST-1")
+
+            assert "If-None-Match" not in sent_headers(m, ISSUE_URL, 1)
@@ -0,0 +1,242 @@
+from typing import Any
+
+import pytest
+from aiohttp import ClientResponseError
+from aioresponses import aioresponses
+from pytest_mock import MockerFixture
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from mcp_tracker.tracker.custom.client import (
+    IAMTokenInfo,
+    ServiceAccountSettings,
+    TrackerClient,
+)
+from mcp_tracker.tracker.custom.ratelimit import (
+    AdaptiveRateLimiter,
+    RateLimitSettings,
+    RedisRateLimiter,
+    rate_limit_key,
+)
+
+STATUSES_URL = "https://api.tracker.yandex.net/v3/statuses"
+
+
+@pytest.fixture
+def clock(mocker: MockerFixture) -> Any:
+    return mocker.patch(
+        "mcp_tracker.tracker.custom.ratelimit.time.monotonic", return_value=1000.0
+    )
+
+
+@pytest.fixture
+def sleep_mock(mocker: MockerFixture) -> Any:
+    return mocker.patch(
+        "mcp_tracker.tracker.custom.ratelimit.asyncio.sleep", autospec=True
+    )
+
+
+class TestRateLimitKey:
+    def test_key_depends_on_token_and_org(self) -> None:
+        base = {"Authorization": "OAuth token-a", "X-Org-ID": "org-1"}
+
+        assert rate_limit_key(base) == rate_limit_key(dict(base))
+        assert rate_limit_key(base) != rate_limit_key(
+            {**base, "Authorization": "OAuth token-b"}
+        )
+        assert rate_limit_key(base) != rate_limit_key({**base, "X-Org-ID": "org-2"})
+
+    def test_principal_replaces_token(self) -> None:
+        old = {"Authorization": "Bearer iam-1", "X-Org-ID": "org-1"}
+        new = {**old, "Authorization": "Bearer iam-2"}
+
+        assert rate_limit_key(old, "service-account:sa") == rate_limit_key(
+            new, "service-account:sa"
+        )
+        assert rate_limit_key(old, "service-account:sa") != rate_limit_key(
+            {**old, "X-Org-ID": "org-2"}, "service-account:sa"
+        )
+
+    def test_key_does_not_contain_token(self) -> None:
+        key = rate_limit_key({"Authorization": "OAuth secret-token"})
+
+        assert "secret-token" not in key
+
+
+class TestAdaptiveRateLimiter:
+    async def test_burst_is_not_queued(self, clock: Any, sleep_mock: Any) -> None:
+        limiter = AdaptiveRateLimiter(RateLimitSettings(burst=3, initial_rate=1))
+
+        for _ in range(3):
+            await limiter.acquire("key")
+
+        sleep_mock.assert_not_called()
+        assert limiter.stats.acquired == 3
+
+    async def test_excess_calls_are_queued(self, clock: Any, sleep_mock: Any) -> None:
+        limiter = AdaptiveRateLimiter(RateLimitSettings(burst=1, initial_rate=2))
+
+        await limiter.acquire("key")
+        await limiter.acquire("key")
+        await limiter.acquire("key")
+
+        assert [c.args[0] for c in sleep_mock.call_args_list] == [0.5, 1.0]
+        assert limiter.stats.queued == 2
+
+    async def test_identities_have_separate_buckets(
+        self, clock: Any, sleep_mock: Any
+    ) -> None:
+        limiter = AdaptiveRateLimiter(RateLimitSettings(burst=1))
+
+        await limiter.acquire("key-a")
+        await limiter.acquire("key-b")
+
+        sleep_mock.assert_not_called()
+
+    async def test_throttling_halves_rate(self, clock: Any, sleep_mock: Any) -> None:
+        limiter = AdaptiveRateLimiter(
+            RateLimitSettings(burst=1, initial_rate=4, decrease_factor=0.5)
+        )
+
+        await limiter.acquire("key")
+        await limiter.throttled("key")
+        await limiter.acquire("key")
+
+        sleep_mock.assert_called_once_with(0.5)
+        assert limiter.stats.throttled == 1
+
+    async def test_rate_never_drops_below_minimum(self, clock: Any) -> None:
+        limiter = AdaptiveRateLimiter(RateLimitSettings(initial_rate=1, min_rate=0.5))
+
+        for _ in range(5):
+            await limiter.throttled("key")
+
+        assert limiter._buckets["key"].rate == 0.5
+
+    async def test_rate_recovers_over_time(self, clock: Any) -> None:
+        limiter = AdaptiveRateLimiter(
+            RateLimitSettings(initial_rate=4, max_rate=5, increase_step=0.5)
+        )
+        await limiter.throttled("key")
+
+        clock.return_value += 2
+        await limiter.acquire("key")
+
+        assert limiter._buckets["key"].rate == 3.0
+
+        clock.return_value += 100
+        await limiter.acquire("key")
+
+        assert limiter._buckets["key"].rate == 5.0
+
+    async def test_number_of_tracked_identities_is_bounded(self, clock: Any) -> None:
+        limiter = AdaptiveRateLimiter(RateLimitSettings(max_identities=2))
+
+        for key in ("a", "b", "c"):
+            await limiter.acquire(key)
+
+        assert list(limiter._buckets) == ["b", "c"]
+
+
+class TestRedisRateLimiter:
+    @pytest.fixture
+    def redis(self, mocker: MockerFixture) -> Any:
+        return mocker.AsyncMock()
+
+    async def test_reserve_uses_shared_bucket(
+        self, redis: Any, sleep_mock: Any
+    ) -> None:
+        redis.eval.return_value = b"0.25"
+        limiter = RedisRateLimiter(redis)
+
+        await limiter.acquire("key")
+
+        sleep_mock.assert_called_once_with(0.25)
+        assert redis.eval.call_args.args[2] == "tracker:ratelimit:key"
+
+    async def test_throttled_updates_shared_rate(self, redis: Any) -> None:
+        redis.eval.return_value = b"5"
+        limiter = RedisRateLimiter(redis)
+
+        await limiter.throttled("key")
+
+        redis.eval.assert_called_once()
+        assert limiter.stats.throttled == 1
+
+    async def test_falls_back_to_local_bucket_when_redis_fails(
+        self, redis: Any, clock: Any, sleep_mock: Any
+    ) -> None:
+        redis.eval.side_effect = RedisConnectionError("down")
+        limiter = RedisRateLimiter(redis, RateLimitSettings(burst=1, initial_rate=1))
+
+        await limiter.acquire("key")
+        await limiter.throttled("key")
+
+        sleep_mock.assert_not_called()
+        assert limiter._buckets["key"].rate == 0.5
+
+    async def test_close_closes_redis(self, redis: Any) -> None:
+        limiter = RedisRateLimiter(redis)
+
+        await limiter.close()
+
+        redis.aclose.assert_called_once()
+
+
+class TestTrackerClientRateLimiting:
+    async def test_requests_acquire_limiter(self, mocker: MockerFixture) -> None:
+        limiter = AdaptiveRateLimiter()
+        acquire = mocker.spy(limiter, "acquire")
+        client = TrackerClient(token="token", org_id="org", rate_limiter=limiter)
+
+        with aioresponses() as m:
+            m.get(STATUSES_URL, payload=[])
+            await client.get_statuses()
+        await client.close()
+
+        acquire.assert_called_once_with(
+            rate_limit_key({"Authorization": "OAuth token", "X-Org-ID": "org"})
+        )
+
+    async def test_throttled_response_lowers_rate(self) -> None:
+        limiter = AdaptiveRateLimiter()
+        client = TrackerClient(token="token", org_id="org", rate_limiter=limiter)
+
+        with aioresponses() as m:
+            m.get(STATUSES_URL, status=429)
+            with pytest.raises(ClientResponseError):
+                await client.get_statuses()
+        await client.close()
+
+        assert limiter.stats.throttled == 1
+
+    async def test_service_account_keeps_bucket_across_rotation(
+        self, mocker: MockerFixture
+    ) -> None:
+        mocker.patch("mcp_tracker.tracker.custom.client.yandexcloud.SDK")
+        limiter = AdaptiveRateLimiter()
+        acquire = mocker.spy(limiter, "acquire")
+        client = TrackerClient(
+            token=None,
+            service_account=ServiceAccountSettings(
+                key_id="key-id", service_account_id="sa-id", private_key="key"
+            ),
+            org_id="org",
+            rate_limiter=limiter,
+        )
+        store = client._service_account_store
+        assert store is not None
+        mocker.patch.object(
+            store,
+            "_fetch_iam_token",
+            side_effect=[IAMTokenInfo(token="old"), IAMTokenInfo(token="new")],
+        )
+
+        with aioresponses() as m:
+            m.get(STATUSES_URL, payload=[], repeat=True)
+            await client.get_statuses()
+            await store.get_iam_token(force_refresh=True)
+            await client.get_statuses()
+        await client.close()
+
+        [first], [second] = (call.args for call in acquire.call_args_list)
+        assert first == second
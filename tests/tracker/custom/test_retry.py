@@ -0,0 +1,197 @@
+import datetime
+from collections.abc import AsyncGenerator
+from email.utils import format_datetime
+from typing import Any
+
+import pytest
+from aiohttp import ClientConnectionError, ClientResponseError
+from aioresponses import aioresponses
+from pytest_mock import MockerFixture
+from yarl import URL
+
+from mcp_tracker.tracker.custom.client import TrackerClient
+from mcp_tracker.tracker.custom.retry import RetryPolicy, parse_retry_after
+
+STATUSES_URL = "https://api.tracker.yandex.net/v3/statuses"
+
+
+@pytest.fixture
+def sleep_mock(mocker: MockerFixture) -> Any:
+    return mocker.patch(
+        "mcp_tracker.tracker.custom.client.asyncio.sleep", autospec=True
+    )
+
+
+@pytest.fixture
+async def retrying_client() -> AsyncGenerator[TrackerClient, None]:
+    client = TrackerClient(
+        token="test-token",
+        org_id="test-org",
+        retry=RetryPolicy(max_attempts=3, backoff_base=0.1, budget=10.0),
+    )
+    yield client
+    await client.close()
+
+
+class TestRetryPolicy:
+    def test_backoff_is_bounded_by_exponential_ceiling(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+
+        for _ in range(50):
+            assert 0 <= policy.backoff(1) <= 1.0
+            assert 0 <= policy.backoff(2) <= 2.0
+            assert 0 <= policy.backoff(10) <= 5.0
+
+    def test_next_delay_stops_after_max_attempts(self) -> None:
+        policy = RetryPolicy(max_attempts=2)
+
+        assert policy.next_delay(1, 10.0, 0.5) == 0.5
+        assert policy.next_delay(2, 10.0, 0.5) is None
+
+    def test_next_delay_respects_budget(self) -> None:
+        policy = RetryPolicy(max_attempts=5)
+
+        assert policy.next_delay(1, 1.0, 5.0) is None
+
+
+class TestParseRetryAfter:
+    def test_seconds(self) -> None:
+        assert parse_retry_after("3") == 3.0
+
+    def test_http_date(self) -> None:
+        retry_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(
+            seconds=30
+        )
+
+        delay = parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert delay is not None
+        assert 25 <= delay <= 30
+
+    def test_invalid_or_missing(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+
+class TestTrackerClientRetries:
+    async def test_get_retried_on_server_error(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, status=502)
+            m.get(STATUSES_URL, payload=[])
+
+            result = await retrying_client.get_statuses()
+
+        assert result == []
+        sleep_mock.assert_called_once()
+        stats = retrying_client.retry_stats
+        assert stats.retries == 1
+        assert stats.reasons["502"] == 1
+
+    async def test_retry_after_header_is_honoured(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, status=429, headers={"Retry-After": "2"})
+            m.get(STATUSES_URL, payload=[])
+
+            await retrying_client.get_statuses()
+
+        sleep_mock.assert_called_once_with(2.0)
+
+    async def test_retry_after_beyond_budget_gives_up(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, status=429, headers={"Retry-After": "60"})
+
+            with pytest.raises(ClientResponseError) as exc_info:
+                await retrying_client.get_statuses()
+
+        assert exc_info.value.status == 429
+        sleep_mock.assert_not_called()
+        assert retrying_client.retry_stats.gave_up == 1
+
+    async def test_gives_up_after_max_attempts(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, status=503, repeat=True)
+
+            with pytest.raises(ClientResponseError):
+                await retrying_client.get_statuses()
+
+            assert len(m.requests[("GET", URL(STATUSES_URL))]) == 3
+        assert sleep_mock.call_count == 2
+
+    async def test_connection_error_retried(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, exception=ClientConnectionError("reset"))
+            m.get(STATUSES_URL, payload=[])
+
+            assert await retrying_client.get_statuses() == []
+
+        assert retrying_client.retry_stats.reasons["ClientConnectionError"] == 1
+
+    async def test_client_error_not_retried(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, status=403)
+
+            with pytest.raises(ClientResponseError):
+                await retrying_client.get_statuses()
+
+        sleep_mock.assert_not_called()
+
+    async def test_search_post_is_retried(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        url = "https://api.tracker.yandex.net/v3/issues/_search?page=1&perPage=15"
+        with aioresponses() as m:
+            m.post(url, status=500)
+            m.post(url, payload=[])
+
+            assert await retrying_client.issues_find("Queue: TEST") == []
+
+        sleep_mock.assert_called_once()
+
+    async def test_issue_create_is_not_retried(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.post("https://api.tracker.yandex.net/v3/issues", status=503)
+
+            with pytest.raises(ClientResponseError):
+                await retrying_client.issue_create("TEST", "Summary")
+
+        sleep_mock.assert_not_called()
+        assert retrying_client.retry_stats.retries == 0
+
+    async def test_issue_create_connection_error_not_retried(
+        self, retrying_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.post(
+                "https://api.tracker.yandex.net/v3/issues",
+                exception=ClientConnectionError("reset"),
+            )
+
+            with pytest.raises(ClientConnectionError):
+                await retrying_client.issue_create("TEST", "Summary")
+
+        sleep_mock.assert_not_called()
+
+    async def test_retries_disabled_by_default(
+        self, tracker_client: TrackerClient, sleep_mock: Any
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, status=502)
+
+            with pytest.raises(ClientResponseError):
+                await tracker_client.get_statuses()
+
+        sleep_mock.assert_not_called()
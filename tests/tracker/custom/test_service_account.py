@@ -208,6 +208,7 @@ class TestServiceAccountStore:
 
         assert token == "new-token"
         assert store._iam_token.token == "new-token"
+        assert store.generation == 1
         mock_fetch.assert_called_once_with(mock_settings)
 
     def test_fetch_iam_token(
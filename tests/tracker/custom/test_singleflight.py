@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any
+
+import pytest
+from aioresponses import aioresponses
+from yarl import URL
+
+from mcp_tracker.tracker.custom.client import TrackerClient
+from mcp_tracker.tracker.custom.singleflight import SingleFlight
+from mcp_tracker.tracker.proto.common import YandexAuth
+
+STATUSES_URL = "https://api.tracker.yandex.net/v3/statuses"
+
+STATUS = {
+    "self": "https://api.tracker.yandex.net/v3/statuses/1",
+    "id": "1",
+    "version": 1,
+    "key": "open",
+    "name": "Open",
+    "order": 1,
+}
+
+
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_call(self) -> None:
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fn() -> list[int]:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [1]
+
+        first = asyncio.create_task(single_flight.do("key", fn))
+        second = asyncio.create_task(single_flight.do("key", fn))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second)
+
+        assert calls == 1
+        assert results == [[1], [1]]
+        assert results[0] is not results[1]
+        assert single_flight.stats.leaders == 1
+        assert single_flight.stats.coalesced == 1
+
+    async def test_finished_call_is_not_reused(self) -> None:
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def fn() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await single_flight.do("key", fn) == 1
+        assert await single_flight.do("key", fn) == 2
+
+    async def test_error_is_propagated_to_all_callers(self) -> None:
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fn() -> None:
+            await release.wait()
+            raise ValueError("boom")
+
+        first = asyncio.create_task(single_flight.do("key", fn))
+        second = asyncio.create_task(single_flight.do("key", fn))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second, return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    async def test_cancelled_caller_does_not_cancel_others(self) -> None:
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fn() -> str:
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(single_flight.do("key", fn))
+        second = asyncio.create_task(single_flight.do("key", fn))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+
+class TestTrackerClientCoalescing:
+    async def test_concurrent_reads_send_one_request(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, payload=[STATUS])
+
+            first, second = await asyncio.gather(
+                tracker_client.get_statuses(), tracker_client.get_statuses()
+            )
+
+            assert len(m.requests[("GET", URL(STATUSES_URL))]) == 1
+
+        assert first == second
+        assert first[0] is not second[0]
+        assert tracker_client.coalescing_stats.coalesced == 1
+
+    async def test_different_auth_is_not_coalesced(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            m.get(STATUSES_URL, payload=[STATUS], repeat=True)
+
+            await asyncio.gather(
+                tracker_client.get_statuses(auth=YandexAuth(token="token-a")),
+                tracker_client.get_statuses(auth=YandexAuth(token="token-b")),
+            )
+
+            assert len(m.requests[("GET", URL(STATUSES_URL))]) == 2
+
+    async def test_different_arguments_are_not_coalesced(
+        self, tracker_client: TrackerClient
+    ) -> None:
+        url = "https://api.tracker.yandex.net/v3/queues/{}"
+        payload: dict[str, Any] = {"id": 1, "key": "TEST", "name": "Test"}
+        with aioresponses() as m:
+            m.get(url.format("TEST"), payload=payload)
+            m.get(url.format("OTHER"), payload={**payload, "key": "OTHER"})
+
+            test, other = await asyncio.gather(
+                tracker_client.queue_get("TEST"), tracker_client.queue_get("OTHER")
+            )
+
+        assert test.key == "TEST"
+        assert other.key == "OTHER"
+
+    async def test_coalescing_can_be_disabled(self) -> None:
+        client = TrackerClient(token="token", org_id="org", coalesce_reads=False)
+
+        with aioresponses() as m:
+            m.get(STATUSES_URL, payload=[STATUS], repeat=True)
+
+            await asyncio.gather(client.get_statuses(), client.get_statuses())
+
+            assert len(m.requests[("GET", URL(STATUSES_URL))]) == 2
+        await client.close()
@@ -0,0 +1,67 @@
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from mcp_tracker.tracker.custom.streaming import JsonArraySplitter, iter_json_array
+
+DOCUMENTS: list[list[Any]] = [
+    [],
+    [1, -1.5e3, None, True, "text"],
+    [{"a": [1, {"b": "}],"}]}, ["[", "]"], {"quote": 'say "hi", \\'}],
+    [{"description": "line\n" * 100, "key": f"TEST-{i}"} for i in range(10)],
+    [{"k": 'a\\"\\a\\', "l": ['\\"[}']}, '"a{a', "\\\\"],
+]
+
+
+def split(data: bytes, chunk_size: int) -> list[bytes]:
+    splitter = JsonArraySplitter()
+    elements: list[bytes] = []
+    for i in range(0, len(data), chunk_size):
+        elements.extend(splitter.feed(data[i : i + chunk_size]))
+    splitter.close()
+    return elements
+
+
+class TestJsonArraySplitter:
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 16, 1 << 20])
+    def test_elements_match_document(
+        self, document: list[Any], chunk_size: int
+    ) -> None:
+        data = json.dumps(document, indent=1).encode()
+
+        elements = split(data, chunk_size)
+
+        assert [json.loads(e) for e in elements] == document
+
+    def test_elements_are_returned_as_soon_as_complete(self) -> None:
+        splitter = JsonArraySplitter()
+
+        assert splitter.feed(b'[{"a": 1}, {"b"') == [b'{"a": 1}']
+        assert splitter.feed(b": 2}]") == [b'{"b": 2}']
+
+    def test_buffer_holds_at_most_one_element(self) -> None:
+        splitter = JsonArraySplitter()
+        splitter.feed(b"[")
+
+        for i in range(100):
+            splitter.feed(json.dumps({"key": i}).encode() + b",")
+
+        assert len(splitter._buffer) < 20
+
+    @pytest.mark.parametrize(
+        "data", [b'{"a": 1}', b"[1,]", b"[,1]", b"[1", b"[1] [2]", b"x[1]"]
+    )
+    def test_invalid_input(self, data: bytes) -> None:
+        with pytest.raises(ValueError):
+            split(data, 1)
+
+
+async def test_iter_json_array() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        yield b"[1, "
+        yield b"2]"
+
+    assert [e async for e in iter_json_array(chunks())] == [b"1", b"2"]
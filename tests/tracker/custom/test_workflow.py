@@ -0,0 +1,222 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from aiohttp import ClientResponseError
+from aioresponses import aioresponses
+from yarl import URL
+
+from mcp_tracker.tracker.custom.client import TrackerClient
+from mcp_tracker.tracker.custom.workflow import WorkflowCache, WorkflowCacheStats
+from mcp_tracker.tracker.proto.types.statuses import Status
+from tests.conftest import Clock
+
+BASE_URL = "https://api.tracker.yandex.net"
+STATUSES_URL = f"{BASE_URL}/v3/statuses"
+
+
+def transitions_url(issue_id: str) -> str:
+    return f"{BASE_URL}/v2/issues/{issue_id}/transitions"
+
+
+def issue_url(issue_id: str) -> str:
+    return f"{BASE_URL}/v3/issues/{issue_id}?fields=type,status"
+
+
+def mock_issue(
+    m: aioresponses, issue_id: str, type_key: str = "task", status_key: str = "open"
+) -> None:
+    m.get(
+        issue_url(issue_id),
+        payload={
+            "key": issue_id,
+            "type": {"key": type_key},
+            "status": {"key": status_key},
+        },
+    )
+
+
+def execute_url(issue_id: str, transition_id: str) -> str:
+    return f"{BASE_URL}/v3/issues/{issue_id}/transitions/{transition_id}/_execute"
+
+
+def transition(transition_id: str, status_key: str) -> dict[str, Any]:
+    return {
+        "self": f"{BASE_URL}/v2/issues/TEST-1/transitions/{transition_id}",
+        "id": transition_id,
+        "to": {"self": f"{BASE_URL}/v3/statuses/1", "id": "1", "key": status_key},
+    }
+
+
+STATUSES: list[dict[str, Any]] = [
+    {
+        "self": f"{STATUSES_URL}/{idx}",
+        "id": str(idx),
+        "version": 1,
+        "key": key,
+        "name": key,
+        "order": idx,
+        "type": type_,
+    }
+    for idx, (key, type_) in enumerate(
+        [("open", "new"), ("closed", "done"), ("resolved", "done")], start=1
+    )
+]
+
+
+@pytest.fixture
+async def client(clock: Clock) -> AsyncGenerator[TrackerClient, None]:
+    client = TrackerClient(
+        token="test-token",
+        org_id="test-org",
+        workflow_cache=WorkflowCache(ttl=60, clock=clock),
+    )
+    yield client
+    await client.close()
+
+
+def request_count(m: aioresponses, method: str, url: str) -> int:
+    return len(m.requests.get((method, URL(url)), []))
+
+
+class TestWorkflowCache:
+    def test_status_types_expire(self, clock: Clock) -> None:
+        cache = WorkflowCache(ttl=60, clock=clock)
+        statuses = [Status.model_validate(status) for status in STATUSES]
+
+        cache.store_statuses("org", statuses)
+
+        assert cache.status_types("org") == {
+            "open": "new",
+            "closed": "done",
+            "resolved": "done",
+        }
+        assert cache.status_types("other") is None
+        clock.now = 60
+        assert cache.status_types("org") is None
+
+    def test_least_recently_used_queue_is_evicted(self) -> None:
+        cache = WorkflowCache(max_entries=2)
+
+        a, b, c = (("A", "task", "open"), ("B", "task", "open"), ("C", "bug", "open"))
+
+        cache.remember_done_transition("org", a, "close")
+        cache.remember_done_transition("org", b, "close")
+        cache.done_transition("org", a)
+        cache.remember_done_transition("org", c, "close")
+
+        assert cache.done_transition("org", a) == "close"
+        assert cache.done_transition("org", b) is None
+
+
+class TestIssueCloseFastPath:
+    async def test_second_close_in_same_state_skips_transitions(
+        self, client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            mock_issue(m, "TEST-1")
+            mock_issue(m, "TEST-2")
+            m.get(
+                transitions_url("TEST-1"),
+                payload=[transition("start", "open"), transition("close", "closed")],
+            )
+            m.get(STATUSES_URL, payload=STATUSES)
+            m.post(execute_url("TEST-1", "close"), payload=[])
+            m.post(execute_url("TEST-2", "close"), payload=[])
+
+            await client.issue_close("TEST-1", "fixed")
+            await client.issue_close("TEST-2", "fixed", comment="Done")
+
+            assert request_count(m, "GET", transitions_url("TEST-2")) == 0
+            assert request_count(m, "GET", STATUSES_URL) == 1
+            [execute] = m.requests[("POST", URL(execute_url("TEST-2", "close")))]
+            assert execute.kwargs["json"] == {"comment": "Done", "resolution": "fixed"}
+
+        assert client.workflow_cache_stats == WorkflowCacheStats(hits=1, misses=1)
+
+    @pytest.mark.parametrize("status", [404, 409, 422])
+    async def test_rejected_guess_falls_back_to_discovery(
+        self, client: TrackerClient, status: int
+    ) -> None:
+        with aioresponses() as m:
+            mock_issue(m, "TEST-1")
+            mock_issue(m, "TEST-2")
+            mock_issue(m, "TEST-3")
+            m.get(transitions_url("TEST-1"), payload=[transition("close", "closed")])
+            m.get(STATUSES_URL, payload=STATUSES)
+            m.post(execute_url("TEST-1", "close"), payload=[])
+            await client.issue_close("TEST-1", "fixed")
+
+            m.post(execute_url("TEST-2", "close"), status=status)
+            m.get(
+                transitions_url("TEST-2"), payload=[transition("resolve", "resolved")]
+            )
+            m.post(execute_url("TEST-2", "resolve"), payload=[])
+            m.post(execute_url("TEST-3", "resolve"), payload=[])
+
+            await client.issue_close("TEST-2", "fixed")
+            await client.issue_close("TEST-3", "fixed")
+
+            # Status types were cached by the first close
+            assert request_count(m, "GET", STATUSES_URL) == 1
+            assert request_count(m, "GET", transitions_url("TEST-3")) == 0
+
+        assert client.workflow_cache_stats == WorkflowCacheStats(
+            hits=1, rejected=1, misses=1
+        )
+
+    async def test_other_errors_are_raised(self, client: TrackerClient) -> None:
+        with aioresponses() as m:
+            mock_issue(m, "TEST-1")
+            mock_issue(m, "TEST-2")
+            m.get(transitions_url("TEST-1"), payload=[transition("close", "closed")])
+            m.get(STATUSES_URL, payload=STATUSES)
+            m.post(execute_url("TEST-1", "close"), payload=[])
+            await client.issue_close("TEST-1", "fixed")
+
+            m.post(execute_url("TEST-2", "close"), status=403)
+
+            with pytest.raises(ClientResponseError):
+                await client.issue_close("TEST-2", "fixed")
+
+            assert request_count(m, "GET", transitions_url("TEST-2")) == 0
+
+    async def test_queues_are_remembered_separately(
+        self, client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            mock_issue(m, "TEST-1")
+            mock_issue(m, "OTHER-1")
+            m.get(transitions_url("TEST-1"), payload=[transition("close", "closed")])
+            m.get(transitions_url("OTHER-1"), payload=[transition("close", "closed")])
+            m.get(STATUSES_URL, payload=STATUSES)
+            m.post(execute_url("TEST-1", "close"), payload=[])
+            m.post(execute_url("OTHER-1", "close"), payload=[])
+
+            await client.issue_close("TEST-1", "fixed")
+            await client.issue_close("OTHER-1", "fixed")
+
+            assert request_count(m, "GET", transitions_url("OTHER-1")) == 1
+            assert request_count(m, "GET", STATUSES_URL) == 1
+
+    async def test_issues_in_other_states_are_remembered_separately(
+        self, client: TrackerClient
+    ) -> None:
+        with aioresponses() as m:
+            mock_issue(m, "TEST-1")
+            mock_issue(m, "TEST-2", status_key="inProgress")
+            mock_issue(m, "TEST-3", type_key="bug")
+            for issue_id in ("TEST-1", "TEST-2", "TEST-3"):
+                m.get(
+                    transitions_url(issue_id), payload=[transition("close", "closed")]
+                )
+                m.post(execute_url(issue_id, "close"), payload=[])
+            m.get(STATUSES_URL, payload=STATUSES)
+
+            for issue_id in ("TEST-1", "TEST-2", "TEST-3"):
+                await client.issue_close(issue_id, "fixed")
+
+            for issue_id in ("TEST-2", "TEST-3"):
+                assert request_count(m, "GET", transitions_url(issue_id)) == 1
+
+        assert client.workflow_cache_stats == WorkflowCacheStats(misses=3)
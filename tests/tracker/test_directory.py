@@ -0,0 +1,126 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from mcp_tracker.tracker.directory import UserDirectory, UserIndex, UserMatch
+from mcp_tracker.tracker.proto.common import YandexAuth
+from mcp_tracker.tracker.proto.types.users import User
+from mcp_tracker.tracker.proto.users import UsersProtocol
+from tests.conftest import Clock
+
+USERS = [
+    User(uid=1, login="ivanov", firstName="Ivan", lastName="Ivanov", email="i@x.ru"),
+    User(uid=2, login="petrov", firstName="Petr", lastName="Petrov", email="p@x.ru"),
+    User(uid=3, login="sidorova", firstName="Anna", lastName="Sidorova"),
+    User(uid=4, login="smirnov", firstName="Сергей", lastName="Смирнов"),
+]
+
+
+@pytest.fixture
+def users() -> AsyncMock:
+    users = AsyncMock(spec=UsersProtocol)
+    users.users_list.side_effect = lambda per_page, page, auth: USERS[
+        (page - 1) * per_page : page * per_page
+    ]
+    return users
+
+
+@pytest.fixture
+def directory(users: AsyncMock, clock: Clock) -> UserDirectory:
+    return UserDirectory(users, ttl=60, max_orgs=2, page_size=2, clock=clock)
+
+
+class TestUserIndex:
+    def test_exact_lookup_by_login_and_email(self) -> None:
+        index = UserIndex.build(USERS, built_at=0)
+
+        assert index.exact("petrov") is USERS[1]
+        assert index.exact("i@x.ru") is USERS[0]
+        assert index.exact("anna") is None
+
+    def test_candidates_share_a_trigram(self) -> None:
+        index = UserIndex.build(USERS, built_at=0)
+
+        assert index.candidates("anna") == [2]
+        assert index.candidates("Анна") == [2]
+        assert index.candidates("zzz") == [0, 1, 2, 3]
+
+
+class TestUserDirectory:
+    async def test_search_builds_index_once(
+        self, directory: UserDirectory, users: AsyncMock
+    ) -> None:
+        assert await directory.search("PETROV ") == [USERS[1]]
+        assert await directory.search("Anna Sidorova") == [USERS[2]]
+
+        # Two full pages and one empty page, fetched for the first search only
+        assert users.users_list.call_count == 3
+
+    async def test_match_reports_scores_of_several_queries(
+        self, directory: UserDirectory
+    ) -> None:
+        result = await directory.match(["p@x.ru", "Sergey Smirnov", "nobody"])
+
+        assert result["p@x.ru"] == [UserMatch(USERS[1], 100.0)]
+        [smirnov] = result["Sergey Smirnov"]
+        assert smirnov.user is USERS[3]
+        assert 80 <= smirnov.score <= 100
+        assert result["nobody"] == []
+
+    async def test_search_returns_empty_list_when_no_match(
+        self, directory: UserDirectory
+    ) -> None:
+        assert await directory.search("nobody at all") == []
+
+    async def test_concurrent_searches_share_one_build(
+        self, directory: UserDirectory, users: AsyncMock
+    ) -> None:
+        await asyncio.gather(*(directory.search("ivanov") for _ in range(5)))
+
+        assert users.users_list.call_count == 3
+
+    async def test_organizations_have_separate_indexes(
+        self, directory: UserDirectory, users: AsyncMock
+    ) -> None:
+        await directory.search("ivanov", auth=YandexAuth(org_id="1"))
+        await directory.search("ivanov", auth=YandexAuth(org_id="2"))
+        await directory.search("ivanov", auth=YandexAuth(org_id="1", token="other"))
+
+        assert users.users_list.call_count == 6
+
+    async def test_least_recently_used_organization_is_evicted(
+        self, directory: UserDirectory, users: AsyncMock
+    ) -> None:
+        for org_id in ("1", "2", "3", "1"):
+            await directory.search("ivanov", auth=YandexAuth(org_id=org_id))
+
+        assert users.users_list.call_count == 12
+
+    async def test_stale_index_is_served_while_refreshed(
+        self, directory: UserDirectory, users: AsyncMock, clock: Clock
+    ) -> None:
+        await directory.search("ivanov")
+        users.users_list.side_effect = lambda per_page, page, auth: (
+            [USERS[1]] if page == 1 else []
+        )
+        clock.now = 61
+
+        assert await directory.search("ivanov") == [USERS[0]]
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert await directory.search("ivanov") == []
+        assert await directory.search("petrov") == [USERS[1]]
+
+    async def test_failed_build_is_raised_and_retried(
+        self, directory: UserDirectory, users: AsyncMock
+    ) -> None:
+        side_effect = users.users_list.side_effect
+        users.users_list.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await directory.search("ivanov")
+
+        users.users_list.side_effect = side_effect
+        assert await directory.search("ivanov") == [USERS[0]]
@@ -0,0 +1,42 @@
+from mcp_tracker.tracker.matching import NameMatch, NameMatcher, normalize_name
+
+
+class TestNormalizeName:
+    def test_transliterates_cyrillic(self) -> None:
+        assert normalize_name("Щукина Юлия") == "shchukina yuliya"
+
+    def test_strips_case_and_punctuation(self) -> None:
+        assert normalize_name("  O'Brien, Anne ") == "o brien  anne"
+
+
+class TestNameMatcher:
+    def test_matches_across_scripts(self) -> None:
+        matcher = NameMatcher(["Иван Иванов", "Petr Petrov"])
+
+        [matches] = matcher.match(["Ivanov"])
+
+        assert [match.index for match in matches] == [0]
+        assert matches[0].score >= 80
+
+    def test_several_queries_in_one_call(self) -> None:
+        matcher = NameMatcher(["Ivan Ivanov", "Petr Petrov", "Anna Sidorova"])
+
+        ivanov, sidorova, nobody = matcher.match(["ivan ivanov", "Сидорова", "qwerty"])
+
+        assert ivanov == [NameMatch(0, 100.0)]
+        assert [match.index for match in sidorova] == [2]
+        assert nobody == []
+
+    def test_candidates_restrict_scored_names(self) -> None:
+        matcher = NameMatcher(["Ivan Ivanov", "Ivan Ivanov"])
+
+        [matches] = matcher.match(["Ivan Ivanov"], candidates=[1])
+
+        assert matches == [NameMatch(1, 100.0)]
+
+    def test_limit_and_cutoff(self) -> None:
+        matcher = NameMatcher(["Anna Ivanova", "Anna Ivanov", "Anna Petrova"])
+
+        [matches] = matcher.match(["anna ivanova"], limit=1, score_cutoff=90)
+
+        assert matches == [NameMatch(0, 100.0)]